@@ -12,6 +12,8 @@
 
 set -e
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
 # Parse arguments
 ENVIRONMENT="${1:-staging}"
 FRESH_BUILD=false
@@ -79,6 +81,20 @@ echo ""
 
 # Step 1: Build container image
 echo "🔨 Step 1: Building container image..."
+
+# Real per-doc edit times for <lastmod>/Last-Modified (container mtimes are
+# the build time). Baked into the image via COPY docs/.
+python3 scripts/build-lastmod-index.py
+
+# Prebuilt search index, memory-mapped by every worker at startup instead of
+# indexing the docs per worker. Baked into the image via COPY docs/.
+python3 scripts/build-search-index.py
+
+# Every internal link in the rendered docs must resolve to a route (no
+# network; fails the build before anything ships). The full in-process
+# crawl (check-links.py --app) runs in CI, where the app is installed.
+python3 "$SCRIPT_DIR/../scripts/check-links.py" --check
+
 echo "   Building: ${IMAGE_NAME}:${VERSION}"
 
 BUILD_ARGS=(
@@ -234,7 +250,6 @@ fi
 # Step 8: Link validation
 echo ""
 echo "🔗 Step 8: Validating links..."
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 BASE_URL="${HEALTH_URL%/health}"
 
 if python3 "$SCRIPT_DIR/../scripts/check-links.py" "$BASE_URL"; then
@@ -16,6 +16,10 @@ import sys
 from pathlib import Path
 from typing import Optional, Tuple
 
+# Shared frontmatter parser from the app (src/ layout, so no install needed)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from sil_web.services.frontmatter import has_frontmatter  # noqa: E402
+
 # DOCUMENT_TIERS mapping (tier, order)
 # Copied from src/sil_web/services/content.py
 DOCUMENT_TIERS = {
@@ -90,11 +94,6 @@ def get_tier_and_order(slug: str) -> Tuple[int, int]:
     return DOCUMENT_TIERS.get(slug, (3, 999))
 
 
-def has_frontmatter(content: str) -> bool:
-    """Check if content already has frontmatter."""
-    return content.startswith('---')
-
-
 def add_frontmatter_to_file(
     file_path: Path,
     dry_run: bool = True
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark frontmatter parsing across the whole docs tree.
+
+Compares the loaders the app and scripts used before against the shared
+sil_web.services.frontmatter module:
+
+  - yaml.safe_load          pure-Python SafeLoader (old sync-docs.py path)
+  - python-frontmatter      frontmatter.parse() (old app path; skipped if not installed)
+  - parse_frontmatter       shared module, libyaml when available
+  - read_frontmatter        shared module, header block only (no body read)
+
+Usage:
+    python scripts/bench-frontmatter.py                 # ./docs, 20 rounds
+    python scripts/bench-frontmatter.py ../SIL/docs -n 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+from sil_web.services.frontmatter import HAS_LIBYAML, parse_frontmatter, read_frontmatter, split_frontmatter  # noqa: E402
+
+
+def pure_safe_load(path: Path) -> object:
+    header, _ = split_frontmatter(path.read_text(encoding="utf-8"))
+    return yaml.load(header, Loader=yaml.SafeLoader) if header is not None else {}
+
+
+def shared_parse(path: Path) -> object:
+    return parse_frontmatter(path.read_text(encoding="utf-8"))
+
+
+def time_loader(loader: Callable[[Path], object], paths: list[Path], rounds: int) -> float:
+    """Best-of-rounds wall time (seconds) to parse every path once."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for path in paths:
+            loader(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark frontmatter parsing over a docs tree")
+    parser.add_argument("docs", nargs="?", type=Path, default=PROJECT_ROOT / "docs", help="Docs directory (default: ./docs)")
+    parser.add_argument("-n", "--rounds", type=int, default=20, help="Rounds per loader; best is reported (default: 20)")
+    args = parser.parse_args()
+
+    paths = sorted(args.docs.rglob("*.md"))
+    if not paths:
+        print(f"Error: no markdown files under {args.docs}")
+        return 1
+
+    loaders: list[tuple[str, Callable[[Path], object]]] = [("yaml.safe_load", pure_safe_load)]
+    try:
+        import frontmatter
+
+        loaders.append(("python-frontmatter", lambda p: frontmatter.parse(p.read_text(encoding="utf-8"))))
+    except ImportError:
+        print("(python-frontmatter not installed, skipping)")
+    loaders += [("parse_frontmatter", shared_parse), ("read_frontmatter", read_frontmatter)]
+
+    print(f"{len(paths)} files under {args.docs}, best of {args.rounds} rounds, libyaml: {'yes' if HAS_LIBYAML else 'no'}")
+    print()
+
+    baseline = None
+    for name, loader in loaders:
+        elapsed = time_loader(loader, paths, args.rounds)
+        baseline = baseline or elapsed
+        print(f"  {name:<20} {elapsed * 1000:8.2f} ms  {elapsed / len(paths) * 1e6:8.1f} us/file  {baseline / elapsed:5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
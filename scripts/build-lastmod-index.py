@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Build the docs last-modified index from git history.
+
+File mtimes inside the container are the image build time, not when a doc
+was last edited, so <lastmod> and Last-Modified can't come from stat().
+This runs ONE batched `git log` over docs/ and writes a compact
+path -> last-commit-time (unix seconds) index that the app loads at startup
+(see src/sil_web/services/lastmod.py). No git calls ever happen per request,
+and git isn't needed inside the image at all.
+
+Run before building the image (deploy/deploy-container.sh does); the output
+lands in docs/ and is baked in by the Dockerfile's `COPY docs/ docs/`.
+
+Usage:
+    python scripts/build-lastmod-index.py                    # this repo's docs/
+    python scripts/build-lastmod-index.py --repo ../SIL      # authoring history in the SIL repo
+    python scripts/build-lastmod-index.py --output /tmp/idx.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DOCS_DIR = PROJECT_ROOT / "docs"
+DEFAULT_OUTPUT = DOCS_DIR / ".lastmod-index.json"
+
+# Record separator before each commit's timestamp; paths follow one per line
+COMMIT_MARKER = "\x1e"
+
+INDEX_VERSION = 1
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), "-c", "core.quotepath=off", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def collect_commit_times(repo: Path, prefix: str) -> dict[str, int]:
+    """Newest commit time per file under prefix, from a single `git log` pass.
+
+    Args:
+        repo: Git repository root
+        prefix: Docs directory relative to the repo root (e.g. "docs")
+
+    Returns:
+        {path relative to prefix: unix seconds}
+    """
+    log = git(repo, "log", f"--format={COMMIT_MARKER}%ct", "--name-only", "--no-renames", "--", prefix)
+
+    times: dict[str, int] = {}
+    commit_time = 0
+    strip = prefix.rstrip("/") + "/"
+    for line in log.split("\n"):  # not splitlines(): it treats \x1e as a line break
+        if line.startswith(COMMIT_MARKER):
+            commit_time = int(line[len(COMMIT_MARKER):])
+        elif line.startswith(strip):
+            # git log is newest-first: the first time a path appears is its last change
+            times.setdefault(line[len(strip):], commit_time)
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build docs/.lastmod-index.json from git history")
+    parser.add_argument("--repo", type=Path, default=PROJECT_ROOT, help="Git repository to read history from (default: this repo)")
+    parser.add_argument("--prefix", default="docs", help="Docs directory within --repo (default: docs)")
+    parser.add_argument("--docs", type=Path, default=DOCS_DIR, help="Website docs tree the index describes (default: ./docs)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help=f"Index file (default: {DEFAULT_OUTPUT.relative_to(PROJECT_ROOT)})")
+    args = parser.parse_args()
+
+    try:
+        times = collect_commit_times(args.repo, args.prefix)
+        head = git(args.repo, "rev-parse", "HEAD").strip()
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error: git log failed in {args.repo}: {e}")
+        return 1
+
+    # Only files the website actually serves (drops deleted/renamed history
+    # and anything in the source repo that was never synced)
+    files = {rel: ts for rel, ts in times.items() if rel.endswith(".md") and (args.docs / rel).is_file()}
+    untracked = sorted(rel for rel in (p.relative_to(args.docs).as_posix() for p in args.docs.rglob("*.md")) if rel not in files)
+
+    index = {
+        "version": INDEX_VERSION,
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "repo_head": head,
+        "files": dict(sorted(files.items())),
+    }
+    args.output.write_text(json.dumps(index, separators=(",", ":")) + "\n")
+
+    print(f"Indexed {len(files)} docs from {args.repo} @ {head[:12]} -> {args.output}")
+    if untracked:
+        print(f"No commit history for {len(untracked)} doc(s) (served without lastmod):")
+        for rel in untracked:
+            print(f"  - docs/{rel}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
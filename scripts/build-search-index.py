@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Build the search index snapshot for the deployed site.
+
+Indexing every doc (parse, extract text, tokenize, build postings) takes
+the better part of a second on this corpus and grows with it -- paid once
+per uvicorn worker at every start. This builds the index once, here, and
+writes it as a flat binary snapshot (sorted term table, postings and
+position arrays, section strings) that each worker memory-maps read-only at
+startup (see MappedSegment in src/sil_web/services/search.py): no index
+construction in the workers, and one copy in the OS page cache for all of
+them.
+
+The app checks the snapshot against the docs by per-page digest on its
+first change check and re-indexes only pages that differ, so a stale
+snapshot costs a partial re-index, never wrong results for long.
+
+Run before building the image (deploy/deploy-container.sh does); the output
+lands in docs/ and is baked in by the Dockerfile's `COPY docs/ docs/`.
+
+Usage:
+    python scripts/build-search-index.py
+    python scripts/build-search-index.py --output /tmp/search-index.bin
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT = PROJECT_ROOT / "docs" / ".search-index.bin"
+
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+from sil_web.routes.search import create_search_service  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build docs/.search-index.bin for mmap at startup")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help=f"Snapshot file (default: {DEFAULT_OUTPUT.relative_to(PROJECT_ROOT)})")
+    args = parser.parse_args()
+    output = args.output.resolve()
+
+    # The app resolves docs/ relative to its working directory
+    os.chdir(PROJECT_ROOT)
+
+    started = time.perf_counter()
+    service = create_search_service()
+    index = service.index
+    service.write_snapshot(output)
+    elapsed = time.perf_counter() - started
+
+    size_kb = output.stat().st_size / 1024
+    print(f"Indexed {len(index)} sections in {elapsed:.2f}s -> {output} ({size_kb:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,21 +2,75 @@
 """SIL Website Link Checker
 
 Crawls all internal pages, extracts every href, and verifies each link.
-Exits 1 if any broken links are found.
+Exits 1 if any broken links are found. Requests run concurrently (asyncio
++ httpx.AsyncClient): --concurrency bounds them overall and --per-host
+against any one external host.
+
+--app crawls the app in-process instead of a deployed site: requests go
+through httpx.ASGITransport straight into the ASGI app (no network, DNS,
+TLS or server), so CI and pre-deploy check the exact build being shipped,
+in seconds, whether or not staging is up. Links to the production domain
+are crawled in-process too; other external links are not checked.
+
+External results are cached on disk (--cache, default
+.link-check-cache.json): URL -> status, check time, ETag and Last-Modified.
+A cached result is reused until its TTL runs out (--ttl-ok for working
+links, --ttl-fail for failing ones), and a stale one is rechecked with a
+conditional request (If-None-Match / If-Modified-Since), so repeated runs
+are mostly cache hits and GitHub/PyPI stop rate-limiting us. --no-cache
+checks everything afresh, with plain (unconditional) requests.
+
+--check validates internal links without a site to crawl: the docs are
+rendered in-process exactly as the app renders them and every internal
+href is looked up in the app's route table (the link graph behind
+/links.json, src/sil_web/services/links.py). No network, and it runs in
+well under the time of a crawl -- deploy/deploy-container.sh runs it before
+building the image, so broken internal links fail the build instead of
+being found in production.
+
+Known gaps -- internal paths the docs link to before their pages are
+published -- are listed in scripts/link-allowlist.txt (--allowlist) and
+don't count as broken; a crawl flags entries whose page serves again.
 
 Usage:
     python scripts/check-links.py [base_url]
     python scripts/check-links.py https://semanticinfrastructurelab.org
-    python scripts/check-links.py https://sil-staging.mytia.net
+    python scripts/check-links.py https://sil-staging.mytia.net --concurrency 32
+    python scripts/check-links.py --app sil_web.app:app
+    python scripts/check-links.py --check
 """
 
+import argparse
+import asyncio
+import importlib
+import json
+import os
 import sys
+import time
 from collections import defaultdict
 from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Optional, Union
 from urllib.parse import urljoin, urlparse
 
 import httpx
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASE_URL = "https://semanticinfrastructurelab.org"
+
+DEFAULT_CACHE = PROJECT_ROOT / ".link-check-cache.json"
+
+DEFAULT_ALLOWLIST = PROJECT_ROOT / "scripts" / "link-allowlist.txt"
+
+# Seconds a cached external result stays fresh: working links rarely break
+# overnight, failing ones are retried soon (they may be transient)
+DEFAULT_TTL_OK = 7 * 24 * 3600
+DEFAULT_TTL_FAIL = 3600
+
+# Requests in flight at once, overall and against any one external host
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 4
+
 # Statuses treated as broken for internal links
 INTERNAL_BROKEN = {404, 410, 500, 502, 503, 504}
 
@@ -65,115 +119,304 @@ def should_skip(url: str) -> bool:
     return ext in SKIP_EXTENSIONS
 
 
-def check_links(base_url: str) -> int:
-    base_url = base_url.rstrip("/")
-    base_host = urlparse(base_url).netloc
-
-    # Phase 1: crawl all internal pages and collect every link
-    pages_to_crawl: set[str] = {normalize(base_url + "/")}
-    crawled: set[str] = set()
-    # link -> list of pages that reference it
-    found_on: dict[str, list[str]] = defaultdict(list)
-
-    client = httpx.Client(
-        follow_redirects=True,
-        timeout=15.0,
-        headers={"User-Agent": "SIL-LinkChecker/1.0 (semanticinfrastructurelab.org)"},
-    )
-
-    print(f"Crawling {base_url} ...")
-    print()
-
-    with client:
-        # Crawl internal pages
-        while True:
-            remaining = pages_to_crawl - crawled
-            if not remaining:
-                break
-            url = next(iter(remaining))
-            crawled.add(url)
-
+def load_allowlist(path: Optional[Path]) -> set[str]:
+    """Site paths allowed to be broken: one per line, # comments."""
+    if path is None or not path.exists():
+        return set()
+    lines = (line.split("#", 1)[0].strip() for line in path.read_text().splitlines())
+    return {line.rstrip("/") or "/" for line in lines if line}
+
+
+class LinkCache:
+    """On-disk external link results: URL -> status, check time, validators.
+
+    Stored as JSON ({"version": 1, "entries": {url: entry}}), written
+    atomically at the end of a run. Entries are only ever read for external
+    links; timeouts and connection errors are never cached. With refresh,
+    nothing is read from it: every link is requested unconditionally, and
+    the results are still recorded.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        ttl_ok: float = DEFAULT_TTL_OK,
+        ttl_fail: float = DEFAULT_TTL_FAIL,
+        refresh: bool = False,
+    ):
+        self.path = path
+        self.ttl_ok = ttl_ok
+        self.ttl_fail = ttl_fail
+        self.refresh = refresh
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.revalidated = 0
+        if path is not None and path.exists():
             try:
-                resp = client.get(url)
-            except httpx.TimeoutException:
-                found_on[url]  # ensure key exists
-                print(f"  TIMEOUT  {url}")
-                continue
-            except Exception as e:
-                print(f"  ERROR    {url}  ({e})")
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == self.VERSION:
+                self.entries = data.get("entries", {})
+
+    def fresh(self, url: str) -> Optional[dict[str, Any]]:
+        """The cached entry for url if it's still within its TTL."""
+        entry = self.entries.get(url)
+        if entry is None or self.refresh:
+            return None
+        ttl = self.ttl_ok if entry["status"] < 400 else self.ttl_fail
+        return entry if time.time() - entry["checked"] < ttl else None
+
+    def validators(self, url: str) -> dict[str, str]:
+        """Conditional request headers for revalidating a stale working link."""
+        entry = self.entries.get(url)
+        if entry is None or entry["status"] >= 400 or self.refresh:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(self, url: str, resp: httpx.Response) -> int:
+        """Store a response's outcome and return the link's status (a 304 keeps the cached one)."""
+        entry = self.entries.get(url)
+        if resp.status_code == 304 and entry is not None:
+            self.revalidated += 1
+            entry["checked"] = time.time()
+            return int(entry["status"])
+        self.entries[url] = {
+            "status": resp.status_code,
+            "checked": time.time(),
+            "etag": resp.headers.get("etag"),
+            "last_modified": resp.headers.get("last-modified"),
+        }
+        return resp.status_code
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": self.VERSION, "entries": self.entries}, indent=1, sort_keys=True))
+        os.replace(tmp, self.path)
+
+
+class Crawler:
+    """Concurrent link checker over one httpx.AsyncClient.
+
+    Internal pages are fetched by a pool of workers pulling from a queue;
+    each page's status is recorded as it is fetched, so no page is requested
+    twice. External links are then checked in parallel, HEAD first (GET only
+    for servers that reject HEAD). At most `concurrency` requests are in
+    flight overall and at most `per_host` against any one external host, so
+    GitHub, PyPI and the like aren't hammered into rate limiting. External
+    results come from the LinkCache while fresh.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        concurrency: int,
+        per_host: int,
+        check_external: bool = True,
+        cache: Optional[LinkCache] = None,
+        allowed: frozenset[str] = frozenset(),
+    ):
+        self.client = client
+        self.base_url = base_url
+        self.base_host = urlparse(base_url).netloc
+        self.concurrency = concurrency
+        self.check_external_links = check_external
+        self.cache = cache if cache is not None else LinkCache(None)
+        self.per_host = per_host
+        self.allowed = allowed
+        self._slots = asyncio.Semaphore(concurrency)
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        # url -> final status code, or "TIMEOUT" / "ERROR"
+        self.statuses: dict[str, Union[int, str]] = {}
+        # link -> pages that reference it
+        self.found_on: dict[str, list[str]] = defaultdict(list)
+
+    async def request(self, method: str, url: str, headers: Optional[dict[str, str]] = None) -> httpx.Response:
+        host = urlparse(url).netloc
+        if host == self.base_host:
+            async with self._slots:
+                return await self.client.request(method, url, headers=headers)
+        host_slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with host_slots, self._slots:
+            return await self.client.request(method, url, headers=headers)
+
+    async def crawl(self) -> None:
+        """Fetch every internal page reachable from the home page."""
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        seen = {normalize(self.base_url + "/")}
+        queue.put_nowait(next(iter(seen)))
+
+        async def worker() -> None:
+            while True:
+                url = await queue.get()
+                try:
+                    for link in await self.fetch_page(url):
+                        if link not in seen:
+                            seen.add(link)
+                            queue.put_nowait(link)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def fetch_page(self, url: str) -> list[str]:
+        """GET an internal page, record its status, and return its new internal links."""
+        try:
+            resp = await self.request("GET", url)
+        except httpx.TimeoutException:
+            self.statuses[url] = "TIMEOUT"
+            print(f"  TIMEOUT  {url}")
+            return []
+        except Exception as e:
+            self.statuses[url] = "ERROR"
+            print(f"  ERROR    {url}  ({e})")
+            return []
+
+        self.statuses[url] = resp.status_code
+        if "html" not in resp.headers.get("content-type", ""):
+            return []
+
+        extractor = LinkExtractor(url)
+        extractor.feed(resp.text)
+        internal = []
+        for raw_link in extractor.links:
+            link = normalize(raw_link)
+            if not link or should_skip(link):
                 continue
-
-            if "html" not in resp.headers.get("content-type", ""):
+            self.found_on[link].append(url)
+            if is_internal(link, self.base_host):
+                internal.append(link)
+        return internal
+
+    async def check_external(self, url: str) -> None:
+        """HEAD an external link (GET if HEAD is rejected) and record its status."""
+        cached = self.cache.fresh(url)
+        if cached is not None:
+            self.cache.hits += 1
+            self.statuses[url] = cached["status"]
+            return
+        validators = self.cache.validators(url)
+        try:
+            resp = await self.request("HEAD", url, validators)
+            # Some servers reject HEAD — retry with GET
+            if resp.status_code in (405, 403):
+                resp = await self.request("GET", url, validators)
+        except httpx.TimeoutException:
+            # Don't fail deploy over external timeouts
+            print(f"  ⚠  TIMEOUT (external, skipped)  {url}")
+            return
+        except Exception as e:
+            print(f"  ⚠  ERROR (external, skipped)  {url}  ({e})")
+            return
+        self.statuses[url] = self.cache.record(url, resp)
+
+    async def run(self) -> list[tuple[str, str, Union[int, str]]]:
+        """Crawl, check external links, and return (source, url, status) per broken link."""
+        await self.crawl()
+        external = sorted(url for url in self.found_on if not is_internal(url, self.base_host))
+        if self.check_external_links:
+            print(f"Crawled {len(self.statuses)} internal pages. Checking {len(external)} external links ...\n")
+            await asyncio.gather(*(self.check_external(url) for url in external))
+            requested = len(external) - self.cache.hits
+            print(f"External: {self.cache.hits} cached, {requested} requested ({self.cache.revalidated} unchanged since last check)\n")
+            self.cache.save()
+        else:
+            print(f"Crawled {len(self.statuses)} internal pages. Skipping {len(external)} external links.\n")
+
+        broken: list[tuple[str, str, Union[int, str]]] = []
+        for url, sources in sorted(self.found_on.items()):
+            # Unrecorded: external link that timed out or errored (not failed on)
+            status = self.statuses.get(url)
+            if status is None:
                 continue
-
-            extractor = LinkExtractor(url)
-            extractor.feed(resp.text)
-
-            for raw_link in extractor.links:
-                link = normalize(raw_link)
-                if not link or should_skip(link):
-                    continue
-                found_on[link].append(url)
-                if is_internal(link, base_host) and link not in crawled:
-                    pages_to_crawl.add(link)
-
-        # Phase 2: check every discovered link (internal already crawled, check external)
-        broken: list[tuple[str, str, int | str]] = []
-
-        print(f"Crawled {len(crawled)} internal pages. Checking {len(found_on)} unique links ...\n")
-
-        for url, sources in sorted(found_on.items()):
-            if should_skip(url):
+            internal = is_internal(url, self.base_host)
+            failed = status == "TIMEOUT" or status in (INTERNAL_BROKEN if internal else EXTERNAL_BROKEN)
+            if internal and urlparse(url).path in self.allowed:
+                if not failed:
+                    print(f"  ⚠  {urlparse(url).path} serves now -- remove it from the allowlist")
                 continue
+            if failed:
+                broken.append((sources[0], url, status))
+                print(f"  ✗ {status}  {url}")
+                print(f"    linked from: {sources[0]}")
+        return broken
+
+
+async def crawl_site(
+    base_url: str,
+    concurrency: int,
+    per_host: int,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    cache: Optional[LinkCache] = None,
+    allowed: frozenset[str] = frozenset(),
+) -> tuple[Crawler, list[tuple[str, str, Union[int, str]]]]:
+    async with httpx.AsyncClient(
+        transport=transport,
+        follow_redirects=True,
+        timeout=15.0,
+        headers={"User-Agent": "SIL-LinkChecker/1.0 (semanticinfrastructurelab.org)"},
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    ) as client:
+        # An in-process transport can only reach the app itself
+        crawler = Crawler(client, base_url, concurrency, per_host, check_external=transport is None, cache=cache, allowed=allowed)
+        return crawler, await crawler.run()
+
+
+def load_app(spec: str) -> Any:
+    """Import an ASGI app from "module:attribute", as the deployed server would."""
+    # The app resolves docs/ relative to its working directory, and the image
+    # serves this checkout's docs/ (SIL_DOCS_PATH, see Dockerfile)
+    os.chdir(PROJECT_ROOT)
+    os.environ.setdefault("SIL_DOCS_PATH", str(PROJECT_ROOT / "docs"))
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "app")
+
+
+def check_links(
+    base_url: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host: int = DEFAULT_PER_HOST,
+    app_spec: Optional[str] = None,
+    cache: Optional[LinkCache] = None,
+    allowed: frozenset[str] = frozenset(),
+) -> int:
+    base_url = base_url.rstrip("/")
 
-            internal = is_internal(url, base_host)
+    transport = None
+    if app_spec is not None:
+        transport = httpx.ASGITransport(app=load_app(app_spec))
+        print(f"Crawling {app_spec} in-process as {base_url} ({concurrency} concurrent requests) ...")
+    else:
+        print(f"Crawling {base_url} ({concurrency} concurrent requests, {per_host} per external host) ...")
+    print()
 
-            # Internal pages were already fetched — check their status now
-            if internal and url in crawled:
-                try:
-                    resp = client.get(url)
-                    status = resp.status_code
-                except httpx.TimeoutException:
-                    broken.append((sources[0], url, "TIMEOUT"))
-                    print(f"  ✗ TIMEOUT  {url}")
-                    print(f"    linked from: {sources[0]}")
-                    continue
-                except Exception as e:
-                    print(f"  ⚠  ERROR  {url}  ({e})")
-                    continue
-
-                if status in INTERNAL_BROKEN:
-                    broken.append((sources[0], url, status))
-                    print(f"  ✗ {status}  {url}")
-                    print(f"    linked from: {sources[0]}")
-
-            elif not internal:
-                # Check external link
-                try:
-                    resp = client.head(url, follow_redirects=True)
-                    status = resp.status_code
-                    # Some servers reject HEAD — retry with GET
-                    if status in (405, 403):
-                        resp = client.get(url)
-                        status = resp.status_code
-                except httpx.TimeoutException:
-                    # Don't fail deploy over external timeouts
-                    print(f"  ⚠  TIMEOUT (external, skipped)  {url}")
-                    continue
-                except Exception as e:
-                    print(f"  ⚠  ERROR (external, skipped)  {url}  ({e})")
-                    continue
-
-                if status in EXTERNAL_BROKEN:
-                    broken.append((sources[0], url, status))
-                    print(f"  ✗ {status}  {url}")
-                    print(f"    linked from: {sources[0]}")
+    started = time.perf_counter()
+    crawler, broken = asyncio.run(crawl_site(base_url, concurrency, per_host, transport, cache, allowed))
+    elapsed = time.perf_counter() - started
+    pages = sum(1 for url in crawler.statuses if is_internal(url, crawler.base_host))
 
     # Report
     print()
     print("=" * 60)
     if not broken:
-        print(f"✅ All links valid ({len(found_on)} checked across {len(crawled)} pages)")
+        print(f"✅ All links valid ({len(crawler.found_on)} checked across {pages} pages, {elapsed:.1f}s)")
         return 0
     else:
         print(f"❌ {len(broken)} broken link(s) found:\n")
@@ -184,6 +427,53 @@ def check_links(base_url: str) -> int:
         return 1
 
 
+def check_rendered(allowed: frozenset[str] = frozenset()) -> int:
+    """Validate every internal link in the rendered docs against the route table (allowlisted paths excepted)."""
+    app = load_app("sil_web.app:app")
+
+    started = time.perf_counter()
+    graph = app.state.link_service.graph
+    elapsed = time.perf_counter() - started
+    checked = sum(len(targets) for targets in graph.outbound.values())
+    broken = {
+        source: [url for url in targets if url not in allowed]
+        for source, targets in graph.broken.items()
+    }
+    broken = {source: targets for source, targets in broken.items() if targets}
+
+    print("=" * 60)
+    if not broken:
+        print(f"✅ All internal links resolve ({checked} checked across {len(graph.outbound)} pages, {elapsed:.2f}s)")
+        return 0
+    count = sum(len(targets) for targets in broken.values())
+    print(f"❌ {count} broken internal link(s) found:\n")
+    for source, targets in broken.items():
+        for url in targets:
+            print(f"  {url}")
+            print(f"       from: {source}")
+    print()
+    return 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the site's links")
+    parser.add_argument("base_url", nargs="?", default=DEFAULT_BASE_URL, help="Site to crawl (with --app: the host it is served as)")
+    parser.add_argument("--app", metavar="MODULE:ATTR", help="Crawl this ASGI app in-process (e.g. sil_web.app:app) instead of over the network")
+    parser.add_argument("--check", action="store_true", help="Validate internal links of the rendered docs in-process (no crawl)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help=f"Requests in flight (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, help=f"Requests in flight per external host (default: {DEFAULT_PER_HOST})")
+    parser.add_argument("--allowlist", type=Path, default=DEFAULT_ALLOWLIST, help="Internal paths allowed to be broken (default: scripts/link-allowlist.txt)")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help="External link result cache (default: .link-check-cache.json)")
+    parser.add_argument("--no-cache", action="store_true", help="Check every external link afresh, without conditional requests (the cache is still updated)")
+    parser.add_argument("--ttl-ok", type=float, default=DEFAULT_TTL_OK, help=f"Seconds a working link's result is reused (default: {DEFAULT_TTL_OK})")
+    parser.add_argument("--ttl-fail", type=float, default=DEFAULT_TTL_FAIL, help=f"Seconds a failing link's result is reused (default: {DEFAULT_TTL_FAIL})")
+    args = parser.parse_args()
+    allowed = frozenset(load_allowlist(args.allowlist))
+    if args.check:
+        return check_rendered(allowed)
+    cache = LinkCache(args.cache.resolve(), args.ttl_ok, args.ttl_fail, refresh=args.no_cache)
+    return check_links(args.base_url, args.concurrency, args.per_host, args.app, cache, allowed)
+
+
 if __name__ == "__main__":
-    base = sys.argv[1] if len(sys.argv) > 1 else "https://semanticinfrastructurelab.org"
-    sys.exit(check_links(base))
+    sys.exit(main())
@@ -6,22 +6,39 @@ Manifest-driven: sources its file list from CONTENT_MANIFEST.yaml's
 visibility: public entries (the same source of truth sync-docs.py uses),
 instead of walking a hardcoded, drift-prone category list. A file only
 appears here if it's also allowed onto the website itself.
+
+Incremental: each document's section is cached (.llms-full-cache.json,
+keyed by the source's content hash) and the file is assembled from the
+cached sections. Only documents whose content changed are read and parsed
+again -- an unchanged size and mtime skip even the read -- so regenerating
+after a docs-only sync costs about as much as the sync's changes.
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-import frontmatter
 import yaml
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
+
+# Shared document pipeline from the app (src/ layout, so no install needed)
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+from sil_web.services.documents import read_document  # noqa: E402
+
 SIL_REPO = PROJECT_ROOT.parent / "SIL"
 MANIFEST_PATH = SIL_REPO / "docs" / "CONTENT_MANIFEST.yaml"
 OUTPUT_FILE = PROJECT_ROOT / "static" / "llms-full.txt"
+CACHE_FILE = PROJECT_ROOT / ".llms-full-cache.json"
+# Bump when the section format changes, so cached sections are rebuilt
+CACHE_VERSION = 1
 
 # Display order for categories; anything not listed here sorts after, alphabetically.
 CATEGORY_ORDER = [
@@ -39,16 +56,85 @@ CATEGORY_ORDER = [
 
 
 def is_draft_article(rel: str) -> bool:
-    """Mirrors is_draft_article() in src/sil_web/routes/pages.py (SIL-16) --
-    this script runs standalone, outside the app, so it can't import that
-    module and re-checks the same status: draft frontmatter field itself."""
+    """Same publish gate as is_draft_article() in src/sil_web/routes/pages.py
+    (SIL-16): both read ParsedDocument.is_draft from the shared document
+    pipeline, so the status: draft check can't drift between them."""
     if not rel.startswith("articles/"):
         return False
-    try:
-        post = frontmatter.load(SIL_REPO / "docs" / rel)
-    except (OSError, ValueError):
-        return False
-    return str(post.metadata.get("status", "")).lower() == "draft"
+    doc = read_document(SIL_REPO / "docs" / rel)
+    return doc is not None and doc.is_draft
+
+
+class SectionCache:
+    """Per-document output by docs/ path, reused while the source's content is unchanged.
+
+    Entries hold the source's size, mtime and content hash: equal size and
+    mtime is a hit without reading the file, otherwise the content hash
+    decides. Entries not used by a run are dropped when it saves.
+    """
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.used: dict[str, dict] = {}
+        self.hits = 0
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def get(self, rel: str, source: Path, build):
+        """The cached value for rel, or build() for it if the source changed (None if missing)."""
+        try:
+            stat = source.stat()
+        except OSError:
+            return None
+        entry = self.entries.get(rel)
+        if entry is not None and (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            self.hits += 1
+            self.used[rel] = entry
+            return entry["value"]
+
+        try:
+            digest = hashlib.blake2b(source.read_bytes(), digest_size=16).hexdigest()
+        except OSError:  # a directory entry, or unreadable
+            return None
+        if entry is not None and entry["hash"] == digest:
+            self.hits += 1
+        else:
+            entry = {"hash": digest, "value": build()}
+        entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        self.used[rel] = entry
+        return entry["value"]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "entries": self.used}))
+        os.replace(tmp, self.path)
+
+
+def build_section(rel: str) -> dict | None:
+    """Read and process one document: its llms-full.txt section, or draft/missing markers."""
+    doc = read_document(SIL_REPO / "docs" / rel)
+    if doc is None:
+        return None
+    if is_draft_article(rel):
+        return {"draft": True}
+    return {
+        "section": (
+            f"\n## Document: {Path(rel).name}\n"
+            f"## Path: /docs/{rel}\n"
+            "\n"
+            f"{doc.raw}\n"
+            "\n---\n"
+        )
+    }
 
 
 def load_public_files() -> dict[str, list[str]]:
@@ -84,6 +170,10 @@ def ordered_categories(groups: dict[str, list[str]]) -> list[str]:
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate static/llms-full.txt from the public SIL docs")
+    parser.add_argument("--no-cache", action="store_true", help=f"Re-read every document (ignore and don't write {CACHE_FILE.name})")
+    args = parser.parse_args()
+
     if not SIL_REPO.exists():
         print(f"Error: SIL repository not found at {SIL_REPO}")
         return 1
@@ -97,6 +187,7 @@ def main() -> int:
     print(f"Output: {OUTPUT_FILE}")
 
     groups = load_public_files()
+    cache = SectionCache(None if args.no_cache else CACHE_FILE)
 
     parts = [
         "# Semantic Infrastructure Lab - Complete Documentation\n"
@@ -119,26 +210,18 @@ def main() -> int:
             f"# {'=' * 40}\n"
         )
         for rel in rel_paths:
-            file_path = SIL_REPO / "docs" / rel
-            if not file_path.exists():
+            result = cache.get(rel, SIL_REPO / "docs" / rel, lambda: build_section(rel))
+            if result is None:
                 print(f"Warning: {rel} listed in manifest but missing on disk, skipping")
                 continue
 
-            if is_draft_article(rel):
+            if result.get("draft"):
                 print(f"Skipping (draft, not yet published): {rel}")
                 continue
 
-            filename = Path(rel).name
             print(f"Adding: {rel}")
             total_docs += 1
-
-            parts.append(
-                f"\n## Document: {filename}\n"
-                f"## Path: /docs/{rel}\n"
-                "\n"
-                f"{file_path.read_text()}\n"
-                "\n---\n"
-            )
+            parts.append(result["section"])
 
     generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
     parts.append(
@@ -155,12 +238,13 @@ def main() -> int:
     )
 
     OUTPUT_FILE.write_text("".join(parts))
+    cache.save()
 
     size_kb = OUTPUT_FILE.stat().st_size / 1024
     line_count = OUTPUT_FILE.read_text().count("\n")
     print()
     print("Generated llms-full.txt")
-    print(f"   Documents: {total_docs}")
+    print(f"   Documents: {total_docs} ({cache.hits} from cache)")
     print(f"   Size: {size_kb:.1f}K")
     print(f"   Lines: {line_count}")
     print(f"   Location: {OUTPUT_FILE}")
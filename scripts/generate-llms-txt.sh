@@ -16,21 +16,36 @@ Two docs get dedicated top-level routes instead of a category route
 (START_HERE.md -> /start, FOUNDERS_LETTER.md -> /founders-letter) and are
 special-cased. Files with no route at all (nothing in pages.py serves
 them) are skipped and reported, not silently linked into a 404.
+
+Incremental: what each document contributes (its title, and whether it's
+a draft) is cached in .llms-txt-cache.json, keyed by the source's content
+hash, so only documents whose content changed are read and parsed again.
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
 import sys
 from pathlib import Path
 
-import frontmatter
 import yaml
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
+
+# Shared document pipeline from the app (src/ layout, so no install needed)
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+from sil_web.services.documents import read_document  # noqa: E402
+
 SIL_REPO = PROJECT_ROOT.parent / "SIL"
 MANIFEST_PATH = SIL_REPO / "docs" / "CONTENT_MANIFEST.yaml"
 OUTPUT_FILE = PROJECT_ROOT / "static" / "llms.txt"
+CACHE_FILE = PROJECT_ROOT / ".llms-txt-cache.json"
+# Bump when the cached per-document facts change shape
+CACHE_VERSION = 1
 
 # docs/<category>/ -> URL prefix. A category absent here has no route in
 # pages.py and its public files are unreachable on the website (flagged,
@@ -68,6 +83,60 @@ SECTION_TITLES = [
 ]
 
 
+class DocumentCache:
+    """Per-document facts by docs/ path, reused while the source's content is unchanged.
+
+    Entries hold the source's size, mtime and content hash: equal size and
+    mtime is a hit without reading the file, otherwise the content hash
+    decides. Entries not used by a run are dropped when it saves.
+    """
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.used: dict[str, dict] = {}
+        self.hits = 0
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def get(self, rel: str, source: Path, build):
+        """The cached value for rel, or build() for it if the source changed (None if missing)."""
+        try:
+            stat = source.stat()
+        except OSError:
+            return None
+        entry = self.entries.get(rel)
+        if entry is not None and (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            self.hits += 1
+            self.used[rel] = entry
+            return entry["value"]
+
+        try:
+            digest = hashlib.blake2b(source.read_bytes(), digest_size=16).hexdigest()
+        except OSError:  # a directory entry, or unreadable
+            return None
+        if entry is not None and entry["hash"] == digest:
+            self.hits += 1
+        else:
+            entry = {"hash": digest, "value": build()}
+        entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        self.used[rel] = entry
+        return entry["value"]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "entries": self.used}))
+        os.replace(tmp, self.path)
+
+
 def slugify(stem: str) -> str:
     return stem.lower().replace("_", "-")
 
@@ -89,16 +158,13 @@ def load_manifest_entries() -> list[dict]:
 
 
 def is_draft_article(rel: str) -> bool:
-    """Mirrors is_draft_article() in src/sil_web/routes/pages.py (SIL-16) --
-    this script runs standalone, outside the app, so it can't import that
-    module and re-checks the same status: draft frontmatter field itself."""
+    """Same publish gate as is_draft_article() in src/sil_web/routes/pages.py
+    (SIL-16): both read ParsedDocument.is_draft from the shared document
+    pipeline, so the status: draft check can't drift between them."""
     if not rel.startswith("articles/"):
         return False
-    try:
-        post = frontmatter.load(SIL_REPO / "docs" / rel)
-    except (OSError, ValueError):
-        return False
-    return str(post.metadata.get("status", "")).lower() == "draft"
+    doc = read_document(SIL_REPO / "docs" / rel)
+    return doc is not None and doc.is_draft
 
 
 def resolve_url(rel: str) -> str | None:
@@ -119,29 +185,33 @@ def resolve_url(rel: str) -> str | None:
 
 
 def extract_title(rel: str) -> str:
-    """First '# ' heading in the file, matching how pages.py titles rendered pages."""
-    file_path = SIL_REPO / "docs" / rel
-    try:
-        for line in file_path.read_text().splitlines():
-            if line.startswith("# "):
-                return line[2:].strip()
-    except FileNotFoundError:
-        pass
+    """The document's H1 title, exactly as pages.py titles rendered pages."""
+    doc = read_document(SIL_REPO / "docs" / rel)
+    if doc is not None and doc.title:
+        return doc.title
     return Path(rel).stem.replace("_", " ").replace("-", " ").title()
 
 
+def document_facts(rel: str) -> dict:
+    """What one document contributes: whether it's a draft, and its title."""
+    return {"draft": is_draft_article(rel), "title": extract_title(rel)}
+
+
 def build_sections(
     entries: list[dict],
+    cache: DocumentCache | None = None,
 ) -> tuple[dict[str, list[tuple[str, str, str]]], list[str], list[str]]:
     """Group resolved (title, url, purpose) tuples by category; collect unreachable
     and draft (status: draft, SIL-16) paths separately so callers can report each."""
     sections: dict[str, list[tuple[str, str, str]]] = {}
     unreachable: list[str] = []
     drafts: list[str] = []
+    cache = cache if cache is not None else DocumentCache(None)
 
     for entry in entries:
         rel = entry["rel"]
-        if is_draft_article(rel):
+        facts = cache.get(rel, SIL_REPO / "docs" / rel, lambda: document_facts(rel)) or document_facts(rel)
+        if facts["draft"]:
             drafts.append(rel)
             continue
 
@@ -151,7 +221,7 @@ def build_sections(
             continue
 
         category = rel.split("/")[0] if "/" in rel else "(root)"
-        label = extract_title(rel)
+        label = facts["title"]
         sections.setdefault(category, []).append((label, url, entry["purpose"]))
 
     for items in sections.values():
@@ -212,17 +282,23 @@ def render(sections: dict[str, list[tuple[str, str, str]]]) -> str:
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate static/llms.txt from the public SIL docs")
+    parser.add_argument("--no-cache", action="store_true", help=f"Re-read every document (ignore and don't write {CACHE_FILE.name})")
+    args = parser.parse_args()
+
     if not MANIFEST_PATH.exists():
         print(f"Error: CONTENT_MANIFEST.yaml not found at {MANIFEST_PATH}")
         return 1
 
     entries = load_manifest_entries()
-    sections, unreachable, drafts = build_sections(entries)
+    cache = DocumentCache(None if args.no_cache else CACHE_FILE)
+    sections, unreachable, drafts = build_sections(entries, cache)
 
     OUTPUT_FILE.write_text(render(sections))
+    cache.save()
 
     total_links = sum(len(v) for v in sections.values())
-    print(f"Generated llms.txt: {total_links} links across {len(sections)} sections")
+    print(f"Generated llms.txt: {total_links} links across {len(sections)} sections ({cache.hits} documents from cache)")
     print(f"Location: {OUTPUT_FILE}")
 
     articles_published = sections.get("articles", [])
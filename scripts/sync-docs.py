@@ -14,6 +14,26 @@ PHILOSOPHY:
   script (currently: docs/pages/) is hand-maintained website content that
   never comes from SIL and must never be auto-pruned - see SIL-10.
 
+INCREMENTAL:
+  Only files whose content differs are copied. Each source/destination pair
+  is compared on a thread pool -- same size and mtime (copy2 preserves the
+  source's) means unchanged without reading either file, otherwise their
+  content hashes decide -- so identical files keep their mtimes and every
+  downstream cache (the app's render/search caches, container layers) stays
+  valid. A no-op sync reads directory entries and nothing else.
+
+  Each docs tree (SIL's and the website's) is walked exactly once per run,
+  into a ManifestIndex: every manifest entry expanded to docs/-relative
+  paths, each mapped to its source file and its website copy (size, mtime
+  and content hash read on first use and kept). Sync, validation, pruning,
+  cleaning and the file-count reports all look files up in it.
+  A sync that changed anything writes a change manifest to
+  docs/.sync-changes.json: {"added", "modified", "removed"} lists of
+  docs/-relative paths, a new content "generation" id and the "previous"
+  one. A running app applies it with `curl -X POST localhost:8000/admin/reload`,
+  dropping only the changed docs' cached state (src/sil_web/services/reload.py).
+  --changes FILE writes the same JSON elsewhere too (dry runs included).
+
 CHANGES FROM BASH VERSION:
   - Pure Python implementation (cleaner, more maintainable)
   - Native YAML parsing
@@ -26,15 +46,24 @@ USAGE:
   ./sync-docs.py --validate   # Validate only, don't sync
   ./sync-docs.py --dry-run    # Show what would be synced
   ./sync-docs.py --clean      # Remove internal files from website
+  ./sync-docs.py --changes changes.json  # Also write the change list
 
 SESSION: bronze-spark-1216
 """
 
 import argparse
+import bisect
+import fnmatch
+import hashlib
+import json
+import os
+import secrets
 import shutil
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple
 
 try:
     import yaml
@@ -42,31 +71,158 @@ except ImportError:
     print("ERROR: PyYAML not installed. Install with: pip install pyyaml")
     sys.exit(1)
 
+# Shared frontmatter parser from the app (PyYAML-only, src/ layout)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from sil_web.services.frontmatter import read_frontmatter  # noqa: E402
+
 
 def read_frontmatter_status(path: Path) -> str | None:
     """Best-effort read of the `status:` field from a doc's YAML frontmatter.
 
-    Deliberately hand-rolled (not python-frontmatter) since this script's only
-    other dependency is PyYAML -- we just need one field, not full parsing.
+    Uses the app's shared header-only parser (libyaml when available): only
+    the frontmatter block is read and loaded, never the document body.
     """
     try:
-        text = path.read_text()
-    except OSError:
-        return None
-    if not text.startswith("---"):
+        meta = read_frontmatter(path)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
         return None
-    end = text.find("\n---", 3)
-    if end == -1:
-        return None
-    try:
-        meta = yaml.safe_load(text[3:end])
-    except yaml.YAMLError:
-        return None
-    if not isinstance(meta, dict) or meta.get("status") is None:
+    if meta.get("status") is None:
         return None
     return str(meta["status"]).lower()
 
 
+def file_digest(path: Path) -> str:
+    """Content hash of a file (read in 1 MiB chunks)."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IndexedFile:
+    """A file found by a tree scan; its stat and content hash are read on first use."""
+
+    __slots__ = ("path", "_stat", "_digest")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._stat: Optional[os.stat_result] = None
+        self._digest: Optional[str] = None
+
+    @property
+    def stat(self) -> os.stat_result:
+        if self._stat is None:
+            self._stat = self.path.stat()
+        return self._stat
+
+    @property
+    def digest(self) -> str:
+        if self._digest is None:
+            self._digest = file_digest(self.path)
+        return self._digest
+
+
+def scan_tree(root: Path) -> Tuple[Dict[str, IndexedFile], Set[str]]:
+    """Walk a tree once: its files and its directories, by root-relative path.
+
+    Directory entries only (no stat calls); symlinked directories are not
+    followed, as with Path.rglob.
+    """
+    files: Dict[str, IndexedFile] = {}
+    dirs: Set[str] = set()
+    if not root.is_dir():
+        return files, dirs
+    pending = [(root, "")]
+    while pending:
+        directory, prefix = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                rel = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.add(rel)
+                    pending.append((Path(entry.path), rel + "/"))
+                elif entry.is_file():
+                    files[rel] = IndexedFile(Path(entry.path))
+    return files, dirs
+
+
+def compare_files(source: IndexedFile, dest: Optional[IndexedFile]) -> str:
+    """How dest differs from source: "added", "modified" or "unchanged".
+
+    Quick check first (rsync's): equal size and mtime mean unchanged without
+    reading either file. Otherwise the content hashes decide.
+    """
+    if dest is None:
+        return "added"
+    if source.stat.st_size != dest.stat.st_size:
+        return "modified"
+    if source.stat.st_mtime_ns == dest.stat.st_mtime_ns:
+        return "unchanged"
+    return "unchanged" if source.digest == dest.digest else "modified"
+
+
+class ManifestIndex:
+    """The manifest expanded against a single scan of each docs tree.
+
+    Paths are docs/-relative -- the same on both sides, since public files
+    keep their place in the tree.
+
+    Usage:
+        index = ManifestIndex(manifest, sil_repo / "docs", website_docs)
+        for rel in index.expected: compare_files(index.source[rel], index.website.get(rel))
+    """
+
+    def __init__(self, manifest: "ContentManifest", source_docs: Path, website_docs: Path):
+        self.website_docs = website_docs
+        self.source, source_dirs = scan_tree(source_docs)
+        self.website, _ = scan_tree(website_docs)
+
+        sorted_sources = sorted(self.source)
+        self.groups: List[Tuple[str, List[str]]] = []  # (label, paths) in manifest order
+        self.missing_dirs: List[str] = []
+        self.missing_files: List[str] = []
+        individual = []
+        for item in manifest.public_files:
+            clean_path = item['path'].replace('docs/', '')
+            if item['type'] == 'file':
+                (individual if clean_path in self.source else self.missing_files).append(clean_path)
+            elif clean_path not in source_dirs:
+                self.missing_dirs.append(clean_path)
+            else:
+                pattern = item.get('pattern', '*.md')
+                prefix = clean_path + "/"
+                start = bisect.bisect_left(sorted_sources, prefix)
+                end = bisect.bisect_left(sorted_sources, prefix + "\U0010ffff")
+                self.groups.append((f"{clean_path}/", [
+                    rel for rel in sorted_sources[start:end] if fnmatch.fnmatchcase(rel.rsplit("/", 1)[-1], pattern)
+                ]))
+        if individual:
+            self.groups.append(("individual files", individual))
+
+        # Source file for every path the manifest publishes
+        self.expected: Dict[str, IndexedFile] = {
+            rel: self.source[rel] for _, rels in self.groups for rel in rels
+        }
+
+    def markdown(self, directory: str = "") -> List[str]:
+        """Website .md paths, sorted; under `directory` if given."""
+        prefix = directory + "/" if directory else ""
+        return sorted(rel for rel in self.website if rel.endswith(".md") and rel.startswith(prefix))
+
+    def copied(self, rel: str):
+        """Record that rel was (re)written on the website."""
+        self.website[rel] = IndexedFile(self.website_docs / rel)
+
+    def removed(self, rel: str):
+        """Record that rel was deleted from the website."""
+        self.website.pop(rel, None)
+
+
+# Change manifest for the running app (SIL_SYNC_CHANGES in the app's settings)
+CHANGES_MANIFEST = ".sync-changes.json"
+
+
 # Top-level docs/ directories that are hand-maintained directly in the website
 # repo and never sync from SIL at all. Pruning must never touch these, no matter
 # what the manifest does or doesn't say about them.
@@ -87,16 +243,21 @@ class SyncStats:
     def __init__(self):
         self.synced_files = 0
         self.synced_dirs = 0
+        self.unchanged_files = 0
         self.skipped_files = 0
         self.missing_files = 0
         self.internal_violations = 0
         self.violations_list: List[str] = []
         self.pruned_files = 0
+        # docs/-relative paths by kind of change, for --changes
+        self.changes: Dict[str, List[str]] = {"added": [], "modified": [], "removed": []}
 
     def summary(self) -> str:
         """Generate summary report"""
         lines = [
-            f"Synced: {self.synced_files} files, {self.synced_dirs} directories",
+            f"Synced: {self.synced_files} files, {self.synced_dirs} directories "
+            f"({len(self.changes['added'])} added, {len(self.changes['modified'])} modified)",
+            f"Unchanged: {self.unchanged_files} files",
             f"Skipped: {self.skipped_files} files",
         ]
         if self.missing_files > 0:
@@ -223,99 +384,61 @@ class DocSync:
         print(f"{Colors.GREEN}✓{Colors.NC} Found CONTENT_MANIFEST.yaml")
         print()
 
-    def sync_directory(self, source_dir: Path, dest_dir: Path, pattern: str = "*.md"):
-        """Sync a directory using rsync-like behavior"""
-        if not source_dir.exists():
-            print(f"{Colors.YELLOW}⚠{Colors.NC} Source directory not found: {source_dir}")
-            self.stats.missing_files += 1
-            return
-
-        # Create destination directory
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy all matching files
-        files_synced = 0
-        for source_file in source_dir.rglob(pattern):
-            if source_file.is_file():
-                # Calculate relative path and destination
-                rel_path = source_file.relative_to(source_dir)
-                dest_file = dest_dir / rel_path
-
-                # Create parent directories
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
-
-                # Copy file
-                if not self.args.dry_run:
-                    shutil.copy2(source_file, dest_file)
-                files_synced += 1
-
-        self.stats.synced_files += files_synced
-        self.stats.synced_dirs += 1
-
-        return files_synced
-
-    def sync_file(self, source_path: Path, dest_path: Path):
-        """Sync individual file"""
-        if not source_path.exists():
-            print(f"{Colors.YELLOW}  ⚠{Colors.NC} Missing: {source_path.relative_to(self.sil_repo / 'docs')}")
-            self.stats.missing_files += 1
-            return False
-
-        # Create parent directory
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Copy file
-        if not self.args.dry_run:
-            shutil.copy2(source_path, dest_path)
-
-        print(f"  {Colors.GREEN}✓{Colors.NC} {source_path.relative_to(self.sil_repo / 'docs')}")
-        self.stats.synced_files += 1
-        return True
+    def copy_if_changed(self, rel: str) -> str:
+        """Copy a published file over its website copy unless identical; returns the change kind"""
+        change = compare_files(self.index.expected[rel], self.index.website.get(rel))
+        if change != "unchanged" and not self.args.dry_run:
+            dest = self.website_docs / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(self.index.expected[rel].path, dest)
+        return change
+
+    def apply_plan(self, label: str, plan: List[str], changes: Dict[str, str]):
+        """Record and report the outcome of one group of the sync plan"""
+        counts = {"added": 0, "modified": 0, "unchanged": 0}
+        for rel in plan:
+            change = changes[rel]
+            counts[change] += 1
+            if change == "unchanged":
+                self.stats.unchanged_files += 1
+                continue
+            self.stats.changes[change].append(rel)
+            self.stats.synced_files += 1
+            if not self.args.dry_run:
+                self.index.copied(rel)
+            marker = f"{Colors.YELLOW}[DRY RUN]{Colors.NC} would be " if self.args.dry_run else f"{Colors.GREEN}✓{Colors.NC} "
+            print(f"  {marker}{change}: {rel}")
+        print(f"{Colors.GREEN}✓{Colors.NC} {label}: {counts['added']} added, {counts['modified']} modified, {counts['unchanged']} unchanged")
+        print()
 
     def sync_public_content(self):
-        """Sync all public content from manifest"""
+        """Sync all public content from manifest.
+
+        Compares (and, where they differ, copies) every published file on a
+        thread pool, then reports by manifest entry.
+        """
         print("=" * 50)
         print("Syncing Public Documentation")
         print("=" * 50)
         print()
 
-        # Group files by type
-        dirs_to_sync = []
-        files_to_sync = []
+        for clean_path in self.index.missing_dirs:
+            print(f"{Colors.YELLOW}⚠{Colors.NC} Source directory not found: {self.sil_repo / 'docs' / clean_path}")
+        for clean_path in self.index.missing_files:
+            print(f"{Colors.YELLOW}  ⚠{Colors.NC} Missing: {clean_path}")
+        self.stats.missing_files += len(self.index.missing_dirs) + len(self.index.missing_files)
+        self.stats.synced_dirs += sum(1 for label, _ in self.index.groups if label.endswith("/"))
 
-        for item in self.manifest.public_files:
-            if item['type'] == 'dir':
-                dirs_to_sync.append(item)
-            else:
-                files_to_sync.append(item)
-
-        # Sync directories
-        for item in dirs_to_sync:
-            clean_path = item['path'].replace('docs/', '')
-            source_dir = self.sil_repo / "docs" / clean_path
-            dest_dir = self.website_docs / clean_path
-
-            print(f"Syncing {clean_path}/...")
-            if self.args.dry_run:
-                print(f"  {Colors.YELLOW}[DRY RUN]{Colors.NC} Would sync {source_dir} -> {dest_dir}")
-            else:
-                files_count = self.sync_directory(source_dir, dest_dir, item.get('pattern', '*.md'))
-                print(f"{Colors.GREEN}✓{Colors.NC} {clean_path} synced ({files_count} files)")
-            print()
+        rels = list(self.index.expected)
+        with ThreadPoolExecutor(max_workers=self.args.jobs) as pool:
+            changes = dict(zip(rels, pool.map(self.copy_if_changed, rels)))
 
-        # Sync individual files
-        if files_to_sync:
-            print("Syncing individual files...")
-            for item in files_to_sync:
-                file_path = item['path'].replace('docs/', '')
-                source_path = self.sil_repo / "docs" / file_path
-                dest_path = self.website_docs / file_path
-
-                if self.args.dry_run:
-                    print(f"  {Colors.YELLOW}[DRY RUN]{Colors.NC} Would sync {file_path}")
-                else:
-                    self.sync_file(source_path, dest_path)
-            print()
+        # The same file may be listed twice (a dir entry and a file entry)
+        reported: Set[str] = set()
+        for label, plan in self.index.groups:
+            fresh = [rel for rel in plan if rel not in reported]
+            reported.update(fresh)
+            self.apply_plan(label, fresh, changes)
 
         print(f"{Colors.GREEN}✓{Colors.NC} Public files synced")
         print()
@@ -331,9 +454,8 @@ class DocSync:
 
         for internal_path in self.manifest.internal_files:
             clean_path = internal_path.replace('docs/', '')
-            website_file = self.website_docs / clean_path
 
-            if website_file.exists():
+            if clean_path in self.index.website:
                 print(f"{Colors.RED}✗{Colors.NC} Found internal file: {clean_path}")
                 self.stats.internal_violations += 1
                 self.stats.violations_list.append(clean_path)
@@ -352,25 +474,15 @@ class DocSync:
         print()
 
     def compute_expected_relpaths(self) -> set:
-        """Compute the set of website-relative .md paths the manifest says should exist.
+        """Compute the set of website-relative paths the manifest says should exist.
 
-        Mirrors sync_public_content's own source-side enumeration (file entries as-is,
-        dir entries expanded by scanning the SIL source dir), so this stays correct
-        without duplicating the manifest's file list by hand.
+        The same expansion sync_public_content uses (file entries as-is, dir
+        entries matched against the scan of the SIL source tree), so this stays
+        correct without duplicating the manifest's file list by hand. File
+        entries missing from the SIL source still count: a file that is
+        temporarily absent there must not cost the website its copy.
         """
-        expected = set()
-        for item in self.manifest.public_files:
-            if item["type"] == "dir":
-                clean_path = item["path"].replace("docs/", "")
-                source_dir = self.sil_repo / "docs" / clean_path
-                if source_dir.exists():
-                    for source_file in source_dir.rglob(item.get("pattern", "*.md")):
-                        if source_file.is_file():
-                            rel = Path(clean_path) / source_file.relative_to(source_dir)
-                            expected.add(str(rel))
-            else:
-                expected.add(item["path"].replace("docs/", ""))
-        return expected
+        return set(self.index.expected) | set(self.index.missing_files)
 
     def prune_orphaned_files(self):
         """Remove .md files in the website repo with no corresponding manifest entry.
@@ -388,14 +500,10 @@ class DocSync:
         expected = self.compute_expected_relpaths()
         would_only = self.args.validate or self.args.dry_run
 
-        orphans = []
-        for md_file in sorted(self.website_docs.rglob("*.md")):
-            rel = md_file.relative_to(self.website_docs)
-            if rel.parts and rel.parts[0] in EXEMPT_PRUNE_DIRS:
-                continue
-            if str(rel) in expected:
-                continue
-            orphans.append(rel)
+        orphans = [
+            rel for rel in self.index.markdown()
+            if rel.split("/", 1)[0] not in EXEMPT_PRUNE_DIRS and rel not in expected
+        ]
 
         if not orphans:
             print(f"{Colors.GREEN}✓{Colors.NC} No orphaned files found")
@@ -405,8 +513,10 @@ class DocSync:
         label = "[would remove]" if would_only else "Removing"
         for rel in orphans:
             print(f"  {Colors.YELLOW}{label}{Colors.NC} {rel}")
+            self.stats.changes["removed"].append(rel)
             if not would_only:
                 (self.website_docs / rel).unlink()
+                self.index.removed(rel)
 
         if not would_only:
             self.stats.pruned_files = len(orphans)
@@ -423,12 +533,13 @@ class DocSync:
         removed = 0
         for internal_path in self.manifest.internal_files:
             clean_path = internal_path.replace('docs/', '')
-            website_file = self.website_docs / clean_path
 
-            if website_file.exists():
+            if clean_path in self.index.website:
                 print(f"Removing: {clean_path}")
+                self.stats.changes["removed"].append(clean_path)
                 if not self.args.dry_run:
-                    website_file.unlink()
+                    (self.website_docs / clean_path).unlink()
+                    self.index.removed(clean_path)
                 removed += 1
 
         if removed == 0:
@@ -448,8 +559,8 @@ class DocSync:
         Purely informational: confirms at sync time which articles will and won't
         go live once deployed.
         """
-        articles_dir = self.website_docs / "articles"
-        if not articles_dir.exists():
+        articles = [rel for rel in self.index.markdown("articles") if rel.count("/") == 1]
+        if not articles:
             return
 
         print("=" * 50)
@@ -458,11 +569,12 @@ class DocSync:
         print()
 
         published, drafts = [], []
-        for md_file in sorted(articles_dir.glob("*.md")):
-            if md_file.name == "README.md":
+        for rel in articles:
+            name = rel.split("/", 1)[1]
+            if name == "README.md":
                 continue
-            status = read_frontmatter_status(md_file)
-            (drafts if status == "draft" else published).append(md_file.name)
+            status = read_frontmatter_status(self.website_docs / rel)
+            (drafts if status == "draft" else published).append(name)
 
         print(f"{Colors.GREEN}✓{Colors.NC} Published: {len(published)} article(s)")
         if drafts:
@@ -482,13 +594,12 @@ class DocSync:
                 'architecture', 'meta', 'essays']
 
         for dir_name in dirs:
-            dir_path = self.website_docs / dir_name
-            if dir_path.exists():
-                count = len(list(dir_path.rglob('*.md')))
+            count = len(self.index.markdown(dir_name))
+            if count:
                 print(f"  {dir_name:<13} {count:>2} documents")
 
         print()
-        total = len(list(self.website_docs.rglob('*.md')))
+        total = len(self.index.markdown())
         print(f"Total: {total} markdown files")
         print()
 
@@ -500,7 +611,7 @@ class DocSync:
         expected_public = stats.get('public_files', 0)
         expected_internal = stats.get('internal_files', 0)
 
-        actual_count = len(list(self.website_docs.rglob('*.md')))
+        actual_count = len(self.index.markdown())
 
         print(f"Expected public files: {expected_public}")
         print(f"Actual files in website: {actual_count}")
@@ -543,13 +654,47 @@ class DocSync:
             print(self.stats.summary())
             return 0
 
+    def write_changes(self):
+        """Write the change manifest (docs/.sync-changes.json, and --changes) as JSON
+
+        Written to docs/ only by a real sync that changed something, with a new
+        generation id; `previous` is the generation of the manifest it replaces,
+        which the app must have applied to apply this one on its own.
+        """
+        manifest_path = self.website_docs / CHANGES_MANIFEST
+        changed = any(self.stats.changes.values()) and not (self.args.dry_run or self.args.validate)
+        if not changed and not self.args.changes:
+            return
+
+        previous = None
+        try:
+            previous = json.loads(manifest_path.read_text()).get("generation")
+        except (OSError, ValueError, AttributeError):
+            pass
+        manifest = {
+            "generation": time.strftime("%Y%m%dT%H%M%SZ", time.gmtime()) + "-" + secrets.token_hex(4) if changed else previous,
+            "previous": previous,
+            **{kind: sorted(paths) for kind, paths in self.stats.changes.items()},
+        }
+        text = json.dumps(manifest, indent=2) + "\n"
+
+        for path in ([manifest_path] if changed else []) + ([Path(self.args.changes)] if self.args.changes else []):
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(text)
+            os.replace(tmp, path)
+        if changed:
+            print(f"{Colors.GREEN}✓{Colors.NC} Change manifest: generation {manifest['generation']} "
+                  f"(apply to a running app: curl -X POST localhost:8000/admin/reload)")
+
     def run(self):
         """Main execution flow"""
         self.print_header()
         self.validate_environment()
+        self.index = ManifestIndex(self.manifest, self.sil_repo / "docs", self.website_docs)
 
         if self.args.clean:
             self.clean_internal_files()
+            self.write_changes()
             return self.print_summary()
 
         if not self.args.validate:
@@ -563,6 +708,7 @@ class DocSync:
             self.show_file_counts()
             self.validate_manifest_stats()
 
+        self.write_changes()
         return self.print_summary()
 
 
@@ -577,6 +723,7 @@ Examples:
   %(prog)s --dry-run      # Show what would be synced
   %(prog)s --validate     # Check for issues without syncing
   %(prog)s --clean        # Remove internal files from website
+  %(prog)s --changes changes.json  # Also write what changed, as JSON
         """
     )
 
@@ -598,6 +745,19 @@ Examples:
         help='Remove internal files from website repo'
     )
 
+    parser.add_argument(
+        '--changes',
+        metavar='FILE',
+        help='Also write the change manifest (added/modified/removed docs/-relative paths) here'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=min(32, (os.cpu_count() or 1) + 4),
+        help='Threads comparing and copying files (default: CPUs + 4, at most 32)'
+    )
+
     args = parser.parse_args()
 
     try:
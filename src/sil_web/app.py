@@ -7,18 +7,36 @@ Wires together all layers: services, routes, configuration.
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import Response
 
-from sil_web.config.settings import DOCS_PATH
+from sil_web.config.settings import (
+    DOCS_PATH,
+    GLOSSARY_AUTOLINK,
+    IO_WORKERS,
+    LASTMOD_INDEX_PATH,
+    SEARCH_SNAPSHOT_PATH,
+    SERVER_HIGHLIGHT,
+    SYNC_CHANGES_PATH,
+)
 from sil_web.routes.health import router as health_router
+from sil_web.routes.links import create_link_service, create_links_router
 from sil_web.routes.llms import router as llms_router
-from sil_web.routes.pages import create_routes
+from sil_web.routes.notfound import create_not_found_handler, create_suggestion_index
+from sil_web.routes.pages import create_page_shell, create_routes
+from sil_web.routes.related import create_related_router, create_related_service
+from sil_web.routes.reload import create_reload_router
 from sil_web.routes.robots import router as robots_router
-from sil_web.routes.sitemap import router as sitemap_router
+from sil_web.routes.search import create_completion_index, create_search_router, create_search_service
+from sil_web.routes.sitemap import DOCS_ROOT, create_sitemap_router
 from sil_web.services.content import ContentService
+from sil_web.services.fileio import FileIOPool
+from sil_web.services.glossary import create_glossary_linker
+from sil_web.services.lastmod import LastmodIndex
 from sil_web.services.markdown import MarkdownRenderer
 from sil_web.services.metrics import MetricsService
+from sil_web.services.reload import ContentReloader
 
 # Configure structured logging
 structlog.configure(
@@ -86,25 +104,97 @@ def create_app() -> FastAPI:
 
     # Initialize services
     content_service = ContentService(docs_path=DOCS_PATH)
-    markdown_renderer = MarkdownRenderer(content_service)
+    markdown_renderer = MarkdownRenderer(
+        content_service,
+        highlight=SERVER_HIGHLIGHT,
+        glossary=create_glossary_linker() if GLOSSARY_AUTOLINK else None,
+    )
     metrics_service = MetricsService()  # Uses canonical TIA metrics by default
 
-    # Mount health check (no dependencies)
+    # Blocking file I/O pool (routes await it; /health reports its queue depth)
+    io_pool = FileIOPool(max_workers=IO_WORKERS)
+    app.state.io_pool = io_pool
+    app.add_event_handler("shutdown", io_pool.shutdown)
+
+    # Git-derived edit times (loaded once; no per-request git or stat)
+    lastmod_index = LastmodIndex.load(LASTMOD_INDEX_PATH, DOCS_ROOT)
+    app.state.lastmod_index = lastmod_index
+
+    # Mount health check (reads app.state.io_pool if present)
     app.include_router(health_router)
 
     # Mount robots.txt (no dependencies)
     app.include_router(robots_router)
 
-    # Mount sitemap.xml (no dependencies)
-    app.include_router(sitemap_router)
+    # Mount sitemap.xml (cached per content generation, built on the I/O pool)
+    app.include_router(create_sitemap_router(content_service, io_pool, lastmod_index=lastmod_index))
+
+    # Full-text search index: mapped from the deploy-time snapshot if there
+    # is one, else built on the I/O pool at startup; updated when the docs
+    # change (HTML /search is mounted with the page routes)
+    search_service = create_search_service(content_service, snapshot_path=SEARCH_SNAPSHOT_PATH)
+    app.state.search_service = search_service
+    app.include_router(create_search_router(search_service, io_pool, create_completion_index(content_service)))
+
+    # Related reading (shown on document pages, and as /related.json)
+    related_service = create_related_service(content_service)
+    app.include_router(create_related_router(related_service, io_pool))
+
+    # Internal link graph (backlinks on document pages, /links.json, broken
+    # link check); its build renders every doc, so it is built on first use
+    # rather than at startup, and after a reload only changed pages re-render
+    def fixed_routes() -> list[str]:
+        paths = (getattr(route, "path", "") for route in app.routes)
+        return [path for path in paths if path and "{" not in path]
+
+    link_service = create_link_service(markdown_renderer, content_service, extra_routes=fixed_routes)
+    app.state.link_service = link_service
+    app.include_router(create_links_router(link_service, io_pool))
+
+    async def build_indexes() -> None:
+        await io_pool.run(lambda: search_service.index)
+        await io_pool.run(lambda: related_service.graph)
+
+    app.add_event_handler("startup", build_indexes)
+
+    # POST /admin/reload (loopback only): apply sync-docs.py's change
+    # manifest -- drop just the changed docs' cached state, start a new
+    # content generation, and rebuild the search index and related graph
+    # before answering
+    reloader = ContentReloader(
+        content_service,
+        markdown_renderer,
+        SYNC_CHANGES_PATH,
+        roots=[DOCS_ROOT],
+        glossary=create_glossary_linker if GLOSSARY_AUTOLINK else None,
+        warm=[lambda: search_service.index, lambda: related_service.graph],
+    )
+    app.include_router(create_reload_router(reloader, io_pool))
 
     # Mount llms.txt endpoints (no dependencies)
     app.include_router(llms_router)
 
     # Create and mount page routes (SIF doesn't use project_service)
-    routes = create_routes(content_service, None, markdown_renderer, metrics_service)
+    page_shell = create_page_shell(content_service, markdown_renderer, metrics_service)
+    app.state.page_shell = page_shell
+    routes = create_routes(
+        content_service,
+        None,
+        markdown_renderer,
+        metrics_service,
+        io_pool=io_pool,
+        search_service=search_service,
+        page_shell=page_shell,
+        related_service=related_service,
+        link_service=link_service,
+    )
     app.include_router(routes)
 
+    # 404s (JSON, or the site shell for browsers) suggest the nearest real
+    # pages from a trigram index over the route table, rebuilt on docs change
+    suggestion_index = create_suggestion_index(content_service)
+    app.add_exception_handler(StarletteHTTPException, create_not_found_handler(suggestion_index, page_shell, io_pool))
+
     log.info("app_created", docs_path=str(DOCS_PATH))
 
     return app
@@ -14,10 +14,63 @@ BASE_DIR = Path(__file__).parent.parent.parent.parent
 # otherwise fall back to local development path
 DOCS_PATH = Path(os.getenv("SIL_DOCS_PATH", BASE_DIR.parent / "SIL" / "docs"))
 
+# Environment: development | staging | production. Unset means a local
+# checkout (development); the Docker image sets production, and
+# deploy-container.sh sets staging/production explicitly.
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
+
+# Templates
+TEMPLATES_PATH = Path("templates")
+# Re-stat templates on every render only in development; elsewhere they are
+# baked into the image and never change under a running process.
+TEMPLATE_AUTO_RELOAD = ENVIRONMENT == "development"
+# Compiled template bytecode (shared by all workers). Unset = Jinja2's per-user temp dir.
+TEMPLATE_CACHE_DIR = Path(os.environ["SIL_TEMPLATE_CACHE_DIR"]) if os.getenv("SIL_TEMPLATE_CACHE_DIR") else None
+
 # Server
 HOST = "0.0.0.0"
 PORT = 8000
 DEBUG = True
 
+# Threads for blocking file work (stat/read/parse/render) awaited by async
+# route handlers, so a slow disk never stalls the event loop.
+IO_WORKERS = int(os.getenv("SIL_IO_WORKERS", "4"))
+
+# sitemap.xml is cached until the content generation or the docs tree
+# changes; the tree is re-checked (stat only) at most this often, in seconds.
+SITEMAP_CHECK_INTERVAL = float(os.getenv("SIL_SITEMAP_CHECK_INTERVAL", "30"))
+# path -> last-commit-time index for <lastmod>/Last-Modified, generated by
+# scripts/build-lastmod-index.py at deploy time (file mtimes if absent)
+LASTMOD_INDEX_PATH = Path(os.getenv("SIL_LASTMOD_INDEX", "docs/.lastmod-index.json"))
+# URLs per child sitemap before it is split (protocol maximum: 50,000)
+SITEMAP_MAX_URLS = min(int(os.getenv("SIL_SITEMAP_MAX_URLS", "50000")), 50_000)
+
+# The search index is rebuilt when the content generation or the docs tree
+# changes; the tree is re-checked (stat only) at most this often, in seconds.
+SEARCH_CHECK_INTERVAL = float(os.getenv("SIL_SEARCH_CHECK_INTERVAL", "30"))
+# Prebuilt search index, memory-mapped at startup instead of indexing the
+# docs in every worker; generated by scripts/build-search-index.py at deploy
+# time (the index is built from the docs if absent)
+SEARCH_SNAPSHOT_PATH = Path(os.getenv("SIL_SEARCH_SNAPSHOT", "docs/.search-index.bin"))
+
+# Browser/CDN cache lifetime for /search/suggest responses, in seconds.
+# Completions only change when the docs do, so keystroke lookups repeated
+# within this window never reach the app.
+SEARCH_SUGGEST_MAX_AGE = int(os.getenv("SIL_SEARCH_SUGGEST_MAX_AGE", "300"))
+
+# Change manifest scripts/sync-docs.py writes after each sync: the changed
+# paths and a new content generation id. POST /admin/reload (loopback only)
+# applies it to the running app's caches.
+SYNC_CHANGES_PATH = Path(os.getenv("SIL_SYNC_CHANGES", "docs/.sync-changes.json"))
+
+# Server-side syntax highlighting (opt-in, requires the "highlight" extra).
+# When enabled, fenced code blocks are highlighted once with Pygments at render
+# time and the highlight.js CDN bundle is dropped from page.html.
+SERVER_HIGHLIGHT = os.getenv("SIL_SERVER_HIGHLIGHT", "").lower() in ("1", "true", "yes")
+
+# Glossary auto-linking: the first use of each glossary term on a page links
+# to its entry in foundations/SIL_GLOSSARY.md (on by default; set to 0 to disable)
+GLOSSARY_AUTOLINK = os.getenv("SIL_GLOSSARY_AUTOLINK", "1").lower() in ("1", "true", "yes")
+
 # GitHub (optional)
 GITHUB_TOKEN = None  # Set via environment variable if needed
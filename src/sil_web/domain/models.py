@@ -7,7 +7,8 @@ These models represent the core concepts of the SIL ecosystem.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional
 
 
 class ProjectStatus(Enum):
@@ -101,6 +102,139 @@ class Document:
         return len(self.content.split())
 
 
+@dataclass(frozen=True)
+class TocEntry:
+    """A heading in a document's table of contents."""
+
+    level: int  # 2-4 (h2-h4, matching the renderer's toc_depth)
+    id: str  # Anchor id the toc extension assigns when rendering
+    title: str
+
+
+@dataclass(frozen=True)
+class DocumentSection:
+    """A stretch of a document body under one h2-h4 heading (or before the first)."""
+
+    anchor: Optional[str]  # Heading id (TocEntry.id); None for the text before the first heading
+    title: Optional[str]  # Heading text; None for the text before the first heading
+    level: int  # 2-4, or 1 for the text before the first heading
+    markdown: str  # Section body, heading line excluded; h5/h6 stay within their section
+
+
+@dataclass
+class ParsedDocument:
+    """A markdown file parsed once into everything the site needs from it.
+
+    Produced by services/documents.py; consumed by page routes, the sitemap,
+    ContentService and the llms.txt generators instead of each re-reading
+    and re-scanning the file.
+    """
+
+    raw: str  # File text as written (frontmatter included)
+    content: str  # Frontmatter stripped, H1 kept
+    body: str  # Frontmatter and first H1 stripped (what gets rendered)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    title: Optional[str] = None  # First H1 text, as written
+    toc: list[TocEntry] = field(default_factory=list)
+    sections: list[DocumentSection] = field(default_factory=list)  # body split at the toc headings
+    word_count: int = 0
+    path: Optional[Path] = None
+
+    @property
+    def status(self) -> str:
+        """Lowercased frontmatter status ('' if unset)."""
+        return str(self.metadata.get("status", "")).lower()
+
+    @property
+    def is_draft(self) -> bool:
+        """True if frontmatter reads status: draft (SIL-16 publish gate)."""
+        return self.status == "draft"
+
+
+@dataclass(frozen=True)
+class Snippet:
+    """A passage of a search hit, with the matched terms' character spans."""
+
+    text: str
+    highlights: tuple[tuple[int, int], ...] = ()  # (start, end) offsets into text
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked search result."""
+
+    url: str
+    title: str
+    category: str
+    score: float
+    snippet: Snippet
+    section: str = ""  # Heading of the matched section ("" for the top of the page)
+
+
+@dataclass(frozen=True)
+class SearchResults:
+    """Ranked results for a query."""
+
+    query: str
+    total: int  # Matching sections (hits holds the top ones)
+    hits: list[SearchHit] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class PageSuggestion:
+    """A known page offered in place of a URL that doesn't resolve."""
+
+    url: str
+    title: str
+    score: float  # Similarity to the requested URL (higher is closer)
+
+
+@dataclass(frozen=True)
+class RelatedLink:
+    """A page offered as related reading."""
+
+    url: str
+    title: str
+    score: float  # Cosine similarity of the two pages' TF-IDF vectors
+
+
+@dataclass(frozen=True)
+class Backlink:
+    """A page that links to the page being viewed."""
+
+    url: str
+    title: str
+
+
+@dataclass(frozen=True)
+class ContentChanges:
+    """What one docs sync changed (scripts/sync-docs.py's change manifest).
+
+    Paths are docs/-relative. `previous` is the generation the sync started
+    from: changes can be applied on their own only on top of that generation.
+    """
+
+    generation: str
+    previous: Optional[str]
+    added: tuple[str, ...] = ()
+    modified: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+
+    @property
+    def paths(self) -> tuple[str, ...]:
+        """Every changed path."""
+        return self.added + self.modified + self.removed
+
+
+@dataclass(frozen=True)
+class Completion:
+    """A search-as-you-type suggestion: a label and where it links."""
+
+    label: str
+    url: str
+    kind: str  # "page" (title), "term" (glossary entry) or "heading" (section)
+
+
 @dataclass
 class Author:
     """An author or contributor."""
@@ -2,20 +2,29 @@
 Health check endpoint for monitoring and deployment validation.
 """
 
-from fastapi import APIRouter
+from typing import Any
+
+from fastapi import APIRouter, Request
 
 router = APIRouter()
 
 
 @router.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check(request: Request) -> dict[str, Any]:
     """Health check endpoint.
 
     Returns:
-        Status information for monitoring systems
+        Status information for monitoring systems, plus file I/O pool load
+        (workers, active, queued) when the app runs one
     """
-    return {
+    health: dict[str, Any] = {
         "status": "healthy",
         "service": "sil-website",
         "version": "0.1.0",
     }
+
+    io_pool = getattr(request.app.state, "io_pool", None)
+    if io_pool is not None:
+        health["io_pool"] = io_pool.stats()
+
+    return health
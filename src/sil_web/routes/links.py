@@ -0,0 +1,189 @@
+"""
+The internal link graph over the published docs.
+
+Document pages show the pages linking to them after the content (the page
+routes, routes/pages.py, are given the LinkService). /links.json hands
+agents the whole graph as data -- every page's outbound links and
+backlinks, plus the orphans nothing links to -- which until now could only
+be had by crawling the live site (scripts/check-links.py).
+
+The graph covers the pages search indexes (routes/search.py): the sitemap's
+URLs, private and draft docs excluded. Links to an alias of a page
+(/foundations/founders-letter for /founders-letter) count for the page.
+
+Links are validated against the route table (RouteTable below) as the
+graph is built: /links.json lists the ones that resolve to nothing, and
+`scripts/check-links.py --check` fails the deploy on them before the image
+is built.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Callable
+
+from fastapi import APIRouter, HTTPException
+
+from sil_web.config.settings import IO_WORKERS, SEARCH_CHECK_INTERVAL
+from sil_web.routes.pages import CATEGORY_RESOLVERS, LEGACY_SECTIONS, legacy_redirect
+from sil_web.routes.search import collect_search_pages
+from sil_web.routes.sitemap import CATEGORY_ROUTES, DOCS_ROOT, STATIC_PAGE_DOCS, STATIC_PAGES, category_docs
+from sil_web.services.cache import tree_signature
+from sil_web.services.content import ContentService
+from sil_web.services.fileio import FileIOPool
+from sil_web.services.links import LinkGraph, LinkService
+from sil_web.services.markdown import MarkdownRenderer
+
+
+def page_files() -> dict[str, Path]:
+    """Every URL the sitemap lists -> its source file (aliases included)."""
+    files = dict(STATIC_PAGE_DOCS)
+    for category in CATEGORY_ROUTES:
+        files.update(category_docs(category))
+    return files
+
+
+def resolved_files() -> dict[str, Path]:
+    """Docs served by a category resolver but not listed in the sitemap -> URL.
+
+    /projects/<name> and /meta/<name>: every doc in the section's directory
+    whose slugified name resolves back to it.
+
+    Returns:
+        URL path -> source file, in filename order per section
+    """
+    files = {}
+    for section, resolver in CATEGORY_RESOLVERS.items():
+        directory = DOCS_ROOT / section
+        if section in CATEGORY_ROUTES or not directory.is_dir():
+            continue
+        for path in sorted(directory.glob("*.md")):
+            name = path.stem.lower().replace("_", "-")
+            if name != "readme" and resolver(name) == path:
+                files[f"/{section}/{name}"] = path
+    return files
+
+
+class RouteTable:
+    """Every URL path a link may point to, for validating links.
+
+    Exact paths come from a table built once per graph build: the static
+    pages, every sitemap URL and alias, the resolver-served docs outside the
+    sitemap (/projects, /meta), public essays, the app's fixed routes and
+    their raw-markdown (.md) twins. The page URLs alone are `pages`. Paths outside it get what the
+    page routes themselves would do with them: legacy URLs follow their
+    redirect, and /{category}/{name} variants (/foundations/SIL_GLOSSARY)
+    go through the category's filename resolver -- memoized, so each
+    distinct variant costs its resolver's lookups once.
+
+    Usage:
+        routes = RouteTable(content_service, extra=["/search"])
+        "/systems/reveal" in routes
+    """
+
+    def __init__(self, content_service: ContentService | None = None, extra: Iterable[str] = ()):
+        """Build the exact-path table.
+
+        Args:
+            content_service: Source of the public essays (/essays/<slug>)
+            extra: Further fixed paths (the app's non-document routes)
+        """
+        pages = set(STATIC_PAGES) | set(page_files()) | set(resolved_files())
+        if content_service is not None:
+            essays = content_service.list_documents(category="essays", include_private=False)
+            pages.update(f"/essays/{doc.slug}" for doc in essays)
+        self.pages = frozenset(pages)
+        self.paths = frozenset(pages | {f"{page}.md" for page in pages} | set(extra))
+        self._resolved: dict[str, bool] = {}
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, str):
+            return False
+        if path in self.paths:
+            return True
+        if path not in self._resolved:
+            self._resolved[path] = self._resolves(path)
+        return self._resolved[path]
+
+    def _resolves(self, path: str) -> bool:
+        page = path[: -len(".md")] if path.endswith(".md") else path
+        section, _, name = page.strip("/").partition("/")
+        if section in LEGACY_SECTIONS:
+            return legacy_redirect(section, name) in self
+        resolver = CATEGORY_RESOLVERS.get(section)
+        return bool(name) and "/" not in name and resolver is not None and resolver(name) is not None
+
+
+def create_link_service(
+    markdown_renderer: MarkdownRenderer,
+    content_service: ContentService | None = None,
+    check_interval: float = SEARCH_CHECK_INTERVAL,
+    extra_routes: Callable[[], Iterable[str]] | None = None,
+) -> LinkService:
+    """Link graph over the published docs, rebuilt when they change.
+
+    Args:
+        markdown_renderer: Renders the pages (its cache is shared with the page views)
+        content_service: Source of the content generation (rebuild on change)
+        check_interval: Seconds between docs tree change checks
+        extra_routes: The app's fixed non-document paths (/search, /llms.txt, ...),
+            read at each build so routers mounted later count
+
+    Returns:
+        LinkService (graph built on first use)
+    """
+    return LinkService(
+        collect_search_pages,
+        lambda: tree_signature([DOCS_ROOT]),
+        lambda page: markdown_renderer.render_document(page.document),
+        content_service,
+        check_interval=check_interval,
+        aliases=page_files,
+        routes=lambda: RouteTable(content_service, extra_routes() if extra_routes is not None else ()),
+    )
+
+
+def _page(graph: LinkGraph, url: str) -> dict[str, Any]:
+    return {
+        "title": graph.titles[url],
+        "links": list(graph.links(url)),
+        "backlinks": [link.url for link in graph.backlinks(url)],
+        "broken": list(graph.broken.get(url, ())),
+    }
+
+
+def create_links_router(link_service: LinkService, io_pool: FileIOPool | None = None) -> APIRouter:
+    """Create the link graph API.
+
+    Args:
+        link_service: Graph to serve
+        io_pool: Thread pool for graph (re)builds (a private one if omitted)
+
+    Returns:
+        Router serving /links.json
+    """
+    router = APIRouter()
+    pool = io_pool if io_pool is not None else FileIOPool(max_workers=IO_WORKERS)
+
+    @router.get("/links.json")
+    async def links_json(url: str = "") -> dict[str, Any]:
+        """Internal links of one page, or of every page.
+
+        Returns:
+            With ?url=: url, title, links (outbound), backlinks and broken
+            (links that resolve to no route); without: pages (every page URL
+            -> the same), orphans and broken (page URL -> its broken links)
+        """
+        graph = await pool.run(lambda: link_service.graph)
+        if not url:
+            return {
+                "pages": {page: _page(graph, page) for page in graph.outbound},
+                "orphans": list(graph.orphans),
+                "broken": {page: list(targets) for page, targets in graph.broken.items()},
+            }
+        if url not in graph.outbound:
+            raise HTTPException(status_code=404, detail=f"Page not found: {url}")
+        return {"url": url, **_page(graph, url)}
+
+    return router
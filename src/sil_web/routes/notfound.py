@@ -0,0 +1,145 @@
+"""
+404 handling with "did you mean" suggestions.
+
+Agents and people guess URLs (/systems/revael, /foundations/FOUNDERS_LETTER,
+/essay/...). Instead of a bare 404, every not-found response carries the
+nearest real pages from a trigram index (services/suggest.py) over the
+site's route table (routes/links.py: the sitemap's pages plus the
+/projects and /meta docs, aliases folded, private and draft docs excluded),
+rebuilt when the docs change:
+
+- JSON (the default): {"detail": ..., "suggestions": [{url, title, score}]}
+- HTML (Accept: text/html): a 404 page in the site shell listing them
+
+Other HTTP errors keep FastAPI's default handling.
+"""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable
+
+from fastapi import Request
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import HTMLResponse, JSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.responses import Response
+
+from sil_web.config.settings import IO_WORKERS, SEARCH_CHECK_INTERVAL
+from sil_web.domain.models import PageSuggestion
+from sil_web.routes.links import RouteTable, page_files, resolved_files
+from sil_web.routes.search import collect_search_pages
+from sil_web.routes.sitemap import DOCS_ROOT
+from sil_web.services.cache import GenerationCache, tree_signature
+from sil_web.services.content import ContentService
+from sil_web.services.documents import read_document
+from sil_web.services.fileio import FileIOPool
+from sil_web.services.suggest import KnownPage, TrigramIndex
+from sil_web.services.templates import PageShell
+from sil_web.ui.components import not_found_page
+
+# Suggestions per 404
+MAX_SUGGESTIONS = 3
+
+
+def _path_title(url: str) -> str:
+    return url.rstrip("/").rsplit("/", 1)[-1].replace("-", " ").title() or "Home"
+
+
+def collect_known_pages(content_service: ContentService | None = None) -> list[KnownPage]:
+    """Every public page URL in the route table, titled.
+
+    Args:
+        content_service: Source of the public essays (as for RouteTable)
+
+    Returns:
+        Published docs (as indexed for search), then the route table's other
+        pages in URL order, titled by their doc's H1 or else from their
+        path. Aliases of a listed doc, and private or draft docs, are left
+        out.
+    """
+    search_pages = collect_search_pages()
+    pages = [KnownPage(page.url, page.title) for page in search_pages]
+    seen_urls = {page.url for page in pages}
+    seen_files = {page.document.path for page in search_pages}
+    files = {**page_files(), **resolved_files()}
+    for url in sorted(RouteTable(content_service).pages - seen_urls):
+        path = files.get(url)
+        doc = None
+        if path is not None:
+            if path in seen_files:
+                continue
+            seen_files.add(path)
+            doc = read_document(path)
+        if doc is not None and (doc.metadata.get("private", False) or doc.is_draft):
+            continue
+        pages.append(KnownPage(url, doc.title if doc is not None and doc.title else _path_title(url)))
+    return pages
+
+
+def create_suggestion_index(
+    content_service: ContentService | None = None,
+    check_interval: float = SEARCH_CHECK_INTERVAL,
+) -> GenerationCache[TrigramIndex]:
+    """Trigram index over the known pages, rebuilt when the docs change.
+
+    Args:
+        content_service: Source of the content generation (rebuild on change)
+        check_interval: Seconds between docs tree change checks
+
+    Returns:
+        Cache whose get() returns the current TrigramIndex
+    """
+    return GenerationCache(
+        lambda: TrigramIndex(collect_known_pages(content_service)),
+        lambda: tree_signature([DOCS_ROOT]),
+        content_service,
+        check_interval=check_interval,
+        name="suggest-trigrams",
+    )
+
+
+def _wants_html(request: Request) -> bool:
+    return "text/html" in request.headers.get("accept", "")
+
+
+def create_not_found_handler(
+    suggestions: GenerationCache[TrigramIndex],
+    page_shell: PageShell | None = None,
+    io_pool: FileIOPool | None = None,
+) -> Callable[[Request, Exception], Awaitable[Response]]:
+    """Create the app's HTTPException handler, adding suggestions to 404s.
+
+    Args:
+        suggestions: Trigram index cache (create_suggestion_index)
+        page_shell: page.html shell for HTML 404s (JSON only if omitted)
+        io_pool: Thread pool for index (re)builds (a private one if omitted)
+
+    Returns:
+        Handler for app.add_exception_handler(StarletteHTTPException, ...)
+    """
+    pool = io_pool if io_pool is not None else FileIOPool(max_workers=IO_WORKERS)
+
+    def suggest(path: str) -> list[PageSuggestion]:
+        return suggestions.get().suggest(path, limit=MAX_SUGGESTIONS)
+
+    async def handle_http_exception(request: Request, exc: Exception) -> Response:
+        if not isinstance(exc, StarletteHTTPException):
+            raise exc
+        if exc.status_code != 404:
+            return await http_exception_handler(request, exc)
+
+        path = request.url.path
+        nearest = await pool.run(suggest, path)
+        if page_shell is not None and _wants_html(request):
+            # No nav section is active, and a shell is cached per current_page:
+            # keying on the requested path would cache one per distinct bad URL
+            html = page_shell.render("Page not found", not_found_page(path, nearest), "")
+            return HTMLResponse(html, status_code=404, headers=exc.headers)
+
+        body = {
+            "detail": exc.detail,
+            "suggestions": [{"url": s.url, "title": s.title, "score": s.score} for s in nearest],
+        }
+        return JSONResponse(body, status_code=404, headers=exc.headers)
+
+    return handle_http_exception
@@ -5,24 +5,39 @@ Page routes for SIL website - technical documentation and research.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
-import frontmatter
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from starlette.responses import Response
 
+from sil_web.config.settings import IO_WORKERS, TEMPLATE_AUTO_RELOAD, TEMPLATE_CACHE_DIR, TEMPLATES_PATH
+from sil_web.domain.models import Document
 from sil_web.services.content import ContentService
+from sil_web.services.documents import read_document
+from sil_web.services.fileio import FileIOPool
+from sil_web.services.templates import NavFragments, PageShell, create_template_environment
+from sil_web.ui.components import backlinks, related_reading, search_results
 
 if TYPE_CHECKING:
+    from sil_web.services.links import LinkService
     from sil_web.services.markdown import MarkdownRenderer
     from sil_web.services.metrics import MetricsService
+    from sil_web.services.related import RelatedService
+    from sil_web.services.search import SearchService
 
 router = APIRouter()
 
-# Templates
-templates = Jinja2Templates(directory="templates")
+# Templates: production environment (no per-render stat checks outside
+# development, compiled bytecode cached on disk across workers/restarts)
+templates = Jinja2Templates(
+    env=create_template_environment(
+        TEMPLATES_PATH,
+        auto_reload=TEMPLATE_AUTO_RELOAD,
+        bytecode_cache_dir=TEMPLATE_CACHE_DIR,
+    )
+)
 
 
 # =============================================================================
@@ -67,15 +82,11 @@ def is_draft_article(path: Path) -> bool:
     them into the website repo ahead of time) -- this is the actual publish
     gate that keeps them off every public surface until flipped to
     "published". Checked here (shared by the HTML and raw-markdown article
-    routes) and independently in routes/sitemap.py and the llms.txt/
-    llms-full.txt generators in scripts/, since none of those share this
-    module.
+    routes and routes/sitemap.py) and by the llms.txt/llms-full.txt
+    generators in scripts/, all through the same ParsedDocument.is_draft.
     """
-    try:
-        post = frontmatter.load(path)
-    except (OSError, ValueError):
-        return False
-    return str(post.metadata.get("status", "")).lower() == "draft"
+    doc = read_document(path)
+    return doc is not None and doc.is_draft
 
 
 def _resolve_articles(slug: str) -> Path | None:
@@ -94,6 +105,8 @@ def _resolve_research(name: str) -> Path | None:
     if root_candidate.exists():
         return root_candidate
     research_dir = Path("docs/research")
+    if not research_dir.is_dir():
+        return None
     for subdir in research_dir.iterdir():
         if subdir.is_dir():
             candidate = subdir / filename
@@ -140,6 +153,41 @@ CATEGORY_RESOLVERS = {
     "meta": _resolve_meta,
 }
 
+# Legacy section -> the section that replaced it (old site structure)
+LEGACY_SECTIONS = {
+    "tools": "/systems",
+    "innovations": "/systems",
+    "canonical": "/foundations",
+}
+
+# /canonical/{name} docs that moved somewhere other than /foundations/{name}
+LEGACY_CANONICAL_MOVES = {
+    "manifesto": "/manifesto",
+    "yolo": "/manifesto/yolo",
+}
+
+
+def legacy_redirect(section: str, name: str = "") -> str:
+    """Where a legacy URL now lives (the 301 target of its redirect route).
+
+    Shared by the redirect routes below and the link checker
+    (routes/links.py), so a link to an old URL is valid exactly when its
+    redirect lands on a page.
+
+    Args:
+        section: Key of LEGACY_SECTIONS
+        name: Page name under it ("" for the section itself)
+
+    Returns:
+        Current URL path
+    """
+    if not name:
+        return LEGACY_SECTIONS[section]
+    if section == "canonical" and name in LEGACY_CANONICAL_MOVES:
+        return LEGACY_CANONICAL_MOVES[name]
+    return f"{LEGACY_SECTIONS[section]}/{name}"
+
+
 # category -> index doc, for /{category}.md
 CATEGORY_INDEX_DOCS = {
     "manifesto": Path("docs/manifesto/README.md"),
@@ -161,60 +209,184 @@ ROOT_PAGE_DOCS = {
 }
 
 
+# Navigation items for SIL (Lab-focused, Bell Labs structure)
+NAV_ITEMS = [
+    {"label": "Home", "url": "/"},
+    {"label": "Manifesto", "url": "/manifesto"},
+    {"label": "Research", "url": "/research"},
+    {"label": "Systems", "url": "/systems"},
+    {"label": "Articles", "url": "/articles"},
+    {"label": "Foundations", "url": "/foundations"},
+    {"label": "About", "url": "/about"},
+    {"label": "Contact", "url": "/contact"},
+]
+
+
+def create_page_shell(
+    content_service: ContentService,
+    markdown_renderer: "MarkdownRenderer",
+    metrics_service: "MetricsService | None" = None,
+) -> PageShell:
+    """Create the page.html shell shared by the page routes and error pages.
+
+    The shell is pre-rendered once per active nav section (and content
+    generation) from cached nav fragments; per-request work is the title
+    and the rendered body.
+
+    Args:
+        content_service: Content management service (nav fragments' generation)
+        markdown_renderer: Markdown rendering service (server highlight flag)
+        metrics_service: Metrics service (optional, for canonical metrics)
+
+    Returns:
+        Warmed PageShell
+    """
+    # page.html drops the highlight.js CDN bundle when code is pre-highlighted
+    templates.env.globals["server_highlight"] = markdown_renderer.highlight_enabled
+
+    nav_fragments = NavFragments(NAV_ITEMS, content_service)
+    shell_context: dict[str, Any] = {}
+    if metrics_service is not None:
+        shell_context["metrics"] = metrics_service.metrics
+    page_shell = PageShell(templates.env, "page.html", shell_context, fragments=nav_fragments)
+    page_shell.warm(item["url"] for item in NAV_ITEMS)
+    return page_shell
+
+
 def create_routes(
     content_service: ContentService,
     project_service: None,  # Not used for SIL
     markdown_renderer: "MarkdownRenderer",
     metrics_service: "MetricsService | None" = None,
+    io_pool: FileIOPool | None = None,
+    search_service: "SearchService | None" = None,
+    page_shell: PageShell | None = None,
+    related_service: "RelatedService | None" = None,
+    link_service: "LinkService | None" = None,
 ) -> APIRouter:
     """Create routes with injected services.
 
+    Handlers never touch the filesystem on the event loop: resolving,
+    reading, parsing and (cold) rendering all run on io_pool.
+
     Args:
         content_service: Content management service
         project_service: Not used for SIL (kept for compatibility)
         markdown_renderer: Markdown rendering service
         metrics_service: Metrics service (optional, for canonical metrics)
+        io_pool: Thread pool for blocking file work (a private one if omitted)
+        search_service: Full-text index behind /search (optional; no /search without it)
+        page_shell: Shared page.html shell (built here if omitted)
+        related_service: Related-reading graph shown after each document (optional)
+        link_service: Link graph whose backlinks are shown after each document (optional)
     """
+    if io_pool is None:
+        io_pool = FileIOPool(max_workers=IO_WORKERS)
+
+    if page_shell is None:
+        page_shell = create_page_shell(content_service, markdown_renderer, metrics_service)
+
+    # -------------------------------------------------------------------------
+    # Blocking stages (run on io_pool, never on the event loop)
+    # -------------------------------------------------------------------------
+
+    def load_and_render(doc_path: Path | None) -> tuple[str | None, str] | None:
+        """Read, parse and render a document: (H1 title, HTML), or None if missing."""
+        doc = read_document(doc_path) if doc_path is not None else None
+        if doc is None:
+            return None
+        return doc.title, markdown_renderer.render_document(doc)
+
+    def with_asides(html_content: str, key: Path | str) -> str:
+        """Document HTML followed by its related reading and backlinks (for each graph there is)."""
+        if related_service is not None:
+            html_content += related_reading(related_service.related(key))
+        if link_service is not None:
+            html_content += backlinks(link_service.backlinks(key))
+        return html_content
+
+    def resolve_and_render(resolver: Callable[[str], Path | None], name: str) -> tuple[str | None, str] | None:
+        """Resolve a category URL name to its file, then load_and_render it (plus asides)."""
+        doc_path = resolver(name)
+        rendered = load_and_render(doc_path)
+        if rendered is None or doc_path is None:
+            return None
+        return rendered[0], with_asides(rendered[1], doc_path)
+
+    def essays_index_markdown() -> str:
+        """Generated essays listing (privacy-filtered through ContentService)."""
+        essay_docs = content_service.list_documents(category="essays", include_private=False)
+        md_content = "# Essays\n\nTechnical essays on semantic infrastructure.\n\n"
+        for essay in sorted(essay_docs, key=lambda d: d.order):
+            md_content += f"- [{essay.title}](/essays/{essay.slug})\n"
+        if not essay_docs:
+            md_content += "*No essays published yet.*\n"
+        return md_content
+
+    def load_public_essay(slug: str) -> Document | None:
+        """Essay by slug, or None if missing or private."""
+        # Use content_service to load essay with privacy filtering (Layer 2: Service)
+        doc = content_service.load_document("essays", slug, include_private=False)
+
+        # Layer 3: Route safety check - 404 for private or non-existent documents
+        if not doc:
+            return None
+
+        # Additional safety: Check if document is private (defense-in-depth)
+        if doc.private:
+            return None
+        return doc
 
-    # Navigation items for SIL (Lab-focused, Bell Labs structure)
-    nav_items = [
-        {"label": "Home", "url": "/"},
-        {"label": "Manifesto", "url": "/manifesto"},
-        {"label": "Research", "url": "/research"},
-        {"label": "Systems", "url": "/systems"},
-        {"label": "Articles", "url": "/articles"},
-        {"label": "Foundations", "url": "/foundations"},
-        {"label": "About", "url": "/about"},
-        {"label": "Contact", "url": "/contact"},
-    ]
-
-    def render_markdown_page(
+    def render_essay(slug: str) -> tuple[str, str] | None:
+        """Public essay's (title, HTML), or None if missing or private."""
+        doc = load_public_essay(slug)
+        if doc is None:
+            return None
+        return doc.title, with_asides(markdown_renderer.render(doc.content), f"/essays/{doc.slug}")
+
+    # -------------------------------------------------------------------------
+    # Async helpers used by the handlers
+    # -------------------------------------------------------------------------
+
+    def render_page(title: str, html_content: str, current_page: str) -> Response:
+        """Assemble page.html around already-rendered content."""
+        return HTMLResponse(page_shell.render(title, html_content, current_page))
+
+    async def render_markdown_page(
         request: Request,
         page_path: Path,
         title: str,
         current_page: str,
     ) -> Response:
         """Helper to render a markdown page."""
-        if not page_path.exists():
+        rendered = await io_pool.run(load_and_render, page_path)
+        if rendered is None:
             raise HTTPException(status_code=404, detail=f"Page not found: {page_path}")
 
-        content = page_path.read_text()
-        html_content = markdown_renderer.render(content)
-
-        # Build template context
-        context = {
-            "request": request,
-            "title": title,
-            "content": html_content,
-            "nav_items": nav_items,
-            "current_page": current_page,
-        }
-
-        # Add metrics if service is available
-        if metrics_service is not None:
-            context["metrics"] = metrics_service.metrics
+        return render_page(title, rendered[1], current_page)
 
-        return templates.TemplateResponse("page.html", context)
+    async def render_resolved_doc(
+        resolver: Callable[[str], Path | None],
+        name: str,
+        fallback_title: str,
+        current_page: str,
+        not_found: str,
+    ) -> Response:
+        """Helper to render a resolved category document, titled by its H1."""
+        rendered = await io_pool.run(resolve_and_render, resolver, name)
+        if rendered is None:
+            raise HTTPException(status_code=404, detail=not_found)
+
+        doc_title, html_content = rendered
+        title = f"{doc_title} - SIL" if doc_title is not None else fallback_title
+        return render_page(title, html_content, current_page)
+
+    async def raw_response(doc_path: Path | None, not_found: str) -> Response:
+        """Helper to serve a document's source exactly as written."""
+        doc = await io_pool.run(read_document, doc_path) if doc_path is not None else None
+        if doc is None:
+            raise HTTPException(status_code=404, detail=not_found)
+        return Response(doc.raw, media_type="text/markdown; charset=utf-8")
 
     # =========================================================================
     # Raw Markdown Source (per-page llms.txt convention: /{page}.md)
@@ -232,24 +404,13 @@ def create_routes(
         full_path = full_path.strip("/")
 
         if full_path in ROOT_PAGE_DOCS:
-            doc_path = ROOT_PAGE_DOCS[full_path]
-            if doc_path.exists():
-                return Response(doc_path.read_text(), media_type="text/markdown; charset=utf-8")
-            raise HTTPException(status_code=404, detail=f"Page not found: {full_path}")
+            return await raw_response(ROOT_PAGE_DOCS[full_path], f"Page not found: {full_path}")
 
         if full_path in CATEGORY_INDEX_DOCS:
-            doc_path = CATEGORY_INDEX_DOCS[full_path]
-            if doc_path.exists():
-                return Response(doc_path.read_text(), media_type="text/markdown; charset=utf-8")
-            raise HTTPException(status_code=404, detail=f"Page not found: {full_path}")
+            return await raw_response(CATEGORY_INDEX_DOCS[full_path], f"Page not found: {full_path}")
 
         if full_path == "essays":
-            essay_docs = content_service.list_documents(category="essays", include_private=False)
-            md_content = "# Essays\n\nTechnical essays on semantic infrastructure.\n\n"
-            for essay in sorted(essay_docs, key=lambda d: d.order):
-                md_content += f"- [{essay.title}](/essays/{essay.slug})\n"
-            if not essay_docs:
-                md_content += "*No essays published yet.*\n"
+            md_content = await io_pool.run(essays_index_markdown)
             return Response(md_content, media_type="text/markdown; charset=utf-8")
 
         if "/" not in full_path:
@@ -258,20 +419,17 @@ def create_routes(
         category, name = full_path.split("/", 1)
 
         if category == "essays":
-            doc = content_service.load_document("essays", name, include_private=False)
-            if not doc or doc.private:
+            essay_doc = await io_pool.run(load_public_essay, name)
+            if essay_doc is None:
                 raise HTTPException(status_code=404, detail=f"Essay not found: {name}")
-            return Response(doc.content, media_type="text/markdown; charset=utf-8")
+            return Response(essay_doc.content, media_type="text/markdown; charset=utf-8")
 
         resolver = CATEGORY_RESOLVERS.get(category)
         if resolver is None:
             raise HTTPException(status_code=404, detail=f"Page not found: {full_path}")
 
-        resolved_path = resolver(name)
-        if resolved_path is None:
-            raise HTTPException(status_code=404, detail=f"Document not found: {full_path}")
-
-        return Response(resolved_path.read_text(), media_type="text/markdown; charset=utf-8")
+        resolved_path = await io_pool.run(resolver, name)
+        return await raw_response(resolved_path, f"Document not found: {full_path}")
 
     # =========================================================================
     # Core Pages
@@ -280,7 +438,7 @@ def create_routes(
     @router.get("/", response_class=HTMLResponse)
     async def index(request: Request) -> Response:
         """Homepage - Technical lab landing."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/pages/index.md"),
             "Semantic Infrastructure Lab",
@@ -290,7 +448,7 @@ def create_routes(
     @router.get("/about", response_class=HTMLResponse)
     async def about(request: Request) -> Response:
         """About page - The lab and team."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/pages/about.md"),
             "About - Semantic Infrastructure Lab",
@@ -300,7 +458,7 @@ def create_routes(
     @router.get("/contact", response_class=HTMLResponse)
     async def contact(request: Request) -> Response:
         """Contact page - Collaboration and inquiries."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/pages/contact.md"),
             "Contact - Semantic Infrastructure Lab",
@@ -314,7 +472,7 @@ def create_routes(
     @router.get("/manifesto", response_class=HTMLResponse)
     async def manifesto_index(request: Request) -> Response:
         """Manifesto - YOLO and soul documents."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/manifesto/README.md"),
             "Manifesto - Semantic Infrastructure Lab",
@@ -324,28 +482,12 @@ def create_routes(
     @router.get("/manifesto/{name}", response_class=HTMLResponse)
     async def manifesto_doc(request: Request, name: str) -> Response:
         """Individual manifesto document."""
-        doc_path = _resolve_manifesto(name)
-
-        if doc_path is None:
-            raise HTTPException(status_code=404, detail=f"Manifesto document not found: {name}")
-
-        content = doc_path.read_text()
-        title = f"{name.title()} - SIL"
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip() + " - SIL"
-                break
-
-        html_content = markdown_renderer.render(content)
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": title,
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/manifesto",
-            },
+        return await render_resolved_doc(
+            _resolve_manifesto,
+            name,
+            f"{name.title()} - SIL",
+            "/manifesto",
+            not_found=f"Manifesto document not found: {name}",
         )
 
     # =========================================================================
@@ -355,7 +497,7 @@ def create_routes(
     @router.get("/foundations", response_class=HTMLResponse)
     async def foundations_index(request: Request) -> Response:
         """Foundations - Core principles and architecture."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/foundations/README.md"),
             "Foundations - Semantic Infrastructure Lab",
@@ -365,28 +507,12 @@ def create_routes(
     @router.get("/foundations/{name}", response_class=HTMLResponse)
     async def foundations_doc(request: Request, name: str) -> Response:
         """Individual foundations document."""
-        doc_path = _resolve_foundations(name)
-
-        if doc_path is None:
-            raise HTTPException(status_code=404, detail=f"Foundations document not found: {name}")
-
-        content = doc_path.read_text()
-        title = f"{name.replace('-', ' ').title()} - SIL"
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip() + " - SIL"
-                break
-
-        html_content = markdown_renderer.render(content)
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": title,
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/foundations",
-            },
+        return await render_resolved_doc(
+            _resolve_foundations,
+            name,
+            f"{name.replace('-', ' ').title()} - SIL",
+            "/foundations",
+            not_found=f"Foundations document not found: {name}",
         )
 
     # =========================================================================
@@ -396,7 +522,7 @@ def create_routes(
     @router.get("/systems", response_class=HTMLResponse)
     async def systems_index(request: Request) -> Response:
         """Systems index - Production tools and implementations."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/systems/README.md"),
             "Systems - Semantic Infrastructure Lab",
@@ -406,28 +532,12 @@ def create_routes(
     @router.get("/systems/{name}", response_class=HTMLResponse)
     async def system_page(request: Request, name: str) -> Response:
         """Individual system documentation."""
-        system_path = _resolve_systems(name)
-
-        if system_path is None:
-            raise HTTPException(status_code=404, detail=f"System not found: {name}")
-
-        content = system_path.read_text()
-        title = f"{name.title()} - SIL"
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip() + " - SIL"
-                break
-
-        html_content = markdown_renderer.render(content)
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": title,
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/systems",
-            },
+        return await render_resolved_doc(
+            _resolve_systems,
+            name,
+            f"{name.title()} - SIL",
+            "/systems",
+            not_found=f"System not found: {name}",
         )
 
     # =========================================================================
@@ -437,7 +547,7 @@ def create_routes(
     @router.get("/articles", response_class=HTMLResponse)
     async def articles_index(request: Request) -> Response:
         """Articles index - Technical articles and tutorials."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/articles/README.md"),
             "Articles - Semantic Infrastructure Lab",
@@ -447,31 +557,12 @@ def create_routes(
     @router.get("/articles/{slug}", response_class=HTMLResponse)
     async def article(request: Request, slug: str) -> Response:
         """Serve articles by slug."""
-        article_path = _resolve_articles(slug)
-
-        if article_path is None:
-            raise HTTPException(status_code=404, detail=f"Article not found: {slug}")
-
-        content = article_path.read_text()
-
-        # Extract title from first H1 if present
-        title = "Article - Semantic Infrastructure Lab"
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip() + " - SIL"
-                break
-
-        html_content = markdown_renderer.render(content)
-
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": title,
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/articles",
-            },
+        return await render_resolved_doc(
+            _resolve_articles,
+            slug,
+            "Article - Semantic Infrastructure Lab",
+            "/articles",
+            not_found=f"Article not found: {slug}",
         )
 
     # =========================================================================
@@ -481,57 +572,22 @@ def create_routes(
     @router.get("/essays", response_class=HTMLResponse)
     async def essays_index(request: Request) -> Response:
         """Essays index - List all technical essays."""
-        # Use content_service to load essays with privacy filtering
-        essay_docs = content_service.list_documents(category="essays", include_private=False)
-
-        # Generate markdown content for essay list
-        md_content = "# Essays\n\nTechnical essays on semantic infrastructure.\n\n"
-        for doc in sorted(essay_docs, key=lambda d: d.order):
-            md_content += f"- [{doc.title}](/essays/{doc.slug})\n"
-
-        if not essay_docs:
-            md_content += "*No essays published yet.*\n"
+        # Listing (ContentService, privacy-filtered) and render run off the loop
+        md_content = await io_pool.run(essays_index_markdown)
+        html_content = await io_pool.run(markdown_renderer.render, md_content)
 
-        html_content = markdown_renderer.render(md_content)
-
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": "Essays - Semantic Infrastructure Lab",
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/essays",
-            },
-        )
+        return render_page("Essays - Semantic Infrastructure Lab", html_content, "/essays")
 
     @router.get("/essays/{slug}", response_class=HTMLResponse)
     async def essay(request: Request, slug: str) -> Response:
         """Serve essays by slug with privacy filtering."""
-        # Use content_service to load essay with privacy filtering (Layer 2: Service)
-        doc = content_service.load_document("essays", slug, include_private=False)
-
-        # Layer 3: Route safety check - 404 for private or non-existent documents
-        if not doc:
-            raise HTTPException(status_code=404, detail=f"Essay not found: {slug}")
-
-        # Additional safety: Check if document is private (defense-in-depth)
-        if doc.private:
+        # Privacy-filtered load (service + route checks) and render, off the loop
+        rendered = await io_pool.run(render_essay, slug)
+        if rendered is None:
             raise HTTPException(status_code=404, detail=f"Essay not found: {slug}")
 
-        title = doc.title + " - SIL"
-        html_content = markdown_renderer.render(doc.content)
-
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": title,
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/essays",
-            },
-        )
+        doc_title, html_content = rendered
+        return render_page(doc_title + " - SIL", html_content, "/essays")
 
     # =========================================================================
     # Research Section
@@ -540,7 +596,7 @@ def create_routes(
     @router.get("/research", response_class=HTMLResponse)
     async def research(request: Request) -> Response:
         """Research page - Deep technical papers."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/research/README.md"),
             "Research - Semantic Infrastructure Lab",
@@ -550,31 +606,12 @@ def create_routes(
     @router.get("/research/{name}", response_class=HTMLResponse)
     async def research_paper(request: Request, name: str) -> Response:
         """Individual research paper - handles both flat and subdirectory structure."""
-        paper_path = _resolve_research(name)
-
-        if paper_path is None:
-            raise HTTPException(status_code=404, detail=f"Research paper not found: {name}")
-
-        content = paper_path.read_text()
-
-        # Extract title from first H1
-        title = f"{name.replace('-', ' ').title()} - SIL Research"
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip() + " - SIL"
-                break
-
-        html_content = markdown_renderer.render(content)
-
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": title,
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/research",
-            },
+        return await render_resolved_doc(
+            _resolve_research,
+            name,
+            f"{name.replace('-', ' ').title()} - SIL Research",
+            "/research",
+            not_found=f"Research paper not found: {name}",
         )
 
     # =========================================================================
@@ -584,7 +621,7 @@ def create_routes(
     @router.get("/architecture", response_class=HTMLResponse)
     async def architecture_index(request: Request) -> Response:
         """Architecture - System design and technical architecture."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/architecture/README.md"),
             "Architecture - Semantic Infrastructure Lab",
@@ -594,28 +631,12 @@ def create_routes(
     @router.get("/architecture/{name}", response_class=HTMLResponse)
     async def architecture_doc(request: Request, name: str) -> Response:
         """Individual architecture document."""
-        doc_path = _resolve_architecture(name)
-
-        if doc_path is None:
-            raise HTTPException(status_code=404, detail=f"Architecture document not found: {name}")
-
-        content = doc_path.read_text()
-        title = f"{name.replace('-', ' ').title()} - SIL Architecture"
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip() + " - SIL"
-                break
-
-        html_content = markdown_renderer.render(content)
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": title,
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/architecture",
-            },
+        return await render_resolved_doc(
+            _resolve_architecture,
+            name,
+            f"{name.replace('-', ' ').title()} - SIL Architecture",
+            "/architecture",
+            not_found=f"Architecture document not found: {name}",
         )
 
     # =========================================================================
@@ -625,7 +646,7 @@ def create_routes(
     @router.get("/projects", response_class=HTMLResponse)
     async def projects_index(request: Request) -> Response:
         """Projects - SIL project catalog and documentation."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/projects/README.md"),
             "Projects - Semantic Infrastructure Lab",
@@ -635,30 +656,26 @@ def create_routes(
     @router.get("/projects/{name}", response_class=HTMLResponse)
     async def project_doc(request: Request, name: str) -> Response:
         """Individual project document."""
-        doc_path = _resolve_projects(name)
-
-        if doc_path is None:
-            raise HTTPException(status_code=404, detail=f"Project document not found: {name}")
-
-        content = doc_path.read_text()
-        title = f"{name.replace('-', ' ').title()} - SIL Projects"
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip() + " - SIL"
-                break
-
-        html_content = markdown_renderer.render(content)
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": title,
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/projects",
-            },
+        return await render_resolved_doc(
+            _resolve_projects,
+            name,
+            f"{name.replace('-', ' ').title()} - SIL Projects",
+            "/projects",
+            not_found=f"Project document not found: {name}",
         )
 
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    if search_service is not None:
+
+        @router.get("/search", response_class=HTMLResponse)
+        async def search(request: Request, q: str = "") -> Response:
+            """Full-text search over the published docs (JSON: /search.json)."""
+            results = await io_pool.run(search_service.search, q) if q.strip() else None
+            return render_page("Search - Semantic Infrastructure Lab", search_results(q, results), "/search")
+
     # =========================================================================
     # Legacy Redirects (Old structure -> New structure)
     # =========================================================================
@@ -667,44 +684,37 @@ def create_routes(
     async def tools_redirect(request: Request) -> Response:
         """Redirect /tools to /systems."""
         from fastapi.responses import RedirectResponse
-        return RedirectResponse(url="/systems", status_code=301)
+        return RedirectResponse(url=legacy_redirect("tools"), status_code=301)
 
     @router.get("/tools/{name}", response_class=HTMLResponse)
     async def tool_redirect(request: Request, name: str) -> Response:
         """Redirect /tools/{name} to /systems/{name}."""
         from fastapi.responses import RedirectResponse
-        return RedirectResponse(url=f"/systems/{name}", status_code=301)
+        return RedirectResponse(url=legacy_redirect("tools", name), status_code=301)
 
     @router.get("/innovations", response_class=HTMLResponse)
     async def innovations_redirect(request: Request) -> Response:
         """Redirect /innovations to /systems."""
         from fastapi.responses import RedirectResponse
-        return RedirectResponse(url="/systems", status_code=301)
+        return RedirectResponse(url=legacy_redirect("innovations"), status_code=301)
 
     @router.get("/innovations/{name}", response_class=HTMLResponse)
     async def innovation_redirect(request: Request, name: str) -> Response:
         """Redirect /innovations/{name} to /systems/{name}."""
         from fastapi.responses import RedirectResponse
-        return RedirectResponse(url=f"/systems/{name}", status_code=301)
+        return RedirectResponse(url=legacy_redirect("innovations", name), status_code=301)
 
     @router.get("/canonical", response_class=HTMLResponse)
     async def canonical_redirect(request: Request) -> Response:
         """Redirect /canonical to /foundations."""
         from fastapi.responses import RedirectResponse
-        return RedirectResponse(url="/foundations", status_code=301)
+        return RedirectResponse(url=legacy_redirect("canonical"), status_code=301)
 
     @router.get("/canonical/{name}", response_class=HTMLResponse)
     async def canonical_doc_redirect(request: Request, name: str) -> Response:
         """Redirect /canonical/{name} to appropriate new location."""
         from fastapi.responses import RedirectResponse
-        # Map common canonical docs to new structure
-        if name == "manifesto":
-            # Redirect to manifesto index page
-            return RedirectResponse(url="/manifesto", status_code=301)
-        elif name == "yolo":
-            return RedirectResponse(url="/manifesto/yolo", status_code=301)
-        else:
-            return RedirectResponse(url=f"/foundations/{name}", status_code=301)
+        return RedirectResponse(url=legacy_redirect("canonical", name), status_code=301)
 
     # =========================================================================
     # Quick Start & Getting Started Pages
@@ -713,7 +723,7 @@ def create_routes(
     @router.get("/start", response_class=HTMLResponse)
     async def start_here(request: Request) -> Response:
         """Start Here - Getting started guide."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/START_HERE.md"),
             "Start Here - Semantic Infrastructure Lab",
@@ -727,7 +737,7 @@ def create_routes(
     @router.get("/founders-letter", response_class=HTMLResponse)
     async def founders_letter(request: Request) -> Response:
         """Founder's Letter - direct access."""
-        return render_markdown_page(
+        return await render_markdown_page(
             request,
             Path("docs/foundations/FOUNDERS_LETTER.md"),
             "Founder's Letter - Semantic Infrastructure Lab",
@@ -741,31 +751,12 @@ def create_routes(
     @router.get("/meta/{name}", response_class=HTMLResponse)
     async def meta_page(request: Request, name: str) -> Response:
         """Meta pages - FAQ, founder background, influences."""
-        doc_path = _resolve_meta(name)
-
-        if doc_path is None:
-            raise HTTPException(status_code=404, detail=f"Page not found: {name}")
-
-        content = doc_path.read_text()
-
-        # Extract title from first H1
-        title = f"{name.replace('-', ' ').title()} - SIL"
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip() + " - SIL"
-                break
-
-        html_content = markdown_renderer.render(content)
-
-        return templates.TemplateResponse(
-            "page.html",
-            {
-                "request": request,
-                "title": title,
-                "content": html_content,
-                "nav_items": nav_items,
-                "current_page": "/about",
-            },
+        return await render_resolved_doc(
+            _resolve_meta,
+            name,
+            f"{name.replace('-', ' ').title()} - SIL",
+            "/about",
+            not_found=f"Page not found: {name}",
         )
 
     return router
@@ -0,0 +1,82 @@
+"""
+Related reading over the published docs.
+
+Document pages show their related reading after the content (the page
+routes, routes/pages.py, are given the RelatedService). /related.json hands
+agents the same graph as data -- a cheap map of which pages belong together,
+instead of crawling everything to find out.
+
+The graph covers the pages search indexes (routes/search.py): the sitemap's
+URLs, private and draft docs excluded.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, HTTPException
+
+from sil_web.config.settings import IO_WORKERS, SEARCH_CHECK_INTERVAL
+from sil_web.domain.models import RelatedLink
+from sil_web.routes.search import collect_search_pages
+from sil_web.routes.sitemap import DOCS_ROOT
+from sil_web.services.cache import tree_signature
+from sil_web.services.content import ContentService
+from sil_web.services.fileio import FileIOPool
+from sil_web.services.related import RelatedService
+
+
+def create_related_service(
+    content_service: ContentService | None = None,
+    check_interval: float = SEARCH_CHECK_INTERVAL,
+) -> RelatedService:
+    """Related-reading graph over the published docs, rebuilt when they change.
+
+    Args:
+        content_service: Source of the content generation (rebuild on change)
+        check_interval: Seconds between docs tree change checks
+
+    Returns:
+        RelatedService (graph built on first use)
+    """
+    return RelatedService(
+        collect_search_pages,
+        lambda: tree_signature([DOCS_ROOT]),
+        content_service,
+        check_interval=check_interval,
+    )
+
+
+def _links(links: tuple[RelatedLink, ...]) -> list[dict[str, Any]]:
+    return [{"url": link.url, "title": link.title, "score": link.score} for link in links]
+
+
+def create_related_router(related_service: RelatedService, io_pool: FileIOPool | None = None) -> APIRouter:
+    """Create the related-reading API.
+
+    Args:
+        related_service: Graph to serve
+        io_pool: Thread pool for graph (re)builds (a private one if omitted)
+
+    Returns:
+        Router serving /related.json
+    """
+    router = APIRouter()
+    pool = io_pool if io_pool is not None else FileIOPool(max_workers=IO_WORKERS)
+
+    @router.get("/related.json")
+    async def related_json(url: str = "") -> dict[str, Any]:
+        """Related reading for one page, or for every page.
+
+        Returns:
+            With ?url=: url and its related pages (url, title, score);
+            without: pages, mapping every page URL to its related pages
+        """
+        graph = await pool.run(lambda: related_service.graph)
+        if not url:
+            return {"pages": {page: _links(links) for page, links in graph.by_url.items()}}
+        if url not in graph.by_url:
+            raise HTTPException(status_code=404, detail=f"Page not found: {url}")
+        return {"url": url, "related": _links(graph.related(url))}
+
+    return router
@@ -0,0 +1,55 @@
+"""
+Content reload endpoint, for docs syncs into a running app.
+
+After scripts/sync-docs.py has synced, `curl -X POST localhost:8000/admin/reload`
+applies its change manifest (services/reload.py) instead of restarting the
+app. Only loopback clients are served: requests through the proxy (nginx
+sets X-Forwarded-For / X-Real-IP) or from anywhere else get 403.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Request
+
+from sil_web.config.settings import IO_WORKERS
+from sil_web.services.fileio import FileIOPool
+from sil_web.services.reload import ContentReloader
+
+LOOPBACK_HOSTS = {"127.0.0.1", "::1"}
+PROXY_HEADERS = ("x-forwarded-for", "x-real-ip")
+
+
+def is_local_request(request: Request) -> bool:
+    """True if the request came straight from this machine (not via a proxy)."""
+    if request.client is None or request.client.host not in LOOPBACK_HOSTS:
+        return False
+    return not any(header in request.headers for header in PROXY_HEADERS)
+
+
+def create_reload_router(reloader: ContentReloader, io_pool: FileIOPool | None = None) -> APIRouter:
+    """Create the content reload endpoint.
+
+    Args:
+        reloader: Applies sync change manifests
+        io_pool: Thread pool for the reload (a private one if omitted)
+
+    Returns:
+        Router serving POST /admin/reload
+    """
+    router = APIRouter()
+    pool = io_pool if io_pool is not None else FileIOPool(max_workers=IO_WORKERS)
+
+    @router.post("/admin/reload")
+    async def reload(request: Request) -> dict[str, Any]:
+        """Apply the latest docs sync's change manifest.
+
+        Returns:
+            ContentReloader.reload()'s summary
+        """
+        if not is_local_request(request):
+            raise HTTPException(status_code=403, detail="Reload is local-only")
+        return await pool.run(reloader.reload)
+
+    return router
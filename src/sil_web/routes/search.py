@@ -0,0 +1,233 @@
+"""
+Search endpoints over the published docs.
+
+/search.json serves ranked results to agents and scripts; the /search HTML
+page is registered with the other page routes (routes/pages.py) so it gets
+the site shell. Both query one SearchService (services/search.py).
+
+Results are page sections, deep-linked by heading anchor. The index covers
+exactly the pages the sitemap lists -- the same docs/
+tree, the same URLs, draft articles excluded -- minus any doc whose
+frontmatter marks it private.
+
+/search/suggest completes a typed prefix from the same pages' titles,
+glossary terms and section headings (services/suggest.py), for
+search-as-you-type; its responses are cacheable.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any
+
+from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse
+
+from sil_web.config.settings import IO_WORKERS, SEARCH_CHECK_INTERVAL, SEARCH_SUGGEST_MAX_AGE
+from sil_web.domain.models import Completion
+from sil_web.routes.sitemap import CATEGORY_ROUTES, DOCS_ROOT, PAGES_SECTION, STATIC_PAGE_DOCS, category_docs
+from sil_web.services.cache import GenerationCache, tree_signature
+from sil_web.services.content import ContentService
+from sil_web.services.documents import read_document
+from sil_web.services.fileio import FileIOPool
+from sil_web.services.glossary import GLOSSARY_DOC
+from sil_web.services.search import SearchPage, SearchService
+from sil_web.services.suggest import PrefixIndex
+
+# Upper bound on hits per request
+MAX_SEARCH_LIMIT = 50
+
+# Upper bound on completions per request
+MAX_SUGGEST_LIMIT = 20
+
+_EMPHASIS = re.compile(r"[*`]")
+
+
+def _published_pages() -> list[tuple[str, str, Path]]:
+    """(URL, section, file) for every page the sitemap lists, each file once."""
+    pages = [(url, PAGES_SECTION, path) for url, path in STATIC_PAGE_DOCS.items()]
+    for category in CATEGORY_ROUTES:
+        pages.extend((url, category, path) for url, path in category_docs(category))
+
+    # /founders-letter and /foundations/founders-letter are one file
+    seen: set[Path] = set()
+    unique = []
+    for url, section, path in pages:
+        if path not in seen:
+            seen.add(path)
+            unique.append((url, section, path))
+    return unique
+
+
+def collect_search_pages() -> list[SearchPage]:
+    """Every published, public doc as a SearchPage.
+
+    Returns:
+        Pages in sitemap order (private and draft docs excluded)
+    """
+    pages = []
+    for url, section, path in _published_pages():
+        doc = read_document(path)
+        if doc is None or doc.metadata.get("private", False) or doc.is_draft:
+            continue
+        title = doc.title or str(doc.metadata.get("title") or path.stem.replace("_", " ").title())
+        pages.append(SearchPage(url=url, title=title, category=section, document=doc))
+    return pages
+
+
+def create_search_service(
+    content_service: ContentService | None = None,
+    check_interval: float = SEARCH_CHECK_INTERVAL,
+    snapshot_path: Path | None = None,
+) -> SearchService:
+    """Search service over the published docs, updated when they change.
+
+    Args:
+        content_service: Source of the content generation (rebuild on change)
+        check_interval: Seconds between docs tree change checks
+        snapshot_path: Prebuilt index to serve from until the first change
+            check (scripts/build-search-index.py); ignored if missing
+
+    Returns:
+        SearchService (index mapped from the snapshot, else built on first use)
+    """
+    service = SearchService(
+        collect_search_pages,
+        lambda: tree_signature([DOCS_ROOT]),
+        content_service,
+        check_interval=check_interval,
+    )
+    if snapshot_path is not None:
+        service.load_snapshot(snapshot_path)
+    return service
+
+
+def collect_completions() -> list[Completion]:
+    """Titles, glossary terms and headings of every published, public doc.
+
+    Returns:
+        Completions: every page title, then every glossary term, then every
+        other h2-h4 heading (glossary letter headings excluded)
+    """
+    pages = collect_search_pages()
+    titles = [Completion(_EMPHASIS.sub("", page.title).strip(), page.url, "page") for page in pages]
+    terms: list[Completion] = []
+    headings: list[Completion] = []
+    for page in pages:
+        glossary = page.document.path == GLOSSARY_DOC
+        for entry in page.document.toc:
+            label = _EMPHASIS.sub("", entry.title).strip()
+            if len(label) < 2:
+                continue
+            if glossary and entry.level == 3:
+                terms.append(Completion(label, f"{page.url}#{entry.id}", "term"))
+            else:
+                headings.append(Completion(label, f"{page.url}#{entry.id}", "heading"))
+    return titles + terms + headings
+
+
+def create_completion_index(
+    content_service: ContentService | None = None,
+    check_interval: float = SEARCH_CHECK_INTERVAL,
+) -> GenerationCache[PrefixIndex]:
+    """Prefix index behind /search/suggest, rebuilt when the docs change.
+
+    Args:
+        content_service: Source of the content generation (rebuild on change)
+        check_interval: Seconds between docs tree change checks
+
+    Returns:
+        Cache whose get() returns the current PrefixIndex
+    """
+    return GenerationCache(
+        lambda: PrefixIndex(collect_completions()),
+        lambda: tree_signature([DOCS_ROOT]),
+        content_service,
+        check_interval=check_interval,
+        name="search-completions",
+    )
+
+
+def create_search_router(
+    search_service: SearchService,
+    io_pool: FileIOPool | None = None,
+    completions: GenerationCache[PrefixIndex] | None = None,
+) -> APIRouter:
+    """Create the JSON search API.
+
+    Args:
+        search_service: Index to query
+        io_pool: Thread pool for queries and (re)builds (a private one if omitted)
+        completions: Prefix index behind /search/suggest (optional; no
+            /search/suggest without it)
+
+    Returns:
+        Router serving /search.json (and /search/suggest)
+    """
+    router = APIRouter()
+    pool = io_pool if io_pool is not None else FileIOPool(max_workers=IO_WORKERS)
+
+    @router.get("/search.json")
+    async def search_json(
+        q: str = "",
+        limit: int = Query(10, ge=1, le=MAX_SEARCH_LIMIT),
+    ) -> dict[str, Any]:
+        """Full-text search for agents.
+
+        Query syntax: free terms (ranked by BM25) and "quoted phrases" (must
+        occur verbatim).
+
+        Returns:
+            query, total matching sections, and the top results with url
+            (#anchor for sections), page title, section heading, category,
+            score, snippet and the snippet's highlight spans
+        """
+        results = await pool.run(search_service.search, q, limit)
+        return {
+            "query": results.query,
+            "total": results.total,
+            "results": [
+                {
+                    "url": hit.url,
+                    "title": hit.title,
+                    "section": hit.section,
+                    "category": hit.category,
+                    "score": hit.score,
+                    "snippet": hit.snippet.text,
+                    "highlights": [list(span) for span in hit.snippet.highlights],
+                }
+                for hit in results.hits
+            ],
+        }
+
+    if completions is not None:
+        cache_control = f"public, max-age={SEARCH_SUGGEST_MAX_AGE}, stale-while-revalidate={SEARCH_SUGGEST_MAX_AGE * 12}"
+
+        def complete(q: str, limit: int) -> list[Completion]:
+            return completions.get().complete(q, limit)
+
+        @router.get("/search/suggest")
+        async def search_suggest(
+            q: str = "",
+            limit: int = Query(8, ge=1, le=MAX_SUGGEST_LIMIT),
+        ) -> JSONResponse:
+            """Search-as-you-type completions for a typed prefix.
+
+            Matches the start of a page title, glossary term or section
+            heading, or of any word in one.
+
+            Returns:
+                query and suggestions (label, url, kind: page/term/heading),
+                with a public Cache-Control
+            """
+            suggestions = await pool.run(complete, q, limit)
+            return JSONResponse(
+                {
+                    "query": q,
+                    "suggestions": [{"label": s.label, "url": s.url, "kind": s.kind} for s in suggestions],
+                },
+                headers={"Cache-Control": cache_control},
+            )
+
+    return router
@@ -2,26 +2,50 @@
 sitemap.xml endpoint for search engine crawlers.
 
 robots.txt has referenced /sitemap.xml since the site's first commit, but
-no route ever served it (SIL-8). Built at request time from the same
+no route ever served it (SIL-8). Built from the same
 docs/ tree the page routes themselves read from -- no separate generated
 file to fall out of sync, and no dependency on the SIL source repo (which
 isn't present in the deployed container; DOCS_PATH/SIL_DOCS_PATH point
 here too, see config/settings.py).
 
+/sitemap.xml is a <sitemapindex> over one child sitemap per section
+(/sitemap-pages.xml, /sitemap-<category>.xml), each further split into
+/sitemap-<category>-2.xml, ... past the protocol's per-file limits. Every
+child is built once per content generation / change to its own docs
+directory (services/sitemap.py) and served as cached bytes with ETag,
+Last-Modified, <lastmod> and gzip, so a crawler's conditional GET costs
+nothing but a header comparison and an edit to one category rebuilds only
+that category's sitemap. <lastmod> and Last-Modified are real edit times
+from the git lastmod index (services/lastmod.py), not container mtimes.
+
 Route slugs use the same lower-hyphenated transform the page routes accept
 as their primary match (see routes/pages.py) -- keep this mapping in sync
 with CATEGORY routes there and with generate-llms-txt.sh in scripts/,
 which derives the same URLs for llms.txt.
 """
 
+from __future__ import annotations
+
+import functools
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from typing import Callable
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response
 
-from sil_web.routes.pages import is_draft_article
-
-router = APIRouter()
+from sil_web.config.settings import IO_WORKERS, LASTMOD_INDEX_PATH, SITEMAP_CHECK_INTERVAL, SITEMAP_MAX_URLS
+from sil_web.routes.pages import CATEGORY_INDEX_DOCS, ROOT_PAGE_DOCS, is_draft_article
+from sil_web.services.cache import GenerationCache, tree_signature
+from sil_web.services.content import ContentService
+from sil_web.services.fileio import FileIOPool
+from sil_web.services.lastmod import LastmodIndex
+from sil_web.services.sitemap import (
+    EncodedBody,
+    SitemapUrl,
+    render_sitemap_index,
+    shard_urlsets,
+)
 
 SITE_URL = "https://semanticinfrastructurelab.org"
 
@@ -55,53 +79,220 @@ STATIC_PAGES = [
     "/projects",
 ]
 
+# Child sitemap for STATIC_PAGES (categories use their own names)
+PAGES_SECTION = "pages"
+
+# Static page URL -> source doc, for <lastmod>. Pages with no single
+# backing file (e.g. the generated /essays listing) get no <lastmod>.
+STATIC_PAGE_DOCS = {
+    **{f"/{slug}": path for slug, path in ROOT_PAGE_DOCS.items()},
+    **{f"/{category}": path for category, path in CATEGORY_INDEX_DOCS.items()},
+}
+
 
 def _slugify(stem: str) -> str:
     return stem.lower().replace("_", "-")
 
 
-def _collect_urls() -> list[str]:
-    urls = list(STATIC_PAGES)
+def _collect_pages(lastmods: LastmodIndex) -> list[SitemapUrl]:
+    return [
+        SitemapUrl(page, lastmods.lastmod(STATIC_PAGE_DOCS[page]) if page in STATIC_PAGE_DOCS else None)
+        for page in STATIC_PAGES
+    ]
 
-    for category, prefix in CATEGORY_ROUTES.items():
-        category_dir = DOCS_ROOT / category
-        if not category_dir.is_dir():
+
+def category_docs(category: str) -> list[tuple[str, Path]]:
+    """Published docs of a category as (URL path, source file), in sitemap order.
+
+    Shared by the sitemap and the search index (routes/search.py), so both
+    list exactly the same pages.
+
+    Args:
+        category: Key of CATEGORY_ROUTES
+
+    Returns:
+        (path, file) pairs; READMEs, draft articles and exact URL repeats excluded
+    """
+    prefix = CATEGORY_ROUTES[category]
+    category_dir = DOCS_ROOT / category
+    if not category_dir.is_dir():
+        return []
+
+    # Skip exact repeats: URLs STATIC_PAGES already lists, and files whose
+    # stems slugify alike (FOO_BAR.md and foo-bar.md both give /x/foo-bar).
+    seen = set(STATIC_PAGES)
+    docs = []
+    for md_file in sorted(category_dir.rglob("*.md")):
+        if md_file.name == "README.md":
+            continue
+        if category == "articles" and is_draft_article(md_file):
             continue
-        for md_file in sorted(category_dir.rglob("*.md")):
-            if md_file.name == "README.md":
-                continue
-            if category == "articles" and is_draft_article(md_file):
-                continue
-            urls.append(f"{prefix}/{_slugify(md_file.stem)}")
-
-    # Dedupe while preserving order (e.g. foundations/FOUNDERS_LETTER.md
-    # would otherwise also produce /foundations/founders-letter, a URL
-    # the foundations route happens to accept too, alongside the
-    # dedicated /founders-letter already in STATIC_PAGES).
-    seen: set[str] = set()
-    deduped = []
-    for url in urls:
-        if url not in seen:
-            seen.add(url)
-            deduped.append(url)
-    return deduped
-
-
-@router.get("/sitemap.xml")
-async def sitemap_xml() -> Response:
-    """Serve sitemap.xml listing all public pages.
+        path = f"{prefix}/{_slugify(md_file.stem)}"
+        if path not in seen:
+            seen.add(path)
+            docs.append((path, md_file))
+    return docs
+
+
+def _collect_category(category: str, lastmods: LastmodIndex) -> list[SitemapUrl]:
+    return [SitemapUrl(path, lastmods.lastmod(md_file)) for path, md_file in category_docs(category)]
+
+
+def _section_sources(section: str) -> list[Path]:
+    """Files/directories whose changes affect a section's sitemap."""
+    if section == PAGES_SECTION:
+        return list(STATIC_PAGE_DOCS.values())
+    return [DOCS_ROOT / section]
+
+
+def _shard_path(section: str, number: int) -> str:
+    return f"/sitemap-{section}.xml" if number == 1 else f"/sitemap-{section}-{number}.xml"
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def _not_modified(request: Request, encoded: EncodedBody, etags: tuple[str, ...]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 7232 §6)
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or any(etag in candidates for etag in etags)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or encoded.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(encoded.last_modified) <= since
+
+
+def cached_response(request: Request, encoded: EncodedBody, media_type: str) -> Response:
+    """Serve pre-encoded bytes with validators, gzip and 304 handling.
+
+    Args:
+        request: Incoming request (Accept-Encoding, If-None-Match, If-Modified-Since)
+        encoded: Pre-encoded body
+        media_type: Response content type
 
     Returns:
-        sitemap.xml content as application/xml
+        200 (plain or gzip) or 304 response
     """
-    urls = _collect_urls()
-
-    entries = "\n".join(f"  <url><loc>{SITE_URL}{path}</loc></url>" for path in urls)
-    xml = (
-        '<?xml version="1.0" encoding="UTF-8"?>\n'
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-        f"{entries}\n"
-        "</urlset>\n"
+    gzip_etag = f'{encoded.etag[:-1]}-gzip"'
+    use_gzip = _accepts_gzip(request)
+    headers = {"ETag": gzip_etag if use_gzip else encoded.etag, "Vary": "Accept-Encoding"}
+    if encoded.last_modified_http is not None:
+        headers["Last-Modified"] = encoded.last_modified_http
+
+    if _not_modified(request, encoded, (encoded.etag, gzip_etag)):
+        return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=encoded.gzip_body, media_type=media_type, headers=headers)
+    return Response(content=encoded.body, media_type=media_type, headers=headers)
+
+
+def create_sitemap_router(
+    content_service: ContentService | None = None,
+    io_pool: FileIOPool | None = None,
+    check_interval: float = SITEMAP_CHECK_INTERVAL,
+    max_urls: int = SITEMAP_MAX_URLS,
+    lastmod_index: LastmodIndex | None = None,
+) -> APIRouter:
+    """Create the sitemap index and child sitemap routes with their caches.
+
+    Args:
+        content_service: Source of the content generation (rebuild on change)
+        io_pool: Thread pool for the (re)builds' file work (a private one if omitted)
+        check_interval: Seconds between docs tree change checks
+        max_urls: URLs per child sitemap before it is split
+        lastmod_index: Source of <lastmod>/Last-Modified (loaded from
+            LASTMOD_INDEX_PATH if omitted)
+
+    Returns:
+        Router serving /sitemap.xml and /sitemap-<section>[-<n>].xml
+    """
+    router = APIRouter()
+    pool = io_pool if io_pool is not None else FileIOPool(max_workers=IO_WORKERS)
+    lastmods = lastmod_index if lastmod_index is not None else LastmodIndex.load(LASTMOD_INDEX_PATH, DOCS_ROOT)
+
+    def section_cache(section: str, collect: Callable[[], list[SitemapUrl]]) -> GenerationCache[list[EncodedBody]]:
+        sources = _section_sources(section)
+        return GenerationCache(
+            lambda: shard_urlsets(SITE_URL, collect(), max_urls=max_urls),
+            lambda: tree_signature(sources),
+            content_service,
+            check_interval=check_interval,
+            name=f"sitemap-{section}",
+        )
+
+    sections: dict[str, GenerationCache[list[EncodedBody]]] = {
+        PAGES_SECTION: section_cache(PAGES_SECTION, functools.partial(_collect_pages, lastmods)),
+    }
+    for category in CATEGORY_ROUTES:
+        sections[category] = section_cache(category, functools.partial(_collect_category, category, lastmods))
+
+    def current_shards() -> list[tuple[str, EncodedBody]]:
+        """(path, shard) for every non-empty child sitemap, in index order."""
+        return [
+            (_shard_path(section, number), shard)
+            for section, cache in sections.items()
+            for number, shard in enumerate(cache.get(), start=1)
+        ]
+
+    def build_index() -> EncodedBody:
+        shards = current_shards()
+        lastmods = [shard.last_modified for _, shard in shards if shard.last_modified is not None]
+        xml = render_sitemap_index(SITE_URL, [(path, shard.last_modified) for path, shard in shards])
+        return EncodedBody.from_text(xml, max(lastmods) if lastmods else None)
+
+    # The index changes exactly when some child's bytes do
+    index = GenerationCache(
+        build_index,
+        lambda: tuple(shard.etag for _, shard in current_shards()),
+        content_service,
+        check_interval=check_interval,
+        name="sitemap-index",
     )
 
-    return Response(content=xml, media_type="application/xml")
+    def get_shard(name: str) -> EncodedBody | None:
+        section, number = name, 1
+        if section not in sections:
+            section, _, suffix = name.rpartition("-")
+            if section not in sections or not suffix.isdigit() or int(suffix) < 2:
+                return None
+            number = int(suffix)
+        shards = sections[section].get()
+        return shards[number - 1] if number <= len(shards) else None
+
+    @router.get("/sitemap.xml")
+    async def sitemap_xml(request: Request) -> Response:
+        """Serve the sitemap index listing every child sitemap.
+
+        Returns:
+            sitemapindex XML as application/xml (gzip if accepted, 304 if unchanged)
+        """
+        encoded = await pool.run(index.get)
+        return cached_response(request, encoded, "application/xml")
+
+    @router.get("/sitemap-{name}.xml")
+    async def child_sitemap(request: Request, name: str) -> Response:
+        """Serve one child sitemap (a section, or one shard of it).
+
+        Returns:
+            urlset XML as application/xml (gzip if accepted, 304 if unchanged)
+        """
+        encoded = await pool.run(get_shard, name)
+        if encoded is None:
+            raise HTTPException(status_code=404, detail=f"Sitemap not found: {name}")
+        return cached_response(request, encoded, "application/xml")
+
+    return router
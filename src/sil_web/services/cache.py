@@ -0,0 +1,155 @@
+"""
+Generation cache - one built value, rebuilt when the docs change.
+
+Sitemaps, the search index and its completions, 404 suggestions, related
+reading and the link graph are each built once and reused until the content
+generation changes (a reload) or the docs tree on disk does. Tree changes
+are detected by a stat-only signature of the tree, re-checked at most once
+per check interval, so requests in between never touch the filesystem.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Generic, Iterable, Optional, TypeVar
+
+import structlog
+
+if TYPE_CHECKING:
+    from sil_web.services.content import ContentService
+
+log = structlog.get_logger()
+
+T = TypeVar("T")
+
+# Signature of a primed value: equal to no real signature
+_UNVERIFIED = object()
+
+
+def tree_signature(paths: Iterable[Path]) -> str:
+    """Cheap change signature for directory trees and files.
+
+    A digest of every file's (path, mtime, size): adding, removing, renaming
+    or editing any file changes it, including copies that carry an older
+    mtime over (sync-docs.py uses shutil.copy2). Only stats, no reads.
+
+    Args:
+        paths: Tree roots and/or individual files (missing ones are skipped)
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    stack = []
+    for path in paths:
+        if path.is_dir():
+            stack.append(str(path))
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            digest.update(f"{path}\0missing\n".encode())
+            continue
+        digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    digest.update(f"{entry.path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+class GenerationCache(Generic[T]):
+    """Single built value, rebuilt on content generation or tree signature change.
+
+    Usage:
+        cache = GenerationCache(build, lambda: tree_signature([docs]), content_service)
+        body = cache.get()
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], T],
+        signature: Callable[[], object],
+        content_service: Optional["ContentService"] = None,
+        check_interval: float = 30.0,
+        name: str = "cache",
+    ):
+        """Initialize cache.
+
+        Args:
+            build: Produces the value (runs only on a miss)
+            signature: Cheap change detector for the value's sources
+            content_service: Source of the content generation (optional)
+            check_interval: Seconds between signature checks (0 = every get)
+            name: Label for logs
+        """
+        self.build = build
+        self.signature = signature
+        self.content_service = content_service
+        self.check_interval = check_interval
+        self.name = name
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._key: Optional[tuple[int, object]] = None
+        self._checked_at = 0.0
+
+    def _generation(self) -> int:
+        return self.content_service.generation if self.content_service is not None else 0
+
+    def get(self) -> T:
+        """Return the cached value, rebuilding it if its sources changed.
+
+        Returns:
+            Current value
+        """
+        with self._lock:
+            now = time.monotonic()
+            generation = self._generation()
+            value = self._value
+            if (
+                value is not None
+                and self._key is not None
+                and self._key[0] == generation
+                and now - self._checked_at < self.check_interval
+            ):
+                return value
+
+            key = (generation, self.signature())
+            self._checked_at = now
+            if value is None or key != self._key:
+                value = self._value = self.build()
+                self._key = key
+                log.info("cache_built", name=self.name, generation=generation)
+            return value
+
+    def clear(self) -> None:
+        """Force a rebuild on the next get()."""
+        with self._lock:
+            self._value = None
+            self._key = None
+
+    def prime(self, value: T) -> None:
+        """Serve a value built elsewhere (e.g. loaded from disk) until the next check.
+
+        The value's sources are not known to match, so the first get() after
+        check_interval rebuilds it (a content generation change, at once).
+
+        Args:
+            value: Value to serve meanwhile
+        """
+        with self._lock:
+            self._value = value
+            self._key = (self._generation(), _UNVERIFIED)
+            self._checked_at = time.monotonic()
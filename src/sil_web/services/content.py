@@ -5,13 +5,14 @@ This service handles I/O: reading files, parsing markdown, loading YAML.
 """
 
 import re
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Optional, cast
 
-import frontmatter
 import structlog
 
-from sil_web.domain.models import Document, Layer, Project, ProjectStatus
+from sil_web.domain.models import ContentChanges, Document, Layer, ParsedDocument, Project, ProjectStatus
+from sil_web.services.documents import document_cache, read_document
 
 log = structlog.get_logger()
 
@@ -98,6 +99,37 @@ class ContentService:
         self.docs_path = docs_path
         self.log = log.bind(service="content")
         self._slug_cache: dict[str, dict[str, str]] = {}  # category -> {slug: filename}
+        # Bumped whenever cached content is invalidated; derived caches
+        # (nav fragments, page shells, ...) key on it to know when to rebuild.
+        self.generation = 0
+
+    def invalidate(self) -> None:
+        """Drop cached discovery results and parsed documents, and start a new content generation."""
+        self._slug_cache.clear()
+        document_cache.invalidate()
+        self.generation += 1
+        self.log.info("content_invalidated", generation=self.generation)
+
+    def apply_changes(self, changes: ContentChanges, roots: Iterable[Path] = ()) -> list[ParsedDocument]:
+        """Drop cached state for the files a docs sync changed, and start a new content generation.
+
+        Unlike invalidate(), only the changed files' parsed documents are
+        dropped, and slug discovery is redone only for the categories that
+        gained or lost a file.
+
+        Args:
+            changes: The sync's change manifest
+            roots: Other trees the paths are relative to (besides docs_path)
+
+        Returns:
+            The dropped parsed documents (so their renders can be evicted too)
+        """
+        for relpath in changes.added + changes.removed:
+            self._slug_cache.pop(Path(relpath).parts[0], None)
+        dropped = document_cache.discard(root / relpath for root in (self.docs_path, *roots) for relpath in changes.paths)
+        self.generation += 1
+        self.log.info("content_changes_applied", generation=self.generation, paths=len(changes.paths), dropped=len(dropped))
+        return dropped
 
     def _discover_slugs(self, category: str) -> dict[str, str]:
         """Auto-discover all markdown files in a category and map slugs to filenames.
@@ -174,20 +206,19 @@ class ContentService:
         filename = slug_map[slug]
         doc_path = self.docs_path / category / filename
 
-        if not doc_path.exists():
+        # Parse frontmatter and content (shared, cached document stage)
+        parsed = read_document(doc_path)
+        if parsed is None:
             self.log.error("document_file_missing", category=category, slug=slug, path=str(doc_path))
             return None
+        meta = parsed.metadata
 
-        # Parse frontmatter and content
-        with open(doc_path, encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
-        title = cast(str, post.get("title", slug.replace("-", " ").title()))
-        description = cast(Optional[str], post.get("description"))
+        title = cast(str, meta.get("title", slug.replace("-", " ").title()))
+        description = cast(Optional[str], meta.get("description"))
 
         # Get tier and order from frontmatter (REQUIRED)
-        tier_raw = post.get("tier")
-        order_raw = post.get("order")
+        tier_raw = meta.get("tier")
+        order_raw = meta.get("order")
 
         # Require tier and order in frontmatter - no fallback
         if tier_raw is None:
@@ -200,14 +231,14 @@ class ContentService:
         order = cast(int, order_raw)
 
         # Get privacy and metadata fields from frontmatter
-        private = cast(bool, post.get("private", False))
-        beth_topics = cast("list[str]", post.get("beth_topics", []))
-        tags = cast("list[str]", post.get("tags", []))
+        private = cast(bool, meta.get("private", False))
+        beth_topics = cast("list[str]", meta.get("beth_topics", []))
+        tags = cast("list[str]", meta.get("tags", []))
 
         doc = Document(
             title=title,
             slug=slug,
-            content=post.content,
+            content=parsed.content,
             category=category,
             description=description,
             tier=tier,
@@ -241,11 +272,11 @@ class ContentService:
         # Special case: 'overview' maps to root docs/README.md
         if slug == 'overview':
             root_readme = self.docs_path / 'README.md'
-            if root_readme.exists():
-                with open(root_readme, encoding="utf-8") as f:
-                    post = frontmatter.load(f)
-                title = cast(str, post.get("title", "Overview"))
-                private = cast(bool, post.get("private", False))
+            parsed = read_document(root_readme)
+            if parsed is not None:
+                meta = parsed.metadata
+                title = cast(str, meta.get("title", "Overview"))
+                private = cast(bool, meta.get("private", False))
 
                 # Filter private documents unless explicitly requested
                 if private and not include_private:
@@ -255,14 +286,14 @@ class ContentService:
                 return Document(
                     title=title,
                     slug=slug,
-                    content=post.content,
+                    content=parsed.content,
                     category='root',
-                    description=cast(Optional[str], post.get("description")),
+                    description=cast(Optional[str], meta.get("description")),
                     tier=1,  # Top-level overview is tier 1
                     order=0,
                     private=private,
-                    beth_topics=cast("list[str]", post.get("beth_topics", [])),
-                    tags=cast("list[str]", post.get("tags", [])),
+                    beth_topics=cast("list[str]", meta.get("beth_topics", [])),
+                    tags=cast("list[str]", meta.get("tags", [])),
                 )
 
         # Try each category until we find the slug
@@ -0,0 +1,237 @@
+"""
+Document pipeline - every markdown file is read and parsed exactly once.
+
+A single stage turns file text into a ParsedDocument: frontmatter metadata,
+the H1 title, the body with frontmatter and H1 stripped, the table of
+contents, the body split into sections at its toc headings, and the word
+count. Page routes, the sitemap, ContentService and
+the llms.txt generators in scripts/ all consume it, instead of each doing
+their own frontmatter load, regex strip and `# ` title scan.
+
+Parsed documents are cached per path and revalidated by stat signature
+(mtime, size), so an edited file is re-parsed on its next use and an
+unchanged one never is.
+"""
+
+import html
+import re
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import markdown
+import yaml
+
+from sil_web.domain.models import DocumentSection, ParsedDocument, TocEntry
+from sil_web.services.frontmatter import parse_frontmatter
+
+# Opening/closing code fence (``` or ~~~, up to 3 spaces of indent)
+FENCE_PATTERN = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+
+# ATX heading: "# Title" .. "###### Title"
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+\S")
+
+# Fallback frontmatter strip when the YAML itself doesn't parse
+FRONTMATTER_BLOCK = re.compile(r"^---\s*\n.*?\n---\s*\n", re.DOTALL)
+
+# Matches MarkdownRenderer's toc configuration, so ids and depth agree
+TOC_DEPTH = "2-4"
+TOC_LEVELS = range(2, 5)
+
+_toc_local = threading.local()
+
+
+def _toc_markdown() -> markdown.Markdown:
+    """Per-thread Markdown instance for heading ids (Markdown is stateful)."""
+    md = getattr(_toc_local, "md", None)
+    if md is None:
+        md = _toc_local.md = markdown.Markdown(extensions=["toc"], extension_configs={"toc": {"toc_depth": TOC_DEPTH}})
+    return md
+
+
+def _split_frontmatter(text: str) -> tuple[dict[str, Any], str]:
+    try:
+        return parse_frontmatter(text)
+    except yaml.YAMLError:
+        # Unparseable header: still keep it out of the rendered page
+        return {}, FRONTMATTER_BLOCK.sub("", text, count=1).strip()
+
+
+def _flatten_toc(tokens: list[dict[str, Any]]) -> list[TocEntry]:
+    entries = []
+    for token in tokens:
+        entries.append(TocEntry(level=token["level"], id=token["id"], title=html.unescape(token["name"])))
+        entries.extend(_flatten_toc(token["children"]))
+    return entries
+
+
+def _build_toc(heading_lines: list[str]) -> list[TocEntry]:
+    """Heading ids exactly as the renderer's toc extension assigns them.
+
+    Runs the toc extension over the document's headings alone (in order,
+    H1 already stripped), so inline markup, slugify and duplicate-id
+    suffixes all match the full render at a fraction of its cost.
+    """
+    if not heading_lines:
+        return []
+    md = _toc_markdown()
+    try:
+        md.convert("\n\n".join(heading_lines))
+        return _flatten_toc(getattr(md, "toc_tokens", []))
+    finally:
+        md.reset()
+
+
+def _split_sections(lines: list[str], starts: list[int], toc: list[TocEntry]) -> list[DocumentSection]:
+    """Cut the body at its toc headings (starts[i] is the line of toc[i])."""
+    if len(starts) != len(toc):  # can't happen for ATX headings; don't guess anchors
+        return [DocumentSection(anchor=None, title=None, level=1, markdown="\n".join(lines))]
+
+    bounds = starts + [len(lines)]
+    sections = [DocumentSection(anchor=None, title=None, level=1, markdown="\n".join(lines[: bounds[0]]))]
+    for i, entry in enumerate(toc):
+        markdown_text = "\n".join(lines[bounds[i] + 1 : bounds[i + 1]])
+        sections.append(DocumentSection(anchor=entry.id, title=entry.title, level=entry.level, markdown=markdown_text))
+    return sections
+
+
+def parse_document(text: str, path: Optional[Path] = None) -> ParsedDocument:
+    """Parse markdown text in one pass.
+
+    Args:
+        text: Full file text (frontmatter optional)
+        path: Source path, recorded on the result
+
+    Returns:
+        ParsedDocument with metadata, title, stripped body, TOC, sections and word count
+    """
+    metadata, content = _split_frontmatter(text)
+
+    lines = content.split("\n")
+    fence: Optional[str] = None
+    title: Optional[str] = None
+    h1_index: Optional[int] = None
+    heading_lines: list[str] = []
+    section_starts: list[int] = []  # line index of each h2-h4 heading
+
+    for i, line in enumerate(lines):
+        fence_match = FENCE_PATTERN.match(line)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence) and line.strip() == marker:
+                fence = None
+            continue
+        heading = HEADING_PATTERN.match(line) if fence is None else None
+        if heading is None:
+            continue
+
+        if h1_index is None and line.startswith("#") and not line.startswith("##"):
+            # First H1: page title (the template renders it as the page header)
+            title = line[1:].strip()
+            h1_index = i
+            continue
+        heading_lines.append(line)
+        if len(heading.group(1)) in TOC_LEVELS:
+            section_starts.append(i)
+
+    if h1_index is not None:
+        lines[h1_index] = ""
+    body = "\n".join(lines)
+    toc = _build_toc(heading_lines)
+
+    return ParsedDocument(
+        raw=text,
+        content=content,
+        body=body,
+        metadata=metadata,
+        title=title,
+        toc=toc,
+        sections=_split_sections(lines, section_starts, toc),
+        word_count=len(content.split()),
+        path=path,
+    )
+
+
+class DocumentCache:
+    """Parsed documents by path, revalidated by (mtime, size) on each access.
+
+    Safe to share between the I/O pool's threads: entries are read and
+    written under a lock, and parsing happens outside it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty cache."""
+        self._lock = threading.Lock()
+        # path as loaded -> ((mtime, size), resolved path, document)
+        self._entries: dict[Path, tuple[tuple[int, int], Path, ParsedDocument]] = {}
+
+    def load(self, path: Path) -> Optional[ParsedDocument]:
+        """Return the parsed document at path, parsing only if it changed.
+
+        Args:
+            path: Markdown file path
+
+        Returns:
+            ParsedDocument, or None if the file doesn't exist or can't be read
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[2]
+
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        doc = parse_document(text, path)
+        resolved = path.resolve()
+        with self._lock:
+            self._entries[path] = (signature, resolved, doc)
+        return doc
+
+    def invalidate(self) -> None:
+        """Forget every parsed document."""
+        with self._lock:
+            self._entries.clear()
+
+    def discard(self, paths: Iterable[Path]) -> list[ParsedDocument]:
+        """Forget the parsed documents of some files.
+
+        Args:
+            paths: Files to forget, however they were spelled when loaded
+                (relative or absolute)
+
+        Returns:
+            The forgotten documents
+        """
+        targets = {path.resolve() for path in paths}
+        with self._lock:
+            dropped = [path for path, (_, resolved, _) in list(self._entries.items()) if resolved in targets]
+            return [self._entries.pop(path)[2] for path in dropped]
+
+
+# Process-wide cache shared by routes, sitemap and ContentService
+document_cache = DocumentCache()
+
+
+def read_document(path: Path) -> Optional[ParsedDocument]:
+    """Read and parse a markdown file through the shared document cache.
+
+    Args:
+        path: Markdown file path
+
+    Returns:
+        ParsedDocument, or None if the file doesn't exist or can't be read
+    """
+    return document_cache.load(path)
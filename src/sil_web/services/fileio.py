@@ -0,0 +1,109 @@
+"""
+File I/O pool - keeps blocking filesystem work off the event loop.
+
+Route handlers are `async def`, so anything that stats, reads or parses a
+file on disk (resolvers, read_document, ContentService lookups, a cold
+render) runs here instead: a dedicated, bounded ThreadPoolExecutor that the
+handler awaits. A slow disk or cold page cache then delays only the
+requests that need it, not every request on the loop.
+
+Queue depth (submitted but not yet started) and active workers are tracked
+so /health can report pool saturation.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+import structlog
+
+T = TypeVar("T")
+
+log = structlog.get_logger()
+
+
+class FileIOPool:
+    """Bounded thread pool for blocking filesystem work.
+
+    Usage:
+        pool = FileIOPool(max_workers=4)
+        doc = await pool.run(read_document, path)
+        pool.stats()  # {'workers': 4, 'active': 0, 'queued': 0, ...}
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """Initialize pool.
+
+        Args:
+            max_workers: Upper bound on concurrent filesystem threads
+        """
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sil-io")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._peak_queued = 0
+        log.info("file_io_pool_initialized", workers=max_workers)
+
+    def _call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call on the pool and await its result.
+
+        Args:
+            fn: Blocking callable (file stat/read/parse/render)
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's return value (exceptions propagate to the awaiting handler)
+        """
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._executor, functools.partial(self._call, fn, *args, **kwargs))
+        except RuntimeError:
+            # Executor already shut down: the call was never queued
+            with self._lock:
+                self._queued -= 1
+            raise
+        return await future
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker."""
+        return self._queued
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of pool load for monitoring.
+
+        Returns:
+            workers, active, queued, peak_queued and completed counts
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "active": self._active,
+                "queued": self._queued,
+                "peak_queued": self._peak_queued,
+                "completed": self._completed,
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for running calls to finish."""
+        self._executor.shutdown(wait=True)
+        log.info("file_io_pool_shutdown", completed=self._completed)
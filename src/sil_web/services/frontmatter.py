@@ -0,0 +1,117 @@
+"""
+Frontmatter parsing shared by the app and scripts/.
+
+Only the leading `---` header block is handed to YAML, never the document
+body, and it is loaded with libyaml's CSafeLoader when PyYAML was built
+with it (pure-Python SafeLoader otherwise). Splitting follows
+python-frontmatter's rules exactly (text stripped, `^-{3,}\\s*$`
+boundaries, content stripped), so parsed documents are unchanged.
+
+Depends on PyYAML only, so standalone scripts can import it without the
+rest of the app's dependencies.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+# libyaml-backed loader if available (several times faster), same safe semantics
+SafeLoader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+HAS_LIBYAML = SafeLoader is not yaml.SafeLoader
+
+# Opening/closing delimiter line, as python-frontmatter's YAMLHandler defines it
+BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+
+def split_frontmatter(text: str) -> tuple[Optional[str], str]:
+    """Split text into its raw YAML header and the content after it.
+
+    Args:
+        text: Full document text
+
+    Returns:
+        (header, content): header is None if the text has no complete
+        frontmatter block, in which case content is the whole (stripped) text
+    """
+    text = text.strip()
+    if not BOUNDARY.match(text):
+        return None, text
+
+    parts = BOUNDARY.split(text, 2)
+    if len(parts) < 3:
+        return None, text
+    return parts[1], parts[2].strip()
+
+
+def load_header(header: str) -> dict[str, Any]:
+    """Load a raw YAML header block.
+
+    Args:
+        header: YAML between the `---` delimiters
+
+    Returns:
+        Metadata dict (empty if the header isn't a mapping)
+
+    Raises:
+        yaml.YAMLError: If the header isn't valid YAML
+    """
+    data = yaml.load(header, Loader=SafeLoader)
+    return data if isinstance(data, dict) else {}
+
+
+def parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
+    """Parse a document's frontmatter and return it with the remaining content.
+
+    Args:
+        text: Full document text
+
+    Returns:
+        (metadata, content), metadata empty if there is no frontmatter
+
+    Raises:
+        yaml.YAMLError: If the header isn't valid YAML
+    """
+    header, content = split_frontmatter(text)
+    if header is None:
+        return {}, content
+    return load_header(header), content
+
+
+def has_frontmatter(text: str) -> bool:
+    """True if text starts with a complete `---` ... `---` header block."""
+    return split_frontmatter(text)[0] is not None
+
+
+def read_frontmatter(path: Path) -> dict[str, Any]:
+    """Read only a file's frontmatter, stopping at the closing delimiter.
+
+    For callers that need a field or two (status, tier) and not the body:
+    the rest of the file is never read.
+
+    Args:
+        path: Markdown file path
+
+    Returns:
+        Metadata dict, empty if the file has no frontmatter
+
+    Raises:
+        OSError: If the file can't be read
+        yaml.YAMLError: If the header isn't valid YAML
+    """
+    header_lines: list[str] = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                break
+        else:
+            return {}
+        if not BOUNDARY.match(line):
+            return {}
+
+        for line in f:
+            if BOUNDARY.match(line):
+                return load_header("".join(header_lines))
+            header_lines.append(line)
+    return {}  # never closed: not frontmatter
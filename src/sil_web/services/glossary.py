@@ -0,0 +1,256 @@
+"""
+Glossary auto-linking - a render stage that links glossary terms.
+
+docs/foundations/SIL_GLOSSARY.md defines the lab's vocabulary (one h3 per
+term); the other docs use those terms without linking them. This stage
+links the first occurrence of each term on a page to its glossary entry.
+
+All terms are matched in a single pass with an Aho-Corasick automaton
+built once from the glossary: a trie of the lowercased terms plus failure
+links, walked one character at a time over the page's text. Matching cost
+is linear in the page's size whatever the number of terms, instead of one
+regex scan per term. Leftmost-longest matches on word boundaries win
+("Agent Ether" over "Agent"), and text inside links, code, headings,
+HTML comments and the like is left alone. It runs inside MarkdownRenderer, so its output is
+cached with the rest of the rendered HTML.
+"""
+
+import html as html_lib
+import re
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Optional
+
+import structlog
+
+from sil_web.domain.models import ParsedDocument
+from sil_web.services.documents import read_document
+
+log = structlog.get_logger()
+
+# Its h3 headings are the glossary terms
+GLOSSARY_DOC = Path("docs/foundations/SIL_GLOSSARY.md")
+GLOSSARY_URL = "/foundations/sil-glossary"
+
+# Elements whose text is never linked (already links, code, headings, ...)
+SKIP_ELEMENTS = {"a", "code", "pre", "h1", "h2", "h3", "h4", "h5", "h6", "script", "style", "button", "label", "title"}
+
+# Terms shorter than this are too ambiguous to link
+MIN_TERM_LENGTH = 3
+
+# A comment (passed through whole) or a tag
+_TAG_PATTERN = re.compile(r"<!--.*?-->|<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*?(/?)>", re.DOTALL)
+_PARENTHETICAL = re.compile(r"\s*\([^)]*\)\s*$")
+_EMPHASIS = re.compile(r"[*_`]")
+
+
+class TermAutomaton:
+    """Aho-Corasick automaton over lowercased terms.
+
+    Usage:
+        automaton = TermAutomaton(["agent", "agent ether"])
+        automaton.find("The Agent Ether layer")  # -> [(4, 15, 1)]
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        """Build the trie and its failure links.
+
+        Args:
+            terms: Terms to match (case-insensitive); ids are their order
+        """
+        self.terms = [term.lower() for term in terms]
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Longest term ending at each state (its own, or via failure links):
+        # (term id, length), or None
+        self._output: list[Optional[tuple[int, int]]] = [None]
+
+        for term_id, term in enumerate(self.terms):
+            state = 0
+            for char in term:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(None)
+                state = next_state
+            if self._output[state] is None:  # first of duplicate terms wins
+                self._output[state] = (term_id, len(term))
+
+        # Breadth-first: a state's failure target is always shallower
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                if self._output[child] is None:
+                    self._output[child] = self._output[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def find(self, text: str) -> list[tuple[int, int, int]]:
+        """Leftmost-longest, non-overlapping whole-word term matches.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (start, end, term id) per match, in text order
+        """
+        lowered = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        best_at: dict[int, tuple[int, int]] = {}  # start -> (end, term id), longest
+        state = 0
+        for index, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            # Every term ending here is reachable along the output chain
+            candidate = state
+            while candidate:
+                found = output[candidate]
+                if found is None:
+                    break
+                term_id, length = found
+                start, end = index + 1 - length, index + 1
+                if _is_word_boundary(lowered, start, end) and end > best_at.get(start, (0, 0))[0]:
+                    best_at[start] = (end, term_id)
+                candidate = fail[candidate]
+
+        matches = []
+        covered = 0
+        for start in sorted(best_at):
+            end, term_id = best_at[start]
+            if start >= covered:
+                matches.append((start, end, term_id))
+                covered = end
+        return matches
+
+
+def _is_word_boundary(text: str, start: int, end: int) -> bool:
+    return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+
+
+def glossary_terms(document: ParsedDocument) -> list[tuple[str, str]]:
+    """(term, anchor) for every entry of the glossary document.
+
+    Entries are its h3 headings; markup and a trailing parenthetical
+    qualifier ("Backend (Compilation)" -> "Backend") are dropped.
+
+    Args:
+        document: Parsed SIL_GLOSSARY.md
+
+    Returns:
+        Terms with their heading anchors, in glossary order
+    """
+    terms = []
+    for entry in document.toc:
+        if entry.level != 3:
+            continue
+        term = _PARENTHETICAL.sub("", _EMPHASIS.sub("", entry.title)).strip()
+        if len(term) >= MIN_TERM_LENGTH:
+            terms.append((term, entry.id))
+    return terms
+
+
+class GlossaryLinker:
+    """Links the first occurrence of each glossary term in rendered HTML.
+
+    Usage:
+        linker = GlossaryLinker.from_document(read_document(glossary_path), "/foundations/sil-glossary")
+        html = linker.link(rendered_html)
+    """
+
+    CSS_CLASS = "glossary-term"
+
+    def __init__(self, terms: list[tuple[str, str]], url: str, source: Optional[Path] = None):
+        """Build the automaton.
+
+        Args:
+            terms: (term, anchor) pairs
+            url: Glossary page URL the anchors belong to
+            source: Glossary file (never linked to itself)
+        """
+        self.url = url
+        self.source = source
+        self._terms = [term for term, _ in terms]
+        self._anchors = [anchor for _, anchor in terms]
+        self.automaton = TermAutomaton(self._terms)
+
+    @classmethod
+    def from_document(cls, document: ParsedDocument, url: str) -> "GlossaryLinker":
+        """Linker for every entry of a parsed glossary document.
+
+        Args:
+            document: Parsed SIL_GLOSSARY.md
+            url: Its page URL
+
+        Returns:
+            GlossaryLinker
+        """
+        linker = cls(glossary_terms(document), url, document.path)
+        log.info("glossary_linker_built", terms=len(linker.automaton), url=url)
+        return linker
+
+    def link(self, html: str) -> str:
+        """Link each term's first occurrence outside links, code, headings and comments.
+
+        Args:
+            html: Rendered HTML
+
+        Returns:
+            HTML with <a class="glossary-term"> links added
+        """
+        linked: set[str] = set()  # anchors already linked on this page
+        parts: list[str] = []
+        skip_depth = 0
+        position = 0
+        for tag in _TAG_PATTERN.finditer(html):
+            parts.append(self._link_text(html[position : tag.start()], linked) if skip_depth == 0 else html[position : tag.start()])
+            parts.append(tag.group(0))
+            position = tag.end()
+            if tag.group(2) is None:  # comment
+                continue
+            closing, name, self_closing = tag.group(1), tag.group(2).lower(), tag.group(3)
+            if name in SKIP_ELEMENTS and not self_closing:
+                skip_depth = max(0, skip_depth - 1) if closing else skip_depth + 1
+        parts.append(self._link_text(html[position:], linked) if skip_depth == 0 else html[position:])
+        return "".join(parts)
+
+    def _link_text(self, text: str, linked: set[str]) -> str:
+        if not text.strip():
+            return text
+        out: list[str] = []
+        position = 0
+        for start, end, term_id in self.automaton.find(text):
+            anchor = self._anchors[term_id]
+            if anchor in linked:
+                continue
+            linked.add(anchor)
+            href = f"{self.url}#{anchor}"
+            title = html_lib.escape(f"Glossary: {self._terms[term_id]}")
+            out.append(text[position:start])
+            out.append(f'<a href="{href}" class="{self.CSS_CLASS}" title="{title}">{text[start:end]}</a>')
+            position = end
+        out.append(text[position:])
+        return "".join(out)
+
+
+def create_glossary_linker() -> Optional[GlossaryLinker]:
+    """Glossary auto-linker over the terms of GLOSSARY_DOC.
+
+    Returns:
+        GlossaryLinker, or None if the glossary doc is missing
+    """
+    document = read_document(GLOSSARY_DOC)
+    if document is None:
+        return None
+    return GlossaryLinker.from_document(document, GLOSSARY_URL)
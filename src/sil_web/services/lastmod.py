@@ -0,0 +1,101 @@
+"""
+Last-modified index - real per-doc edit times from git history.
+
+Inside the container every file's mtime is the image build time, so
+<lastmod> and Last-Modified are read from docs/.lastmod-index.json instead:
+a path -> last-commit-time map produced by scripts/build-lastmod-index.py
+before the image is built. It is loaded once at startup; lookups are a dict
+access, never a git call or a stat.
+
+Without an index (local development) file mtimes are used, which are
+accurate on a working checkout.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+log = structlog.get_logger()
+
+
+class LastmodIndex:
+    """Last modification time per doc, from the git index or file mtimes.
+
+    Usage:
+        index = LastmodIndex.load(Path("docs/.lastmod-index.json"), Path("docs"))
+        index.lastmod(Path("docs/systems/reveal.md"))  # -> 1767225600.0
+    """
+
+    def __init__(self, docs_root: Path, times: Optional[dict[str, float]] = None):
+        """Initialize index.
+
+        Args:
+            docs_root: Directory the index's relative paths are based at
+            times: {path relative to docs_root: unix seconds}; None means no
+                index is available and file mtimes are used instead
+        """
+        self.docs_root = docs_root
+        self.times = times
+        self._resolved_root: Optional[Path] = None
+
+    @classmethod
+    def load(cls, index_path: Path, docs_root: Path) -> "LastmodIndex":
+        """Load the index file, falling back to mtimes if it's missing or invalid.
+
+        Args:
+            index_path: JSON written by scripts/build-lastmod-index.py
+            docs_root: Directory the index describes
+
+        Returns:
+            LastmodIndex
+        """
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            times = {str(rel): float(ts) for rel, ts in data["files"].items()}
+        except FileNotFoundError:
+            log.info("lastmod_index_missing", path=str(index_path), fallback="mtime")
+            return cls(docs_root)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            log.warning("lastmod_index_invalid", path=str(index_path), error=str(e), fallback="mtime")
+            return cls(docs_root)
+
+        log.info("lastmod_index_loaded", path=str(index_path), files=len(times), repo_head=data.get("repo_head"))
+        return cls(docs_root, times)
+
+    @property
+    def from_git(self) -> bool:
+        """True if times come from the git index rather than file mtimes."""
+        return self.times is not None
+
+    def _relative(self, path: Path) -> Optional[str]:
+        try:
+            return path.relative_to(self.docs_root).as_posix()
+        except ValueError:
+            pass
+        if self._resolved_root is None:
+            self._resolved_root = self.docs_root.resolve()
+        try:
+            return path.resolve().relative_to(self._resolved_root).as_posix()
+        except ValueError:
+            return None
+
+    def lastmod(self, path: Path) -> Optional[float]:
+        """Last modification time of a doc.
+
+        Args:
+            path: Doc path (under docs_root)
+
+        Returns:
+            Unix seconds, or None if unknown (not in the git index, or missing
+            on disk without one)
+        """
+        if self.times is not None:
+            rel = self._relative(path)
+            return self.times.get(rel) if rel is not None else None
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
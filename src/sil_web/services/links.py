@@ -0,0 +1,241 @@
+"""
+Link graph - every internal link between the published docs.
+
+Each page's internal links are read from its rendered HTML -- the same
+render (and render cache entry) its page view uses, so the graph sees
+exactly the links readers do, md_in_html anchors and reference links
+included, glossary auto-links excluded. From the outbound links the graph
+derives each page's backlinks ("pages linking here") and the orphans no
+other page links to. Every target is also looked up in the site's route
+table as the graph is built, so links that resolve to no page are known
+(LinkGraph.broken) before anything is deployed -- an in-memory set lookup
+per link, instead of crawling the site over HTTP to find them.
+
+The graph is rebuilt through a GenerationCache when the docs change, but a
+page's links are re-extracted only when the page itself changed (they are
+cached by page digest), so an edit to one doc re-renders that doc alone.
+"""
+
+import time
+from collections.abc import Container, Mapping
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Union
+from urllib.parse import urljoin, urlsplit
+
+import structlog
+
+from sil_web.domain.models import Backlink
+from sil_web.services.cache import GenerationCache
+from sil_web.services.glossary import GlossaryLinker
+from sil_web.services.search import SearchPage, page_key
+
+if TYPE_CHECKING:
+    from sil_web.services.content import ContentService
+
+log = structlog.get_logger()
+
+# Hrefs under these prefixes are assets, not pages
+ASSET_PREFIXES = ("/static/",)
+
+
+class _HrefParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.hrefs: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag != "a":
+            return
+        attributes = dict(attrs)
+        href = attributes.get("href")
+        if href and GlossaryLinker.CSS_CLASS not in (attributes.get("class") or "").split():
+            self.hrefs.append(href)
+
+
+def internal_target(href: str, source_url: str) -> Optional[str]:
+    """The site path an href points to, if it's an internal page link.
+
+    Args:
+        href: Link as written (absolute path, relative, or full URL)
+        source_url: URL path of the page it appears on (relative links)
+
+    Returns:
+        Path without query, fragment or trailing slash (None for external,
+        mailto:, same-page #fragment and static asset links)
+    """
+    if href.startswith("#"):
+        return None
+    parts = urlsplit(urljoin(source_url, href))
+    if parts.scheme or parts.netloc or not parts.path.startswith("/"):
+        return None
+    if parts.path.startswith(ASSET_PREFIXES):
+        return None
+    return parts.path.rstrip("/") or "/"
+
+
+def extract_links(html: str, source_url: str) -> tuple[str, ...]:
+    """Internal link targets of a rendered page.
+
+    Args:
+        html: Rendered page HTML
+        source_url: URL path of the page
+
+    Returns:
+        Distinct targets (internal_target) in document order
+    """
+    parser = _HrefParser()
+    parser.feed(html)
+    targets = (internal_target(href, source_url) for href in parser.hrefs)
+    return tuple(dict.fromkeys(target for target in targets if target is not None))
+
+
+@dataclass(frozen=True)
+class LinkGraph:
+    """Internal links between pages, both ways, looked up by URL or source file."""
+
+    outbound: dict[str, tuple[str, ...]]  # page URL -> target URLs (aliases resolved)
+    inbound: dict[str, tuple[str, ...]]  # target URL -> URLs of the pages linking to it
+    titles: dict[str, str]
+    urls_by_path: dict[Path, str]
+    broken: dict[str, tuple[str, ...]]  # page URL -> targets the route table lacks (pages with any)
+
+    def _url(self, key: Union[str, Path]) -> Optional[str]:
+        return self.urls_by_path.get(key) if isinstance(key, Path) else key
+
+    def links(self, key: Union[str, Path]) -> tuple[str, ...]:
+        """Internal links on a page.
+
+        Args:
+            key: Page URL, or its source file
+
+        Returns:
+            Target URLs in document order (empty if unknown)
+        """
+        url = self._url(key)
+        return self.outbound.get(url, ()) if url is not None else ()
+
+    def backlinks(self, key: Union[str, Path]) -> tuple[Backlink, ...]:
+        """Pages linking to a page.
+
+        Args:
+            key: Page URL, or its source file
+
+        Returns:
+            Linking pages in sitemap order (empty if none or unknown)
+        """
+        url = self._url(key)
+        if url is None:
+            return ()
+        return tuple(Backlink(source, self.titles[source]) for source in self.inbound.get(url, ()))
+
+    @property
+    def orphans(self) -> tuple[str, ...]:
+        """Pages no other page links to, in sitemap order."""
+        return tuple(url for url in self.outbound if not self.inbound.get(url))
+
+
+class LinkService:
+    """The current link graph, rebuilt when the docs change.
+
+    Usage:
+        service = LinkService(collect_pages, lambda: tree_signature([docs]), render, content_service)
+        service.backlinks("/systems/reveal")
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], list[SearchPage]],
+        signature: Callable[[], object],
+        render: Callable[[SearchPage], str],
+        content_service: Optional["ContentService"] = None,
+        check_interval: float = 30.0,
+        aliases: Optional[Callable[[], Mapping[str, Path]]] = None,
+        routes: Optional[Callable[[], Container[str]]] = None,
+    ):
+        """Initialize service (the graph is built on first use).
+
+        Args:
+            collect: Produces the pages to link
+            signature: Cheap change detector for the pages' sources
+            render: A page's rendered HTML (the page renderer, so renders are shared)
+            content_service: Source of the content generation (optional)
+            check_interval: Seconds between signature checks (0 = every lookup)
+            aliases: Every URL a page is served under -> its source file, so
+                links to an alias count for the page's canonical URL
+            routes: Every URL path the site serves; links to anything else are
+                recorded as broken (no validation if omitted)
+        """
+        self.collect = collect
+        self.render = render
+        self.aliases = aliases
+        self.routes = routes
+        self._links: dict[str, tuple[str, tuple[str, ...]]] = {}  # page URL -> (page_key, targets as written)
+        self._cache: GenerationCache[LinkGraph] = GenerationCache(
+            self._build, signature, content_service, check_interval=check_interval, name="link-graph"
+        )
+
+    def _page_links(self, pages: list[SearchPage]) -> tuple[dict[str, tuple[str, ...]], int]:
+        links = {}
+        extracted = 0
+        for page in pages:
+            key = page_key(page)
+            cached = self._links.get(page.url)
+            if cached is None or cached[0] != key:
+                cached = (key, extract_links(self.render(page), page.url))
+                extracted += 1
+            links[page.url] = cached
+        self._links = links
+        return {url: targets for url, (_, targets) in links.items()}, extracted
+
+    def _build(self) -> LinkGraph:
+        started = time.perf_counter()
+        pages = self.collect()
+        links, extracted = self._page_links(pages)
+
+        urls_by_path = {page.document.path: page.url for page in pages if page.document.path is not None}
+        canonical = {url: urls_by_path[path] for url, path in (self.aliases() if self.aliases else {}).items() if path in urls_by_path}
+        routes = self.routes() if self.routes is not None else None
+
+        outbound: dict[str, tuple[str, ...]] = {}
+        inbound: dict[str, list[str]] = {}
+        broken: dict[str, tuple[str, ...]] = {}
+        for page in pages:
+            if routes is not None:
+                unresolved = tuple(target for target in links[page.url] if target not in routes)
+                if unresolved:
+                    broken[page.url] = unresolved
+            targets = tuple(dict.fromkeys(canonical.get(target, target) for target in links[page.url]))
+            outbound[page.url] = targets
+            for target in targets:
+                if target != page.url:
+                    inbound.setdefault(target, []).append(page.url)
+
+        graph = LinkGraph(
+            outbound,
+            {target: tuple(sources) for target, sources in inbound.items()},
+            {page.url: page.title for page in pages},
+            urls_by_path,
+            broken,
+        )
+        if broken:
+            log.warning("broken_internal_links", pages=len(broken), links=sum(len(targets) for targets in broken.values()))
+        log.info(
+            "link_graph_built",
+            pages=len(pages),
+            links=sum(len(targets) for targets in outbound.values()),
+            extracted_pages=extracted,
+            orphans=len(graph.orphans),
+            ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        return graph
+
+    @property
+    def graph(self) -> LinkGraph:
+        """Current graph (rebuilt first if its sources changed)."""
+        return self._cache.get()
+
+    def backlinks(self, key: Union[str, Path]) -> tuple[Backlink, ...]:
+        """Pages linking to a page (see LinkGraph.backlinks)."""
+        return self.graph.backlinks(key)
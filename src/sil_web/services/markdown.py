@@ -2,46 +2,200 @@
 
 This service transforms markdown content into HTML with:
 - Rich markdown extensions (tables, code blocks, TOC)
-- Clean pipeline architecture (preprocess → render)
+- Clean pipeline architecture (parse → render → highlight → glossary links)
 - No link rewriting (source docs use clean URLs)
+- Rendered output cached per content hash (computed once per content change)
 """
 
+import hashlib
+import html as html_lib
 import re
-from typing import TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional
 
 import markdown
 import structlog
 
+try:
+    from pygments import highlight as pygments_highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+except ImportError:  # Optional: pip install "sil-website[highlight]"
+    pygments_highlight = None
+
+from sil_web.services.documents import parse_document
+
 if TYPE_CHECKING:
+    from sil_web.domain.models import ParsedDocument
     from sil_web.services.content import ContentService
+    from sil_web.services.glossary import GlossaryLinker
+
+# Fenced code blocks exactly as the fenced_code extension emits them:
+#   <pre><code class="language-python">...escaped source...</code></pre>
+CODE_BLOCK_PATTERN = re.compile(
+    r'<pre><code(?: class="language-(?P<lang>[\w+#.-]+)")?>(?P<code>.*?)</code></pre>',
+    re.DOTALL,
+)
+
+# Languages rendered client-side by something other than a highlighter
+# (page.html hands these blocks to mermaid.js, which replaces them with diagrams).
+CLIENT_RENDERED_LANGUAGES = {"mermaid"}
+
+
+class CodeHighlighter:
+    """Pygments-backed highlighting for fenced code blocks.
+
+    Runs as a post-render stage over the HTML fenced_code produces, so the
+    markdown extension setup stays untouched. Blocks with no language tag, an
+    unknown language, or a client-rendered language (mermaid) pass through
+    unchanged.
+
+    Usage:
+        highlighter = CodeHighlighter()
+        html = highlighter.highlight(rendered_html)
+    """
+
+    CSS_CLASS = "highlight"
+
+    def __init__(self) -> None:
+        """Initialize highlighter.
+
+        Raises:
+            RuntimeError: If Pygments is not installed
+        """
+        if pygments_highlight is None:
+            raise RuntimeError('Server-side highlighting requires Pygments: pip install "sil-website[highlight]"')
+        self.formatter = HtmlFormatter(nowrap=True)
+        self._lexers: dict[str, Any] = {}  # language -> lexer (None if unknown)
+
+    def _get_lexer(self, lang: str) -> Any:
+        if lang not in self._lexers:
+            try:
+                self._lexers[lang] = get_lexer_by_name(lang, stripnl=False, ensurenl=False)
+            except ClassNotFound:
+                self._lexers[lang] = None
+        return self._lexers[lang]
+
+    def _highlight_block(self, match: "re.Match[str]") -> str:
+        lang = match.group("lang")
+        if not lang or lang in CLIENT_RENDERED_LANGUAGES:
+            return match.group(0)
+
+        lexer = self._get_lexer(lang.lower())
+        if lexer is None:
+            return match.group(0)
+
+        source = html_lib.unescape(match.group("code"))
+        highlighted = pygments_highlight(source, lexer, self.formatter)
+        return f'<pre class="{self.CSS_CLASS}"><code class="language-{lang}">{highlighted}</code></pre>'
+
+    def highlight(self, html: str) -> str:
+        """Highlight every eligible fenced code block in rendered HTML.
+
+        Args:
+            html: HTML produced by the markdown stage
+
+        Returns:
+            HTML with code blocks replaced by Pygments token spans
+        """
+        return CODE_BLOCK_PATTERN.sub(self._highlight_block, html)
+
+    @classmethod
+    def stylesheet(cls, style: str = "default") -> str:
+        """Return the CSS rules for highlighted blocks (source of static/css/pygments.css).
+
+        Args:
+            style: Pygments style name
+
+        Returns:
+            CSS scoped to the highlight class
+        """
+        if pygments_highlight is None:
+            raise RuntimeError('Server-side highlighting requires Pygments: pip install "sil-website[highlight]"')
+        return str(HtmlFormatter(style=style).get_style_defs(f".{cls.CSS_CLASS}"))
 
 
 class MarkdownRenderer:
     """Elegant markdown rendering service.
 
     Provides a clean pipeline for transforming markdown → HTML with:
-    - Preprocessing (strip H1, normalize)
+    - Parsed input (frontmatter and H1 stripped once, by the document stage)
     - Rich markdown extensions (tables, fenced code, TOC)
+    - Optional server-side syntax highlighting (Pygments)
+    - Optional glossary auto-linking (first use of each term per page)
     - Clean URL handling (source docs use web-ready paths)
 
+    Rendered HTML is cached by content hash, so each document is rendered
+    (highlighted and glossary-linked) once per content change rather than once per request.
+
+    Thread-safe: renders run on the file I/O pool, so each thread converts
+    with its own markdown.Markdown (the parser is stateful) and the render
+    cache is locked.
+
     Usage:
         renderer = MarkdownRenderer(content_service)
+        html = renderer.render_document(read_document(path))
         html = renderer.render(markdown_text)
     """
 
-    def __init__(self, content_service: "ContentService"):
+    # Upper bound on cached renders (the whole docs tree is well under this)
+    CACHE_SIZE = 512
+
+    def __init__(
+        self,
+        content_service: "ContentService",
+        highlight: bool = False,
+        glossary: "GlossaryLinker | None" = None,
+    ):
         """Initialize markdown renderer.
 
         Args:
             content_service: Service for content discovery (unused but kept for compatibility)
+            highlight: Highlight fenced code blocks server-side with Pygments.
+                Falls back to client-side highlighting if Pygments is missing.
+            glossary: Link glossary terms to their entries (the glossary
+                document itself is never linked)
         """
         self.content_service = content_service
         self.log = structlog.get_logger()
 
-        # Configure markdown with extensions
-        self.md = self._configure_markdown()
+        # One configured markdown.Markdown per thread (see the md property)
+        self._local = threading.local()
+
+        # Optional highlight stage
+        self.highlighter: Optional[CodeHighlighter] = None
+        if highlight:
+            if pygments_highlight is None:
+                self.log.warning("server_highlight_unavailable", reason="pygments not installed")
+            else:
+                self.highlighter = CodeHighlighter()
 
-        self.log.info("markdown_renderer_initialized")
+        self.glossary = glossary
+
+        # (entry point, glossary linked, content hash) -> rendered HTML (LRU)
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self.log.info(
+            "markdown_renderer_initialized",
+            server_highlight=self.highlight_enabled,
+            glossary_terms=len(glossary.automaton) if glossary is not None else 0,
+        )
+
+    @property
+    def highlight_enabled(self) -> bool:
+        """True if code blocks are highlighted server-side (page.html then skips highlight.js)."""
+        return self.highlighter is not None
+
+    @property
+    def md(self) -> markdown.Markdown:
+        """This thread's markdown processor (created on first use)."""
+        md = getattr(self._local, "md", None)
+        if md is None:
+            md = self._local.md = self._configure_markdown()
+        return md
 
     def _configure_markdown(self) -> markdown.Markdown:
         """Configure markdown processor with extensions.
@@ -67,11 +221,11 @@ class MarkdownRenderer:
         )
 
     def render(self, content: str) -> str:
-        """Render markdown to HTML with full pipeline.
+        """Render raw markdown (frontmatter and H1 allowed) to HTML.
 
-        Pipeline stages:
-        1. Preprocess: Clean and prepare markdown
-        2. Render: Apply markdown extensions
+        For generated markdown (e.g. the essays index). Files on disk should
+        go through read_document() and render_document() instead, so they
+        are parsed once and shared with every other consumer.
 
         Args:
             content: Raw markdown content
@@ -79,73 +233,92 @@ class MarkdownRenderer:
         Returns:
             Rendered HTML
         """
-        # Stage 1: Preprocess
-        content = self._preprocess(content)
-
-        # Stage 2: Render with extensions
-        html = self.md.convert(content)
-
-        # IMPORTANT: Reset state for next render
-        # markdown.Markdown is stateful and reuses internal structures
-        self.md.reset()
-
+        key = self._cache_key("raw", self.glossary is not None, content)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        html = self._render_body(parse_document(content).body)
+        self._cache_put(key, html)
         return html
 
-    def _preprocess(self, content: str) -> str:
-        """Preprocess markdown before rendering.
+    def render_document(self, doc: "ParsedDocument") -> str:
+        """Render a parsed document's body to HTML.
+
+        Pipeline stages (frontmatter/H1 were already stripped by the parse stage):
+        1. Render: Apply markdown extensions
+        2. Highlight: Pygments token markup for fenced code (if enabled)
+        3. Link: first occurrence of each glossary term (if enabled)
 
-        Current operations:
-        - Strip YAML frontmatter (metadata handled separately)
-        - Strip first H1 (template provides page header)
-        - Normalize line endings
+        Results are cached by content hash (and whether the glossary was
+        linked); a cache hit skips every stage.
 
         Args:
-            content: Raw markdown
+            doc: Document from read_document()/parse_document()
 
         Returns:
-            Preprocessed markdown
+            Rendered HTML
         """
-        # Strip YAML frontmatter (between --- delimiters)
-        content = self._strip_frontmatter(content)
-
-        # Strip first H1 to avoid duplicate h1 tags
-        # (HTML semantic structure: one h1 per page)
-        content = self._strip_first_h1(content)
-
-        return content
+        link_glossary = self.glossary is not None and (doc.path is None or doc.path != self.glossary.source)
+        key = self._cache_key("document", link_glossary, doc.body)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        html = self._render_body(doc.body, link_glossary)
+        self._cache_put(key, html)
+        return html
 
-    def _strip_frontmatter(self, text: str) -> str:
-        """Remove YAML frontmatter from markdown.
+    def _render_body(self, body: str, link_glossary: bool = True) -> str:
+        # Stage 1: Render with extensions
+        md = self.md
+        html = md.convert(body)
 
-        Frontmatter is metadata between --- delimiters at the start of file.
-        Example:
-            ---
-            title: "Page Title"
-            description: "Page description"
-            ---
+        # IMPORTANT: Reset state for next render
+        # markdown.Markdown is stateful and reuses internal structures
+        md.reset()
 
-        Args:
-            text: Markdown content
+        # Stage 2: Highlight code blocks
+        if self.highlighter is not None:
+            html = self.highlighter.highlight(html)
 
-        Returns:
-            Content with frontmatter removed
-        """
-        # Match YAML frontmatter: starts with ---, ends with ---
-        # Must be at very beginning of file
-        pattern = r"^---\s*\n.*?\n---\s*\n"
-        return re.sub(pattern, "", text, count=1, flags=re.DOTALL)
+        # Stage 3: Link glossary terms
+        if link_glossary and self.glossary is not None:
+            html = self.glossary.link(html)
 
-    def _strip_first_h1(self, text: str) -> str:
-        """Remove first h1 heading to avoid duplicate h1 tags.
+        return html
 
-        Templates provide the page header, so we remove the markdown h1
-        to maintain proper semantic HTML structure.
+    @staticmethod
+    def _cache_key(entry: str, linked: bool, text: str) -> str:
+        # Raw content and a parsed body can be the same text yet render
+        # differently, as can one body with and without glossary links
+        return f"{entry}:{'linked' if linked else 'plain'}:{hashlib.sha1(text.encode('utf-8')).hexdigest()}"
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key: str, html: str) -> None:
+        with self._cache_lock:
+            self._cache[key] = html
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached renders (e.g. after a docs sync)."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def evict(self, text: str) -> bool:
+        """Drop the cached renders of one body (a document that changed).
 
         Args:
-            text: Markdown content
+            text: Markdown the render was cached under (ParsedDocument.body)
 
         Returns:
-            Content with first h1 removed
+            True if a render was cached
         """
-        pattern = r'^#\s+.+$'
-        return re.sub(pattern, '', text, count=1, flags=re.MULTILINE)
+        keys = [self._cache_key("document", linked, text) for linked in (True, False)]
+        with self._cache_lock:
+            return sum(self._cache.pop(key, None) is not None for key in keys) > 0
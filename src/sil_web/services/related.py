@@ -0,0 +1,262 @@
+"""
+Related reading - each page's nearest neighbours by TF-IDF similarity.
+
+Every published page becomes a TF-IDF vector over its body text, its title
+and its frontmatter tags and beth_topics (weighted up: they're the author's
+own statement of what the page is about). The cosine similarity of every
+pair is computed in one pass when the graph is built -- blocked matrix
+products with NumPy if it's installed (pip install "sil-website[related]";
+the Docker image does), sparse dot products over an inverted index in pure
+Python otherwise -- and only each page's top few neighbours are kept.
+
+A request then costs one dict lookup. The graph is rebuilt through a
+GenerationCache when the docs change; pages are re-tokenized only when
+their source changed (their term counts are cached by page digest), so a
+rebuild is just the similarity pass.
+"""
+
+import math
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+import structlog
+
+try:
+    import numpy as np
+except ImportError:  # Optional: pip install "sil-website[related]"
+    np = None  # type: ignore[assignment]
+
+from sil_web.domain.models import RelatedLink
+from sil_web.services.cache import GenerationCache
+from sil_web.services.search import SearchPage, markdown_to_text, page_key, tokenize
+
+if TYPE_CHECKING:
+    from sil_web.services.content import ContentService
+
+log = structlog.get_logger()
+
+# Neighbours kept per page
+RELATED_PER_PAGE = 5
+
+# A tag/topic (or title word) counts as this many body occurrences
+TOPIC_WEIGHT = 8
+TITLE_WEIGHT = 3
+
+# Terms in fewer pages than this can't relate two pages; terms in more than
+# this fraction of pages relate all of them (the, and, semantic, ...)
+MIN_DF = 2
+MAX_DF_RATIO = 0.5
+
+# Pairs below this cosine similarity are not worth suggesting
+MIN_SIMILARITY = 0.05
+
+# Pages per NumPy similarity block. Vectors are densified one block at a
+# time, so memory is bounded at 2 x BLOCK x vocabulary floats for the two
+# blocks being multiplied, plus BLOCK x pages for their rows' scores
+SIMILARITY_BLOCK = 512
+
+
+def page_terms(page: SearchPage) -> Counter[str]:
+    """Weighted term counts of a page: body, title, tags and topics.
+
+    Tags and topics become single "#topic" features, so they only match
+    the same tag on another page, never a body word.
+
+    Args:
+        page: Published page
+
+    Returns:
+        Term -> weighted count
+    """
+    counts = Counter(tokenize(markdown_to_text(page.document.body)))
+    for term in tokenize(page.title):
+        counts[term] += TITLE_WEIGHT
+    metadata = page.document.metadata
+    for field in ("tags", "beth_topics"):
+        values = metadata.get(field) or []
+        for value in values if isinstance(values, list) else [values]:
+            counts["#" + "-".join(tokenize(str(value)))] += TOPIC_WEIGHT
+    return counts
+
+
+def tfidf_vectors(documents: list[Counter[str]]) -> list[dict[int, float]]:
+    """Unit-length TF-IDF vectors (sublinear tf, smoothed idf) as sparse dicts.
+
+    Args:
+        documents: Term counts per document
+
+    Returns:
+        Per document, term id -> weight (terms outside MIN_DF..MAX_DF_RATIO dropped)
+    """
+    n = len(documents)
+    df: Counter[str] = Counter()
+    for counts in documents:
+        df.update(counts.keys())
+    max_df = max(MIN_DF, MAX_DF_RATIO * n)
+    vocabulary = {term: term_id for term_id, term in enumerate(sorted(t for t, d in df.items() if MIN_DF <= d <= max_df))}
+    idf = {term: math.log((1 + n) / (1 + df[term])) + 1 for term in vocabulary}
+
+    vectors = []
+    for counts in documents:
+        vector = {vocabulary[term]: (1 + math.log(count)) * idf[term] for term, count in counts.items() if term in vocabulary}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        vectors.append({term_id: weight / norm for term_id, weight in vector.items()} if norm else {})
+    return vectors
+
+
+def _neighbours_python(vectors: list[dict[int, float]], k: int) -> list[list[tuple[int, float]]]:
+    postings: dict[int, list[tuple[int, float]]] = {}
+    for doc_id, vector in enumerate(vectors):
+        for term_id, weight in vector.items():
+            postings.setdefault(term_id, []).append((doc_id, weight))
+
+    neighbours = []
+    for doc_id, vector in enumerate(vectors):
+        scores: dict[int, float] = {}
+        for term_id, weight in vector.items():
+            for other, other_weight in postings[term_id]:
+                if other != doc_id:
+                    scores[other] = scores.get(other, 0.0) + weight * other_weight
+        ranked = sorted((item for item in scores.items() if item[1] >= MIN_SIMILARITY), key=lambda item: (-item[1], item[0]))
+        neighbours.append(ranked[:k])
+    return neighbours
+
+
+def _neighbours_numpy(vectors: list[dict[int, float]], k: int) -> list[list[tuple[int, float]]]:
+    assert np is not None
+    n = len(vectors)
+    width = 1 + max((term_id for vector in vectors for term_id in vector), default=0)
+
+    def dense(start: int) -> "np.ndarray":
+        chunk = vectors[start : start + SIMILARITY_BLOCK]
+        matrix = np.zeros((len(chunk), width))
+        rows = [row for row, vector in enumerate(chunk) for _ in vector]
+        cols = [term_id for vector in chunk for term_id in vector]
+        matrix[rows, cols] = [weight for vector in chunk for weight in vector.values()]
+        return matrix
+
+    neighbours = []
+    for start in range(0, n, SIMILARITY_BLOCK):
+        rows = dense(start)
+        block = np.empty((len(rows), n))
+        for other in range(0, n, SIMILARITY_BLOCK):
+            columns = rows if other == start else dense(other)
+            block[:, other : other + len(columns)] = rows @ columns.T
+        block[np.arange(len(block)), np.arange(start, start + len(block))] = -1.0  # not related to itself
+        order = np.argsort(-block, axis=1, kind="stable")[:, :k]
+        for row, columns in enumerate(order):
+            scores = block[row, columns]
+            neighbours.append([(int(other), float(score)) for other, score in zip(columns, scores) if score >= MIN_SIMILARITY])
+    return neighbours
+
+
+def nearest_neighbours(vectors: list[dict[int, float]], k: int = RELATED_PER_PAGE) -> list[list[tuple[int, float]]]:
+    """Top-k most similar other documents of every document.
+
+    Args:
+        vectors: Unit-length sparse vectors (tfidf_vectors)
+        k: Neighbours per document
+
+    Returns:
+        Per document, (document id, cosine similarity) best first (ties by
+        id), MIN_SIMILARITY and above only
+    """
+    if not vectors:
+        return []
+    if np is not None:
+        return _neighbours_numpy(vectors, k)
+    return _neighbours_python(vectors, k)
+
+
+@dataclass(frozen=True)
+class RelatedGraph:
+    """Each page's related reading, looked up by URL or source file."""
+
+    by_url: dict[str, tuple[RelatedLink, ...]]
+    urls_by_path: dict[Path, str]
+
+    def related(self, key: Union[str, Path]) -> tuple[RelatedLink, ...]:
+        """Related pages of a page.
+
+        Args:
+            key: Page URL, or its source file (any URL alias of it resolves)
+
+        Returns:
+            Up to RELATED_PER_PAGE links, most similar first (empty if unknown)
+        """
+        url = self.urls_by_path.get(key) if isinstance(key, Path) else key
+        return self.by_url.get(url, ()) if url is not None else ()
+
+
+class RelatedService:
+    """The current related-reading graph, rebuilt when the docs change.
+
+    Usage:
+        service = RelatedService(collect_pages, lambda: tree_signature([docs]), content_service)
+        service.related("/systems/reveal")
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], list[SearchPage]],
+        signature: Callable[[], object],
+        content_service: Optional["ContentService"] = None,
+        check_interval: float = 30.0,
+        per_page: int = RELATED_PER_PAGE,
+    ):
+        """Initialize service (the graph is built on first use).
+
+        Args:
+            collect: Produces the pages to relate
+            signature: Cheap change detector for the pages' sources
+            content_service: Source of the content generation (optional)
+            check_interval: Seconds between signature checks (0 = every lookup)
+            per_page: Neighbours kept per page
+        """
+        self.collect = collect
+        self.per_page = per_page
+        self._terms: dict[str, tuple[str, Counter[str]]] = {}  # page URL -> (page_key, term counts)
+        self._cache: GenerationCache[RelatedGraph] = GenerationCache(
+            self._build, signature, content_service, check_interval=check_interval, name="related-graph"
+        )
+
+    def _build(self) -> RelatedGraph:
+        started = time.perf_counter()
+        pages = self.collect()
+        terms = {}
+        retokenized = 0
+        for page in pages:
+            key = page_key(page)
+            cached = self._terms.get(page.url)
+            if cached is None or cached[0] != key:
+                cached = (key, page_terms(page))
+                retokenized += 1
+            terms[page.url] = cached
+        self._terms = terms
+
+        neighbours = nearest_neighbours(tfidf_vectors([terms[page.url][1] for page in pages]), self.per_page)
+        by_url = {
+            page.url: tuple(RelatedLink(pages[other].url, pages[other].title, round(score, 4)) for other, score in links)
+            for page, links in zip(pages, neighbours)
+        }
+        urls_by_path = {page.document.path: page.url for page in pages if page.document.path is not None}
+        log.info(
+            "related_graph_built",
+            pages=len(pages),
+            retokenized_pages=retokenized,
+            backend="numpy" if np is not None else "python",
+            ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        return RelatedGraph(by_url, urls_by_path)
+
+    @property
+    def graph(self) -> RelatedGraph:
+        """Current graph (rebuilt first if its sources changed)."""
+        return self._cache.get()
+
+    def related(self, key: Union[str, Path]) -> tuple[RelatedLink, ...]:
+        """Related pages of a page (see RelatedGraph.related)."""
+        return self.graph.related(key)
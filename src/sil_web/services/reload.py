@@ -0,0 +1,154 @@
+"""
+Content reload - apply a docs sync's change manifest to the running app.
+
+scripts/sync-docs.py writes a change manifest after every sync that changed
+something: the added, modified and removed docs/-relative paths, a new
+content generation id, and the generation the sync started from. Reloading
+applies it:
+
+- parsed documents and renders of the changed files are dropped (renders
+  are keyed by content, so every other page's cached render stays valid);
+- slug discovery is redone only for the categories that gained or lost a file;
+- the glossary linker is rebuilt if the glossary changed (every render links
+  its terms, so that alone empties the render cache);
+- a new content generation makes the generation-keyed caches -- sitemap,
+  route table, nav, search, related reading, link graph -- rebuild at once
+  instead of at their next tree check. Search, related reading and the link
+  graph cache their per-page work by page digest, so only changed pages are
+  re-analyzed.
+
+A manifest can only be applied on top of the generation it was written
+against. If the app missed a sync (its generation isn't the manifest's
+`previous`), every content cache is flushed instead.
+
+Reloads are serialized: a reload that overlaps another waits for it, then
+finds the manifest already applied.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import structlog
+
+from sil_web.domain.models import ContentChanges
+
+if TYPE_CHECKING:
+    from sil_web.services.content import ContentService
+    from sil_web.services.glossary import GlossaryLinker
+    from sil_web.services.markdown import MarkdownRenderer
+
+log = structlog.get_logger()
+
+
+def read_change_manifest(path: Path) -> Optional[ContentChanges]:
+    """Load a sync's change manifest.
+
+    Args:
+        path: Manifest written by scripts/sync-docs.py
+
+    Returns:
+        ContentChanges, or None if missing or unreadable
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return ContentChanges(
+            generation=str(data["generation"]),
+            previous=data.get("previous"),
+            added=tuple(data.get("added", ())),
+            modified=tuple(data.get("modified", ())),
+            removed=tuple(data.get("removed", ())),
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        log.warning("change_manifest_unreadable", path=str(path), error=str(e))
+        return None
+
+
+class ContentReloader:
+    """Applies docs sync change manifests to the app's caches.
+
+    Usage:
+        reloader = ContentReloader(content_service, markdown_renderer, Path("docs/.sync-changes.json"), [Path("docs")])
+        reloader.reload()  # after each sync
+    """
+
+    def __init__(
+        self,
+        content_service: "ContentService",
+        markdown_renderer: "MarkdownRenderer",
+        manifest_path: Path,
+        roots: Iterable[Path] = (),
+        glossary: Optional[Callable[[], Optional["GlossaryLinker"]]] = None,
+        warm: Iterable[Callable[[], object]] = (),
+    ):
+        """Initialize reloader at the generation of the docs on disk.
+
+        Args:
+            content_service: Parsed documents and slug discovery
+            markdown_renderer: Render cache (and glossary linker)
+            manifest_path: Where sync-docs.py writes its change manifest
+            roots: Docs trees the manifest's paths are relative to, besides
+                the content service's own
+            glossary: Rebuilds the glossary linker (when the glossary changed)
+            warm: Rebuilds to run after a reload (indexes), so requests don't
+        """
+        self.content_service = content_service
+        self.markdown_renderer = markdown_renderer
+        self.manifest_path = manifest_path
+        self.roots = tuple(roots)
+        self.glossary = glossary
+        self.warm = tuple(warm)
+        self._lock = threading.Lock()
+        manifest = read_change_manifest(manifest_path)
+        self.generation: Optional[str] = manifest.generation if manifest is not None else None
+
+    def reload(self) -> dict[str, Any]:
+        """Apply the current change manifest, if it is new.
+
+        Returns:
+            status ("unchanged", "applied" or "flushed"), generation, and for
+            an applied manifest the number of changed paths and evicted renders
+        """
+        with self._lock:
+            started = time.perf_counter()
+            changes = read_change_manifest(self.manifest_path)
+            if changes is None or changes.generation == self.generation:
+                return {"status": "unchanged", "generation": self.generation}
+
+            if changes.previous == self.generation:
+                result: dict[str, Any] = {"status": "applied", **self._apply(changes)}
+            else:
+                self._flush()
+                result = {"status": "flushed"}
+            self.generation = changes.generation
+
+            for build in self.warm:
+                build()
+        result.update(generation=self.generation, ms=round((time.perf_counter() - started) * 1000, 1))
+        log.info("content_reloaded", **result)
+        return result
+
+    def _apply(self, changes: ContentChanges) -> dict[str, Any]:
+        dropped = self.content_service.apply_changes(changes, self.roots)
+        evicted = sum(self.markdown_renderer.evict(document.body) for document in dropped)
+
+        linker = self.markdown_renderer.glossary
+        if linker is not None and linker.source is not None and self.glossary is not None:
+            changed = {root / path for root in (self.content_service.docs_path, *self.roots) for path in changes.paths}
+            if linker.source.resolve() in {path.resolve() for path in changed}:
+                self.markdown_renderer.glossary = self.glossary()
+                self.markdown_renderer.clear_cache()
+                log.info("glossary_reloaded")
+        return {"paths": len(changes.paths), "renders_evicted": evicted}
+
+    def _flush(self) -> None:
+        log.warning("content_reload_missed_generation", generation=self.generation, manifest_path=str(self.manifest_path))
+        self.content_service.invalidate()
+        if self.glossary is not None and self.markdown_renderer.glossary is not None:
+            self.markdown_renderer.glossary = self.glossary()
+        self.markdown_renderer.clear_cache()
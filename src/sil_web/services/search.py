@@ -0,0 +1,973 @@
+"""
+Search service - full-text search over the published docs, per section.
+
+Every page is split at its h2-h4 headings (ParsedDocument.sections, whose
+anchors are the ids the renderer gives those headings), so a hit deep-links
+to /foundations/agent-bootstrap-manual#boot-status rather than to an 80 KB
+page. Sections go into an inverted index kept in flat typed arrays: each
+term owns a contiguous run of postings (section id, term frequency), and
+each posting a run of token positions. A query is a few array scans plus a
+heap selection -- BM25 ranking, quoted phrases checked against positions,
+snippets cut around the densest cluster of matched positions -- with no
+section re-read or re-tokenized.
+
+The index is updated through a GenerationCache (services/cache.py) when the
+content generation or the docs tree signature changes. Updates are
+incremental: only pages whose source changed are re-analyzed, into a small
+delta segment searched alongside the main one (SearchService).
+
+The main segment can be saved as a snapshot file at deploy time
+(scripts/build-search-index.py): the same flat arrays, a sorted term table
+and the section strings, laid out for mmap. Workers map it read-only -- no
+tokenizing, no dict of terms, no copies, the OS page cache shared by every
+worker -- and serve from it at once; the first change check then compares
+each page's source digest against the snapshot's and re-analyzes only the
+pages that differ, as for any other update.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Sequence, Union, overload
+
+import structlog
+
+from sil_web.domain.models import ParsedDocument, SearchHit, SearchResults, Snippet
+from sil_web.services.cache import GenerationCache
+
+if TYPE_CHECKING:
+    from sil_web.services.content import ContentService
+
+log = structlog.get_logger()
+
+# Letters and digits; "_" and punctuation separate tokens
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+PHRASE_PATTERN = re.compile(r'"([^"]*)"')
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# A heading (or page title) occurrence counts as this many body occurrences
+TITLE_WEIGHT = 3
+
+# Sections shown per page before the next page's (keeps one long doc from
+# filling every result)
+MAX_HITS_PER_PAGE = 2
+
+# The delta segment is merged into a new main segment once it holds more
+# than this fraction of all sections
+MERGE_RATIO = 0.25
+
+# Query terms beyond this are ignored (bounds the cost of a query)
+MAX_QUERY_TERMS = 32
+
+# Snippet window, in tokens, and how much of it precedes the first match
+SNIPPET_TOKENS = 32
+SNIPPET_LEAD = 6
+# Matches considered when placing the snippet (each term's earliest ones),
+# so very common terms don't make snippets cost more than the ranking
+SNIPPET_CANDIDATES = 128
+ELLIPSIS = "…"
+
+# Snapshot file: magic, then a little header (JSON) locating the arrays and
+# string tables in the data that follows. Bump SNAPSHOT_FORMAT whenever the
+# layout or the analysis (tokenizing, weighting) changes.
+SNAPSHOT_MAGIC = b"SILSRCH\0"
+SNAPSHOT_FORMAT = 1
+_SNAPSHOT_ARRAYS = (
+    "lengths",
+    "doc_ids",
+    "freqs",
+    "term_start",
+    "position_start",
+    "positions",
+    "token_starts",
+    "doc_tokens",
+    "term_offsets",
+    "field_offsets",
+)
+_DOCUMENT_FIELDS = 5  # url, title, text, category, section
+
+# Markdown syntax that isn't text: (pattern, replacement), applied in order
+_MARKDOWN_NOISE = [
+    (re.compile(r"<!--.*?-->", re.DOTALL), " "),
+    (re.compile(r"!\[([^\]]*)\]\([^)]*\)"), r"\1"),  # images -> alt text
+    (re.compile(r"\[([^\]]+)\]\([^)]*\)"), r"\1"),  # links -> link text
+    (re.compile(r"</?[A-Za-z][^>\n]*>"), " "),  # inline HTML tags
+    (re.compile(r"^ {0,3}(?:#{1,6}|>|[-*+]|\d+\.)[ \t]+", re.MULTILINE), ""),  # block markers
+    (re.compile(r"[*`|]+"), " "),  # emphasis, code spans and fences, table pipes
+    (re.compile(r"\s+"), " "),
+]
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased index terms of text."""
+    return [token.lower() for token in TOKEN_PATTERN.findall(text)]
+
+
+def markdown_to_text(markdown_text: str) -> str:
+    """Plain text of a markdown body, as searched and shown in snippets.
+
+    Args:
+        markdown_text: Markdown source (frontmatter already stripped)
+
+    Returns:
+        Text on a single line, markup removed
+    """
+    text = markdown_text
+    for pattern, replacement in _MARKDOWN_NOISE:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+
+def parse_query(query: str) -> tuple[list[str], list[list[str]]]:
+    """Split a query into terms and quoted phrases.
+
+    Args:
+        query: e.g. 'agents "progressive disclosure"'
+
+    Returns:
+        (all terms, phrase terms included; phrases as term lists)
+    """
+    phrases = [terms for terms in (tokenize(p) for p in PHRASE_PATTERN.findall(query)) if terms]
+    terms = [term for phrase in phrases for term in phrase] + tokenize(PHRASE_PATTERN.sub(" ", query))
+    return terms[:MAX_QUERY_TERMS], phrases
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    """One indexed unit: a page section, deep-linked by its heading anchor."""
+
+    url: str  # Page URL, plus #anchor for everything after the first heading
+    title: str  # Page title
+    text: str
+    category: str = ""
+    section: str = ""  # Heading text ("" for the top of the page)
+
+    @property
+    def page(self) -> str:
+        """Page URL without the anchor."""
+        return self.url.partition("#")[0]
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    """A published page handed to the index: where it lives and its parsed source."""
+
+    url: str
+    title: str
+    category: str
+    document: ParsedDocument
+
+
+def page_key(page: SearchPage) -> str:
+    """Digest of everything a page's index entries derive from.
+
+    Args:
+        page: Published page
+
+    Returns:
+        Hex digest of its source, title and category
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (page.document.raw, page.title, page.category):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class AnalyzedDocument:
+    """A SearchDocument tokenized for indexing; reused until its page changes."""
+
+    terms: dict[str, tuple[int, list[int]]]  # term -> (weighted tf, body positions)
+    token_starts: array  # Character offset of each body token
+    length: int  # Weighted length for BM25
+
+
+def page_sections(page: SearchPage) -> list[SearchDocument]:
+    """Split a page into its section documents (text before the first heading first).
+
+    Args:
+        page: Published page
+
+    Returns:
+        One SearchDocument per ParsedDocument section
+    """
+    sections = page.document.sections
+    if not sections:
+        return [SearchDocument(page.url, page.title, markdown_to_text(page.document.body), page.category)]
+    return [
+        SearchDocument(
+            url=f"{page.url}#{section.anchor}" if section.anchor else page.url,
+            title=page.title,
+            text=markdown_to_text(section.markdown),
+            category=page.category,
+            section=section.title or "",
+        )
+        for section in sections
+    ]
+
+
+def analyze(document: SearchDocument) -> AnalyzedDocument:
+    """Tokenize a document's body, heading and page title.
+
+    Args:
+        document: Section to analyze
+
+    Returns:
+        AnalyzedDocument
+    """
+    positions: dict[str, list[int]] = {}
+    token_starts = array("I")
+    for position, match in enumerate(TOKEN_PATTERN.finditer(document.text)):
+        positions.setdefault(match.group().lower(), []).append(position)
+        token_starts.append(match.start())
+
+    # The heading (or, at the top of the page, the page title) is weighted;
+    # a section's page title counts once, as context
+    weights: Counter[str] = Counter()
+    for term in tokenize(document.section or document.title):
+        weights[term] += TITLE_WEIGHT
+    if document.section:
+        weights.update(tokenize(document.title))
+
+    terms = {
+        term: (len(positions.get(term, ())) + weights[term], positions.get(term, []))
+        for term in positions.keys() | weights.keys()
+    }
+    return AnalyzedDocument(terms=terms, token_starts=token_starts, length=len(token_starts) + sum(weights.values()))
+
+
+class IndexSegment:
+    """Immutable inverted index over a list of documents, in flat arrays.
+
+    Usage:
+        segment = IndexSegment([SearchDocument("/systems/reveal", "Reveal", text, "systems")])
+        segment.postings("reveal")  # -> (start, end) run of postings, or None
+    """
+
+    documents: Sequence[SearchDocument]
+    # Flat arrays: array("I") when built, read-only views of the file when
+    # mapped from a snapshot (MappedSegment)
+    lengths: Sequence[int]
+    doc_ids: Sequence[int]
+    freqs: Sequence[int]
+    _term_start: Sequence[int]
+    _position_start: Sequence[int]
+    _positions: Sequence[int]
+    _token_starts: Sequence[int]
+    _doc_tokens: Sequence[int]
+
+    def __init__(self, documents: Iterable[SearchDocument], analyzed: Optional[list[AnalyzedDocument]] = None):
+        """Index documents.
+
+        Args:
+            documents: Documents to index (ids are their order)
+            analyzed: Their analyses, if already done (e.g. cached from an
+                earlier build); computed here if omitted
+        """
+        self.documents = list(documents)
+        if analyzed is None:
+            analyzed = [analyze(document) for document in self.documents]
+
+        postings: dict[str, list[tuple[int, int, list[int]]]] = {}
+        lengths = array("I")
+        # Start offset of every body token, all documents; doc d's tokens
+        # are _token_starts[_doc_tokens[d]:_doc_tokens[d + 1]]
+        token_starts = array("I")
+        doc_tokens = array("I", [0])
+        for doc_id, analysis in enumerate(analyzed):
+            token_starts.extend(analysis.token_starts)
+            doc_tokens.append(len(token_starts))
+            lengths.append(analysis.length)
+            for term, (tf, term_positions) in analysis.terms.items():
+                postings.setdefault(term, []).append((doc_id, tf, term_positions))
+
+        # Term t (ids in sorted term order) has postings [_term_start[t],
+        # _term_start[t + 1]), doc ids ascending; posting i's positions are
+        # _positions[_position_start[i]:_position_start[i + 1]].
+        self._terms: dict[str, int] = {}
+        term_start = array("I", [0])
+        doc_ids = array("I")
+        freqs = array("I")
+        position_start = array("I", [0])
+        positions = array("I")
+        for term_id, term in enumerate(sorted(postings)):
+            self._terms[term] = term_id
+            for doc_id, tf, term_positions in postings[term]:
+                doc_ids.append(doc_id)
+                freqs.append(tf)
+                positions.extend(term_positions)
+                position_start.append(len(positions))
+            term_start.append(len(doc_ids))
+
+        self.lengths, self.doc_ids, self.freqs = lengths, doc_ids, freqs
+        self._term_start, self._position_start, self._positions = term_start, position_start, positions
+        self._token_starts, self._doc_tokens = token_starts, doc_tokens
+
+    def __len__(self) -> int:
+        """Number of indexed documents (sections)."""
+        return len(self.documents)
+
+    @property
+    def term_count(self) -> int:
+        """Number of distinct terms."""
+        return len(self._terms)
+
+    @property
+    def terms(self) -> list[str]:
+        """Distinct terms, in term id order."""
+        return sorted(self._terms, key=self._terms.__getitem__)
+
+    def postings(self, term: str) -> Optional[tuple[int, int]]:
+        """Run of a term's postings in doc_ids/freqs, or None if absent."""
+        term_id = self._terms.get(term)
+        if term_id is None:
+            return None
+        return self._term_start[term_id], self._term_start[term_id + 1]
+
+    def _doc_positions(self, doc_id: int, postings: tuple[int, int]) -> Sequence[int]:
+        """Positions of a term in one document (empty if it doesn't occur in the body)."""
+        start, end = postings
+        i = bisect_left(self.doc_ids, doc_id, start, end)
+        if i == end or self.doc_ids[i] != doc_id:
+            return ()
+        return self._positions[self._position_start[i]:self._position_start[i + 1]]
+
+    def has_phrase(self, doc_id: int, phrase: list[str], postings: dict[str, tuple[int, int]]) -> bool:
+        """True if the phrase's terms occur consecutively in the document's body."""
+        if any(term not in postings for term in phrase):
+            return False
+        following = [set(self._doc_positions(doc_id, postings[term])) for term in phrase[1:]]
+        return any(
+            all(position + offset in positions for offset, positions in enumerate(following, start=1))
+            for position in self._doc_positions(doc_id, postings[phrase[0]])
+        )
+
+    def snippet(self, doc_id: int, postings: dict[str, tuple[int, int]]) -> Snippet:
+        """Window of the body holding the most distinct query terms."""
+        text = self.documents[doc_id].text
+        base = self._doc_tokens[doc_id]
+        token_count = self._doc_tokens[doc_id + 1] - base
+        if token_count == 0:
+            return Snippet(text=text)
+
+        per_term = max(8, SNIPPET_CANDIDATES // len(postings))
+        matched = sorted(
+            (position, term)
+            for term, term_postings in postings.items()
+            for position in self._doc_positions(doc_id, term_postings)[:per_term]
+        )
+
+        # Slide a SNIPPET_TOKENS-wide window over the matches; prefer more
+        # distinct terms, then more matches
+        best_first, best_distinct, best_count = 0, 0, 0
+        in_window: dict[str, int] = {}
+        left = 0
+        for right, (position, term) in enumerate(matched):
+            in_window[term] = in_window.get(term, 0) + 1
+            while position - matched[left][0] >= SNIPPET_TOKENS:
+                dropped = matched[left][1]
+                in_window[dropped] -= 1
+                if not in_window[dropped]:
+                    del in_window[dropped]
+                left += 1
+            distinct, count = len(in_window), right - left + 1
+            if distinct > best_distinct or (distinct == best_distinct and count > best_count):
+                best_first, best_distinct, best_count = matched[left][0], distinct, count
+
+        first = max(0, best_first - SNIPPET_LEAD)
+        last = min(first + SNIPPET_TOKENS, token_count)  # exclusive
+        starts = self._token_starts
+        start_char = 0 if first == 0 else starts[base + first]
+        if last == token_count:
+            end_char = len(text)
+        else:
+            end_match = TOKEN_PATTERN.match(text, starts[base + last - 1])
+            end_char = end_match.end() if end_match else len(text)
+
+        prefix = ELLIPSIS + " " if start_char > 0 else ""
+        shift = len(prefix) - start_char
+        highlights = []
+        for position, _ in matched:
+            if first <= position < last:
+                token_start = starts[base + position]
+                token = TOKEN_PATTERN.match(text, token_start)
+                if token:
+                    highlights.append((token_start + shift, token.end() + shift))
+
+        suffix = " " + ELLIPSIS if end_char < len(text) else ""
+        return Snippet(text=prefix + text[start_char:end_char] + suffix, highlights=tuple(highlights))
+
+    def write_snapshot(self, path: Path, pages: list[tuple[str, str, range]]) -> None:
+        """Save the segment as an mmap-able snapshot (see MappedSegment).
+
+        Written to a temporary file and renamed into place, so workers
+        starting meanwhile see the old snapshot or the new one, never half.
+
+        Args:
+            path: Snapshot file
+            pages: (URL, page_key, doc id range) of every page in the segment
+        """
+        term_blob, term_offsets = _string_table(self.terms)
+        fields = (
+            field
+            for document in self.documents
+            for field in (document.url, document.title, document.text, document.category, document.section)
+        )
+        field_blob, field_offsets = _string_table(fields)
+        arrays = {
+            "lengths": self.lengths,
+            "doc_ids": self.doc_ids,
+            "freqs": self.freqs,
+            "term_start": self._term_start,
+            "position_start": self._position_start,
+            "positions": self._positions,
+            "token_starts": self._token_starts,
+            "doc_tokens": self._doc_tokens,
+            "term_offsets": term_offsets,
+            "field_offsets": field_offsets,
+        }
+
+        # Data: every array, then the two string blobs, each 8-byte aligned
+        chunks: list[bytes] = []
+        layout: dict[str, list[int]] = {}
+        offset = 0
+        for name, data in [*arrays.items(), ("terms", term_blob), ("fields", field_blob)]:
+            raw = array("I", data).tobytes() if name in arrays else bytes(data)
+            layout[name] = [offset, len(raw)]
+            padding = -len(raw) % 8
+            chunks.append(raw + b"\0" * padding)
+            offset += len(raw) + padding
+
+        header = json.dumps(
+            {
+                "format": SNAPSHOT_FORMAT,
+                "byteorder": sys.byteorder,
+                "itemsize": array("I").itemsize,
+                "documents": len(self.documents),
+                "layout": layout,
+                "pages": [[url, key, doc_range.start, doc_range.stop] for url, key, doc_range in pages],
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        header += b" " * (-(len(SNAPSHOT_MAGIC) + 4 + len(header)) % 8)
+
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(len(header).to_bytes(4, "little"))
+            f.write(header)
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+
+
+def _string_table(strings: Iterable[str]) -> tuple[bytes, array]:
+    """Concatenated UTF-8 strings and their byte offsets (n + 1 of them)."""
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = array("I", [0])
+    total = 0
+    for item in encoded:
+        total += len(item)
+        offsets.append(total)
+    return b"".join(encoded), offsets
+
+
+class _MappedStrings(Sequence[bytes]):
+    """Read-only view of a snapshot string table, as UTF-8 bytes (bisectable)."""
+
+    def __init__(self, blob: memoryview, offsets: Sequence[int]):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> bytes: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[bytes]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[bytes, Sequence[bytes]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return bytes(self._blob[self._offsets[index]:self._offsets[index + 1]])
+
+
+class _MappedDocuments(Sequence[SearchDocument]):
+    """Snapshot sections, decoded one at a time when a hit needs them."""
+
+    def __init__(self, fields: _MappedStrings, count: int):
+        self._fields = fields
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> SearchDocument: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[SearchDocument]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[SearchDocument, Sequence[SearchDocument]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if not -self._count <= index < self._count:
+            raise IndexError(index)
+        base = (index % self._count) * _DOCUMENT_FIELDS
+        url, title, text, category, section = (self._fields[base + i].decode("utf-8") for i in range(_DOCUMENT_FIELDS))
+        return SearchDocument(url=url, title=title, text=text, category=category, section=section)
+
+
+class MappedSegment(IndexSegment):
+    """An IndexSegment served straight from a memory-mapped snapshot file.
+
+    Nothing is built on load: the arrays are views of the mapping, term
+    lookup is a binary search of the sorted term table, and a section's
+    strings are decoded only when it's shown. Every worker mapping the same
+    file shares its pages in the OS page cache.
+
+    Usage:
+        loaded = MappedSegment.open(Path("docs/.search-index.bin"))
+        if loaded is not None:
+            segment, pages = loaded
+    """
+
+    def __init__(self, buffer: mmap.mmap, header: dict, data_start: int):
+        """Map the segment's arrays and tables (use MappedSegment.open).
+
+        Args:
+            buffer: Read-only mapping of the snapshot file
+            header: Parsed snapshot header
+            data_start: File offset of the data the header's layout refers to
+        """
+        self._buffer = buffer  # keeps the mapping alive as long as the views
+        view = memoryview(buffer)
+
+        def region(name: str) -> memoryview:
+            offset, length = header["layout"][name]
+            return view[data_start + offset : data_start + offset + length]
+
+        arrays = {name: region(name).cast("I") for name in _SNAPSHOT_ARRAYS}
+        self.lengths, self.doc_ids, self.freqs = arrays["lengths"], arrays["doc_ids"], arrays["freqs"]
+        self._term_start, self._position_start = arrays["term_start"], arrays["position_start"]
+        self._positions, self._token_starts, self._doc_tokens = arrays["positions"], arrays["token_starts"], arrays["doc_tokens"]
+        self._term_table = _MappedStrings(region("terms"), arrays["term_offsets"])
+        self.documents = _MappedDocuments(_MappedStrings(region("fields"), arrays["field_offsets"]), header["documents"])
+
+    @classmethod
+    def open(cls, path: Path) -> Optional[tuple["MappedSegment", list[tuple[str, str, range]]]]:
+        """Map a snapshot written by IndexSegment.write_snapshot.
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            (segment, [(URL, page_key, doc id range)]), or None if the file
+            is missing, or unusable here (other format, byte order or
+            item size, or damaged)
+        """
+        try:
+            with open(path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            log.info("search_snapshot_missing", path=str(path))
+            return None
+        except (OSError, ValueError) as e:  # ValueError: empty file
+            log.warning("search_snapshot_invalid", path=str(path), error=str(e))
+            return None
+
+        try:
+            if buffer[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+                raise ValueError("not a search snapshot")
+            header_start = len(SNAPSHOT_MAGIC) + 4
+            header_length = int.from_bytes(buffer[len(SNAPSHOT_MAGIC) : header_start], "little")
+            header = json.loads(buffer[header_start : header_start + header_length])
+            expected = (SNAPSHOT_FORMAT, sys.byteorder, array("I").itemsize)
+            if (header["format"], header["byteorder"], header["itemsize"]) != expected:
+                raise ValueError(f"snapshot format {header['format']}/{header['byteorder']}/{header['itemsize']}, need {expected}")
+            data_start = header_start + header_length
+            if any(data_start + offset + length > len(buffer) for offset, length in header["layout"].values()):
+                raise ValueError("snapshot truncated")
+            segment = cls(buffer, header, data_start)
+            pages = [(url, key, range(start, stop)) for url, key, start, stop in header["pages"]]
+        except (ValueError, KeyError, TypeError) as e:
+            log.warning("search_snapshot_invalid", path=str(path), error=str(e))
+            return None
+
+        log.info("search_snapshot_mapped", path=str(path), sections=len(segment), pages=len(pages), bytes=len(buffer))
+        return segment, pages
+
+    @property
+    def term_count(self) -> int:
+        """Number of distinct terms."""
+        return len(self._term_table)
+
+    @property
+    def terms(self) -> list[str]:
+        """Distinct terms, in term id order (decoded from the term table)."""
+        return [term.decode("utf-8") for term in self._term_table]
+
+    def postings(self, term: str) -> Optional[tuple[int, int]]:
+        """Run of a term's postings in doc_ids/freqs, or None if absent."""
+        key = term.encode("utf-8")
+        term_id = bisect_left(self._term_table, key)
+        if term_id == len(self._term_table) or self._term_table[term_id] != key:
+            return None
+        return self._term_start[term_id], self._term_start[term_id + 1]
+
+
+class SearchIndex:
+    """BM25 search over one or more segments.
+
+    The live index is a large main segment plus a small delta segment with
+    the pages changed since the main was built; the main's old copies of
+    those pages are masked out as deleted. Collection statistics (N, average
+    length) cover live documents only; document frequencies still count
+    deleted postings until the next merge, as in most incremental engines.
+
+    Usage:
+        index = SearchIndex.from_documents(documents)
+        results = index.search('agents "progressive disclosure"')
+    """
+
+    def __init__(
+        self,
+        segments: list[IndexSegment],
+        deleted: Optional[list[frozenset[int]]] = None,
+        k1: float = BM25_K1,
+        b: float = BM25_B,
+    ):
+        """Combine segments into one searchable index.
+
+        Args:
+            segments: Segments, searched together
+            deleted: Per segment, doc ids to skip (superseded pages)
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.segments = segments
+        self.deleted = deleted if deleted is not None else [frozenset() for _ in segments]
+        self.k1 = k1
+        self.b = b
+        self.document_count = sum(len(segment) - len(dead) for segment, dead in zip(segments, self.deleted))
+        total_length = sum(
+            sum(segment.lengths) - sum(segment.lengths[doc_id] for doc_id in dead)
+            for segment, dead in zip(segments, self.deleted)
+        )
+        self.avgdl = total_length / self.document_count if self.document_count else 0.0
+        # BM25's per-document length normalization, precomputed per segment
+        self._norms = [
+            array("d", (k1 * (1 - b + b * length / self.avgdl) if self.avgdl else k1 for length in segment.lengths))
+            for segment in segments
+        ]
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[SearchDocument], k1: float = BM25_K1, b: float = BM25_B) -> "SearchIndex":
+        """Index documents as a single segment.
+
+        Args:
+            documents: Documents to index
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+
+        Returns:
+            SearchIndex
+        """
+        return cls([IndexSegment(documents)], k1=k1, b=b)
+
+    def __len__(self) -> int:
+        """Number of live documents (sections)."""
+        return self.document_count
+
+    def search(self, query: str, limit: int = 10) -> SearchResults:
+        """Rank documents against a query.
+
+        Terms are OR-ed and ranked by BM25; every quoted phrase must occur
+        verbatim (consecutive terms) in a result's body.
+
+        Args:
+            query: Free text, optionally with "quoted phrases"
+            limit: Maximum hits returned
+
+        Returns:
+            SearchResults with the top hits and the total match count
+        """
+        terms, phrases = parse_query(query)
+        unique_terms = list(dict.fromkeys(terms))
+
+        segment_postings: list[dict[str, tuple[int, int]]] = []
+        df: dict[str, int] = {}
+        for segment in self.segments:
+            found = {}
+            for term in unique_terms:
+                run = segment.postings(term)
+                if run is not None:
+                    found[term] = run
+                    df[term] = df.get(term, 0) + run[1] - run[0]
+            segment_postings.append(found)
+        if not df or any(term not in df for phrase in phrases for term in phrase):
+            return SearchResults(query=query, total=0)
+
+        n = self.document_count
+        scores: list[dict[int, float]] = []
+        for segment, postings, dead, norms in zip(self.segments, segment_postings, self.deleted, self._norms):
+            doc_ids, freqs = segment.doc_ids, segment.freqs
+            segment_scores: dict[int, float] = {}
+            for term, (start, end) in postings.items():
+                weight = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5)) * (self.k1 + 1)
+                for i in range(start, end):
+                    doc_id = doc_ids[i]
+                    tf = freqs[i]
+                    segment_scores[doc_id] = segment_scores.get(doc_id, 0.0) + weight * tf / (tf + norms[doc_id])
+            for doc_id in dead.intersection(segment_scores) if dead else ():
+                del segment_scores[doc_id]
+            scores.append(segment_scores)
+
+        if phrases:
+            scores = [
+                {
+                    doc_id: score
+                    for doc_id, score in segment_scores.items()
+                    if all(segment.has_phrase(doc_id, phrase, postings) for phrase in phrases)
+                }
+                for segment, postings, segment_scores in zip(self.segments, segment_postings, scores)
+            ]
+
+        # Pop best-first from a heap (O(n + k log n)), at most
+        # MAX_HITS_PER_PAGE sections per page
+        ranked = [
+            (-score, segment_no, doc_id)
+            for segment_no, segment_scores in enumerate(scores)
+            for doc_id, score in segment_scores.items()
+        ]
+        heapq.heapify(ranked)
+        total = len(ranked)
+        hits: list[SearchHit] = []
+        per_page: dict[str, int] = {}
+        while ranked and len(hits) < limit:
+            negative_score, segment_no, doc_id = heapq.heappop(ranked)
+            segment = self.segments[segment_no]
+            document = segment.documents[doc_id]
+            shown = per_page.get(document.page, 0)
+            if shown >= MAX_HITS_PER_PAGE:
+                continue
+            per_page[document.page] = shown + 1
+            hits.append(
+                SearchHit(
+                    url=document.url,
+                    title=document.title,
+                    category=document.category,
+                    score=round(-negative_score, 4),
+                    snippet=segment.snippet(doc_id, segment_postings[segment_no]),
+                    section=document.section,
+                )
+            )
+        return SearchResults(query=query, total=total, hits=hits)
+
+
+@dataclass
+class _IndexedPage:
+    """SearchService's record of one page in the index."""
+
+    key: str  # page_key() of the source it was indexed from
+    section_count: int
+    # None for pages served from a snapshot until they need re-indexing
+    sections: Optional[list[SearchDocument]] = None
+    analyses: Optional[list[AnalyzedDocument]] = None
+
+
+class SearchService:
+    """The current search index, updated incrementally when the docs change.
+
+    Each page's sections are kept analyzed (text extracted and tokenized)
+    with the digest of the source they came from. On a change only the
+    changed pages are re-analyzed, and they go into a small delta segment
+    while their old sections in the main segment are masked as deleted --
+    the main's arrays are left alone. Once the delta outgrows MERGE_RATIO of
+    the index, all pages are merged into a fresh main segment.
+
+    With a snapshot (load_snapshot) the main segment is mapped from disk
+    and served immediately; its pages are only analyzed again if they
+    change or a merge needs them.
+
+    Usage:
+        service = SearchService(collect_pages, lambda: tree_signature([docs]), content_service)
+        results = service.search("semantic memory")
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], list[SearchPage]],
+        signature: Callable[[], object],
+        content_service: Optional["ContentService"] = None,
+        check_interval: float = 30.0,
+    ):
+        """Initialize service (the index is built on first use).
+
+        Args:
+            collect: Produces the pages to index
+            signature: Cheap change detector for the pages' sources
+            content_service: Source of the content generation (optional)
+            check_interval: Seconds between signature checks (0 = every search)
+        """
+        self.collect = collect
+        self._pages: dict[str, _IndexedPage] = {}  # page URL -> its index record
+        self._main: Optional[IndexSegment] = None
+        self._main_ranges: dict[str, range] = {}  # live pages in the main segment -> their doc ids
+        self._main_deleted: frozenset[int] = frozenset()
+        self._delta_pages: list[str] = []
+        self._cache: GenerationCache[SearchIndex] = GenerationCache(
+            self._build, signature, content_service, check_interval=check_interval, name="search-index"
+        )
+
+    def load_snapshot(self, path: Path) -> bool:
+        """Serve the index from a snapshot file until the next change check.
+
+        The snapshot becomes the main segment as-is. The next check (after
+        check_interval) verifies it against the docs by page digest and
+        re-indexes only pages that differ.
+
+        Args:
+            path: Snapshot written by write_snapshot
+
+        Returns:
+            True if the snapshot was mapped, False if it's missing or unusable
+            (the index is then built from the docs on first use)
+        """
+        loaded = MappedSegment.open(path)
+        if loaded is None:
+            return False
+        segment, pages = loaded
+        self._main = segment
+        self._main_ranges = {url: doc_range for url, _, doc_range in pages}
+        self._main_deleted = frozenset()
+        self._delta_pages = []
+        self._pages = {url: _IndexedPage(key, len(doc_range)) for url, key, doc_range in pages}
+        self._cache.prime(SearchIndex([segment]))
+        return True
+
+    def write_snapshot(self, path: Path) -> None:
+        """Save the current index's pages as a snapshot (one main segment).
+
+        Meant for build scripts: it may re-merge the index, so don't call it
+        while the service is answering searches.
+
+        Args:
+            path: Snapshot file (replaced atomically)
+        """
+        self._cache.get()
+        if self._main is None or self._delta_pages or self._main_deleted or isinstance(self._main, MappedSegment):
+            self._main = self._merge(list(self._pages), {})
+        ranges = self._main_ranges
+        self._main.write_snapshot(path, [(url, self._pages[url].key, ranges[url]) for url in ranges])
+
+    def _merge(self, urls: list[str], sources: dict[str, SearchPage]) -> IndexSegment:
+        """Main segment over the given pages (cached analyses reused, no re-tokenizing).
+
+        Pages still known only from a snapshot are analyzed from sources,
+        or from the collected pages if they're not there.
+        """
+        missing = [url for url in urls if self._pages[url].analyses is None and url not in sources]
+        if missing:
+            sources = {**sources, **{page.url: page for page in self.collect() if page.url in missing}}
+
+        documents: list[SearchDocument] = []
+        analyzed: list[AnalyzedDocument] = []
+        self._main_ranges = {}
+        for url in urls:
+            entry = self._pages[url]
+            if entry.sections is None or entry.analyses is None:
+                entry.sections = page_sections(sources[url])
+                entry.analyses = [analyze(section) for section in entry.sections]
+            self._main_ranges[url] = range(len(documents), len(documents) + len(entry.sections))
+            documents.extend(entry.sections)
+            analyzed.extend(entry.analyses)
+        self._main_deleted = frozenset()
+        self._delta_pages = []
+        return IndexSegment(documents, analyzed)
+
+    def _build(self) -> SearchIndex:
+        started = time.perf_counter()
+        pages: dict[str, _IndexedPage] = {}
+        sources: dict[str, SearchPage] = {}
+        changed = []
+        for page in self.collect():
+            key = page_key(page)
+            entry = self._pages.get(page.url)
+            if entry is None or entry.key != key:
+                sections = page_sections(page)
+                entry = _IndexedPage(key, len(sections), sections, [analyze(section) for section in sections])
+                changed.append(page.url)
+            pages[page.url] = entry
+            sources[page.url] = page
+        stale = set(changed) | (self._pages.keys() - pages.keys())
+        self._pages = pages
+
+        # Superseded pages: mask their sections in the main segment, and
+        # carry the rest of the delta over
+        deleted = set(self._main_deleted)
+        for url in stale:
+            deleted.update(self._main_ranges.pop(url, ()))
+        delta_pages = [url for url in self._delta_pages if url not in stale] + changed
+        delta_sections = sum(pages[url].section_count for url in delta_pages)
+        total_sections = sum(entry.section_count for entry in pages.values())
+
+        if self._main is None or delta_sections > MERGE_RATIO * total_sections:
+            self._main = self._merge(list(pages), sources)
+            segments = [self._main]
+            merged = True
+        else:
+            self._main_deleted = frozenset(deleted)
+            self._delta_pages = delta_pages
+            delta = IndexSegment(
+                [section for url in delta_pages for section in pages[url].sections or ()],
+                [analysis for url in delta_pages for analysis in pages[url].analyses or ()],
+            )
+            segments = [self._main, delta]
+            merged = False
+
+        index = SearchIndex(segments, [self._main_deleted] + [frozenset()] * (len(segments) - 1))
+        log.info(
+            "search_index_updated",
+            pages=len(pages),
+            sections=len(index),
+            reanalyzed_pages=len(changed),
+            merged=merged,
+            delta_pages=len(self._delta_pages),
+            ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        return index
+
+    @property
+    def index(self) -> SearchIndex:
+        """Current index (updated first if its sources changed)."""
+        return self._cache.get()
+
+    def search(self, query: str, limit: int = 10) -> SearchResults:
+        """Search the current index.
+
+        Args:
+            query: Free text, optionally with "quoted phrases"
+            limit: Maximum hits returned
+
+        Returns:
+            SearchResults
+        """
+        return self.index.search(query, limit)
@@ -0,0 +1,158 @@
+"""
+Sitemap service - sitemap XML built once per docs change, served as bytes.
+
+Building a sitemap means walking the docs tree, parsing every article for
+its draft status and stat-ing every file for <lastmod>. None of that
+changes between requests, so the XML is built once, pre-encoded (plain and
+gzip) with its ETag and Last-Modified, and reused until the content
+generation changes or the docs tree on disk does.
+
+Tree changes are detected by a stat-only signature of the tree, re-checked
+at most once per check interval (services/cache.py), so requests in
+between never touch the filesystem at all.
+
+Large corpora are split into child sitemaps under a <sitemapindex>, each
+within the protocol's limits (50,000 URLs, 50 MB uncompressed per file).
+"""
+
+import gzip
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import formatdate
+from typing import Iterable, Optional
+from xml.sax.saxutils import escape
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+# Sitemap protocol limits per file (sitemaps.org)
+MAX_URLS_PER_SITEMAP = 50_000
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+_URLSET_OPEN = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n'
+_URLSET_CLOSE = "</urlset>\n"
+
+@dataclass(frozen=True)
+class SitemapUrl:
+    """One <url> entry: site-relative path and last modification (epoch seconds)."""
+
+    path: str
+    lastmod: Optional[float] = None
+
+
+def format_lastmod(timestamp: float) -> str:
+    """W3C date (YYYY-MM-DD, UTC) for <lastmod>."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).date().isoformat()
+
+
+@dataclass(frozen=True)
+class EncodedBody:
+    """A response body pre-encoded once: raw and gzip bytes plus validators."""
+
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    last_modified: Optional[float] = None
+
+    @property
+    def last_modified_http(self) -> Optional[str]:
+        """Last-Modified header value (RFC 7231 IMF-fixdate)."""
+        return formatdate(self.last_modified, usegmt=True) if self.last_modified is not None else None
+
+    @classmethod
+    def from_text(cls, text: str, last_modified: Optional[float] = None) -> "EncodedBody":
+        """Encode text and compute its ETag and HTTP Last-Modified.
+
+        Args:
+            text: Response body
+            last_modified: Newest source modification time (epoch seconds)
+
+        Returns:
+            EncodedBody
+        """
+        body = text.encode("utf-8")
+        return cls(
+            body=body,
+            # mtime=0: identical input always yields identical gzip bytes
+            gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+            etag=f'"{hashlib.sha1(body).hexdigest()[:20]}"',
+            last_modified=last_modified,
+        )
+
+
+def _url_line(site_url: str, url: SitemapUrl) -> str:
+    lastmod = f"<lastmod>{format_lastmod(url.lastmod)}</lastmod>" if url.lastmod is not None else ""
+    return f"  <url><loc>{escape(site_url + url.path)}</loc>{lastmod}</url>\n"
+
+
+def render_urlset(site_url: str, urls: Iterable[SitemapUrl]) -> str:
+    """Render a <urlset> document.
+
+    Args:
+        site_url: Absolute site origin, no trailing slash
+        urls: Entries in output order
+
+    Returns:
+        sitemap XML
+    """
+    return _URLSET_OPEN + "".join(_url_line(site_url, url) for url in urls) + _URLSET_CLOSE
+
+
+def shard_urlsets(
+    site_url: str,
+    urls: Iterable[SitemapUrl],
+    max_urls: int = MAX_URLS_PER_SITEMAP,
+    max_bytes: int = MAX_SITEMAP_BYTES,
+) -> list[EncodedBody]:
+    """Render urls as one or more <urlset> documents, each within the limits.
+
+    Args:
+        site_url: Absolute site origin, no trailing slash
+        urls: Entries in output order
+        max_urls: URL limit per document
+        max_bytes: Uncompressed size limit per document
+
+    Returns:
+        Encoded shards in order (empty if there are no urls); each shard's
+        Last-Modified is its newest <lastmod>
+    """
+    overhead = len(_URLSET_OPEN) + len(_URLSET_CLOSE)
+    shards: list[EncodedBody] = []
+    lines: list[str] = []
+    size = overhead
+    newest: Optional[float] = None
+
+    def flush() -> None:
+        shards.append(EncodedBody.from_text(_URLSET_OPEN + "".join(lines) + _URLSET_CLOSE, newest))
+
+    for url in urls:
+        line = _url_line(site_url, url)
+        line_bytes = len(line.encode("utf-8"))
+        if lines and (len(lines) >= max_urls or size + line_bytes > max_bytes):
+            flush()
+            lines, size, newest = [], overhead, None
+        lines.append(line)
+        size += line_bytes
+        if url.lastmod is not None:
+            newest = url.lastmod if newest is None else max(newest, url.lastmod)
+    if lines:
+        flush()
+    return shards
+
+
+def render_sitemap_index(site_url: str, sitemaps: Iterable[tuple[str, Optional[float]]]) -> str:
+    """Render a <sitemapindex> document.
+
+    Args:
+        site_url: Absolute site origin, no trailing slash
+        sitemaps: (child sitemap path, newest lastmod) in output order
+
+    Returns:
+        sitemap index XML
+    """
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<sitemapindex xmlns="{SITEMAP_NS}">']
+    for path, lastmod in sitemaps:
+        stamp = f"<lastmod>{format_lastmod(lastmod)}</lastmod>" if lastmod is not None else ""
+        lines.append(f"  <sitemap><loc>{escape(site_url + path)}</loc>{stamp}</sitemap>")
+    lines.append("</sitemapindex>")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,228 @@
+"""
+Suggestion services - "did you mean" for URLs that don't resolve, and
+search-as-you-type completions.
+
+Did you mean: every known page is indexed by the character trigrams of its
+URL slug and of its title, in an inverted index (trigram -> key ids). A
+requested path that 404s is matched by trigram overlap: one pass over the
+posting lists of the query's ~10 trigrams counts shared trigrams per key,
+and the Dice coefficient 2|A∩B| / (|A| + |B|) ranks the candidates. That
+tolerates typos, transpositions and underscore/case variants
+("/systems/revael", "/foundations/FOUNDERS_LETTER") at tens of
+microseconds per lookup, so the 404 page can offer the nearest real pages
+instead of a dead end.
+
+Completions: page titles, glossary terms and section headings live in one
+sorted array of lowercased keys (one key per word start, so "disc" finds
+"Progressive Disclosure"). A prefix is two bisections into that array,
+then a short scan of the matching run -- cheap enough to answer on every
+keystroke.
+"""
+
+import bisect
+import heapq
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Iterable
+
+from sil_web.domain.models import Completion, PageSuggestion
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Minimum Dice score for a page to be suggested
+MIN_SUGGESTION_SCORE = 0.3
+
+# Added when the requested path and the page share their first segment
+SECTION_BONUS = 0.1
+
+# Completion kinds, best first when prefix matches tie
+COMPLETION_KINDS = ("term", "page", "heading")
+
+# Keys scanned per completion lookup (bounds one-letter prefixes)
+MAX_COMPLETION_SCAN = 512
+
+
+@dataclass(frozen=True)
+class KnownPage:
+    """A URL the site serves, with the title to show for it."""
+
+    url: str
+    title: str
+
+    @property
+    def section(self) -> str:
+        """First path segment ('' for the home page)."""
+        return self.url.strip("/").split("/", 1)[0]
+
+
+def trigrams(text: str) -> set[str]:
+    """Padded character trigrams of each word of text (case-insensitive).
+
+    Words are padded as in pg_trgm ("  word "), so short words and word
+    starts still yield trigrams and weigh a little more than word middles.
+
+    Args:
+        text: Slug, title or path segment
+
+    Returns:
+        Set of trigrams (empty if text has no letters or digits)
+    """
+    grams: set[str] = set()
+    for word in _NON_ALNUM.sub(" ", text.lower()).split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _request_parts(path: str) -> tuple[str, str]:
+    """(first segment, last segment) of a requested path, .md/.html dropped."""
+    segments = [segment for segment in path.split("/") if segment]
+    if not segments:
+        return "", ""
+    slug = re.sub(r"\.(md|html?)$", "", segments[-1], flags=re.IGNORECASE)
+    return segments[0].lower(), slug
+
+
+class TrigramIndex:
+    """Inverted trigram index over page slugs and titles."""
+
+    def __init__(self, pages: Iterable[KnownPage]):
+        """Build the index.
+
+        Args:
+            pages: Pages to suggest, in preference order (ties keep it)
+        """
+        self.pages = list(pages)
+        self._sections = [page.section for page in self.pages]
+        self._key_page = array("I")  # key id -> page id
+        self._key_size = array("I")  # key id -> trigram count
+
+        postings: dict[str, list[int]] = {}
+        for page_id, page in enumerate(self.pages):
+            slug = page.url.rstrip("/").rsplit("/", 1)[-1]
+            for key in (slug, page.title):
+                grams = trigrams(key)
+                if not grams:
+                    continue
+                key_id = len(self._key_page)
+                self._key_page.append(page_id)
+                self._key_size.append(len(grams))
+                for gram in grams:
+                    postings.setdefault(gram, []).append(key_id)
+        self._postings = {gram: array("I", ids) for gram, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def suggest(self, path: str, limit: int = 3) -> list[PageSuggestion]:
+        """Nearest known pages to a requested path.
+
+        Args:
+            path: Requested URL path (query string excluded)
+            limit: Maximum suggestions
+
+        Returns:
+            Up to limit suggestions, best first; never the path itself
+        """
+        section, slug = _request_parts(path)
+        grams = trigrams(slug)
+        if not grams:
+            return []
+
+        shared: dict[int, int] = {}
+        for gram in grams:
+            for key_id in self._postings.get(gram, ()):
+                shared[key_id] = shared.get(key_id, 0) + 1
+
+        best: dict[int, float] = {}
+        for key_id, count in shared.items():
+            page_id = self._key_page[key_id]
+            score = 2 * count / (len(grams) + self._key_size[key_id])
+            if section and self._sections[page_id] == section:
+                score += SECTION_BONUS
+            if score > best.get(page_id, 0.0):
+                best[page_id] = score
+
+        requested = "/" + path.strip("/")
+        ranked = heapq.nsmallest(
+            limit + 1,
+            ((-score, page_id) for page_id, score in best.items() if score >= MIN_SUGGESTION_SCORE),
+        )
+        suggestions = [
+            PageSuggestion(url=self.pages[page_id].url, title=self.pages[page_id].title, score=round(-neg, 3))
+            for neg, page_id in ranked
+            if self.pages[page_id].url != requested
+        ]
+        return suggestions[:limit]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over completion labels."""
+
+    def __init__(self, completions: Iterable[Completion]):
+        """Build the index.
+
+        Args:
+            completions: Labels with their targets, in preference order
+                (ties keep it); repeated (label, url) pairs are dropped
+        """
+        self.completions: list[Completion] = []
+        seen: set[tuple[str, str]] = set()
+        keyed: list[tuple[str, int, int]] = []  # (key, word offset, completion id)
+        for completion in completions:
+            label = _normalize(completion.label)
+            if not label or (label, completion.url) in seen:
+                continue
+            seen.add((label, completion.url))
+            completion_id = len(self.completions)
+            self.completions.append(completion)
+            keyed.append((label, 0, completion_id))
+            for match in re.finditer(r"(?<=[\s(/-])\w", label):
+                keyed.append((label[match.start() :], match.start(), completion_id))
+
+        keyed.sort()
+        self._keys = [key for key, _, _ in keyed]
+        self._offsets = array("I", (offset for _, offset, _ in keyed))
+        self._ids = array("I", (completion_id for _, _, completion_id in keyed))
+        kind_rank = {kind: rank for rank, kind in enumerate(COMPLETION_KINDS)}
+        self._rank = array("I", (kind_rank.get(c.kind, len(COMPLETION_KINDS)) for c in self.completions))
+
+    def __len__(self) -> int:
+        return len(self.completions)
+
+    def complete(self, prefix: str, limit: int = 8) -> list[Completion]:
+        """Completions whose label, or a word in it, starts with prefix.
+
+        Ranked: label starts with the prefix, then kind (COMPLETION_KINDS),
+        then shorter label, then index order.
+
+        Args:
+            prefix: Text typed so far (case and spacing insensitive)
+            limit: Maximum completions
+
+        Returns:
+            Up to limit completions, best first
+        """
+        prefix = _normalize(prefix)
+        if not prefix:
+            return []
+
+        start = bisect.bisect_left(self._keys, prefix)
+        end = min(bisect.bisect_left(self._keys, prefix + "\uffff", start), start + MAX_COMPLETION_SCAN)
+        best: dict[int, tuple[int, int, int, int]] = {}
+        for position in range(start, end):
+            completion_id = self._ids[position]
+            rank = (
+                0 if self._offsets[position] == 0 else 1,
+                self._rank[completion_id],
+                len(self.completions[completion_id].label),
+                completion_id,
+            )
+            if completion_id not in best or rank < best[completion_id]:
+                best[completion_id] = rank
+        return [self.completions[completion_id] for completion_id in heapq.nsmallest(limit, best, key=best.__getitem__)]
@@ -0,0 +1,229 @@
+"""
+Template service - production Jinja2 environment and pre-rendered page shells.
+
+page.html is almost entirely static: everything except the <title> and the
+rendered document body depends only on which nav section is active. So the
+shell is rendered once per current_page value, split around the title and
+content slots, and each request is just string assembly.
+
+Navigation fragments (header nav, tiered docs sidebar) are likewise built
+once per content generation and active section and kept as ready HTML.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+import structlog
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup, escape
+
+from sil_web.domain.models import Document
+from sil_web.ui.components import group_documents_by_tier, main_nav, tiered_docs_sidebar
+
+if TYPE_CHECKING:
+    from sil_web.services.content import ContentService
+
+log = structlog.get_logger()
+
+# Placeholders rendered into the shell, then split on. Neither is altered by
+# HTML autoescaping, so they survive {{ title }} unchanged.
+TITLE_SLOT = "@@SIL_SHELL_TITLE@@"
+CONTENT_SLOT = "@@SIL_SHELL_CONTENT@@"
+
+
+def create_template_environment(
+    directory: Path,
+    auto_reload: bool = False,
+    bytecode_cache_dir: Optional[Path] = None,
+) -> Environment:
+    """Build the Jinja2 environment used for all page rendering.
+
+    Args:
+        directory: Template directory
+        auto_reload: Stat templates on every render to pick up edits (development only)
+        bytecode_cache_dir: Directory for compiled template bytecode. None uses
+            Jinja2's default per-user temp directory.
+
+    Returns:
+        Configured Environment
+    """
+    if bytecode_cache_dir is not None:
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(directory=str(bytecode_cache_dir))
+    else:
+        bytecode_cache = FileSystemBytecodeCache()
+
+    return Environment(
+        loader=FileSystemLoader(str(directory)),
+        autoescape=select_autoescape(),
+        auto_reload=auto_reload,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+class NavFragments:
+    """Navigation HTML fragments cached per content generation and active section.
+
+    Usage:
+        fragments = NavFragments(nav_items, content_service)
+        nav_html = fragments.nav_bar("/systems")
+        sidebar_html = fragments.sidebar("foundations", current_slug="glossary")
+    """
+
+    def __init__(self, nav_items: list[dict[str, str]], content_service: Optional["ContentService"] = None):
+        """Initialize fragment cache.
+
+        Args:
+            nav_items: Header navigation entries ('label', 'url')
+            content_service: Source of sidebar documents and the content generation
+        """
+        self.nav_items = nav_items
+        self.content_service = content_service
+        self._generation = self.generation
+        self._nav: dict[str, str] = {}  # current_page -> nav HTML
+        self._tiers: dict[str, dict[int, list[Document]]] = {}  # category -> grouped docs
+        self._sidebars: dict[tuple[str, str, str], str] = {}  # (category, slug, page) -> sidebar HTML
+
+    @property
+    def generation(self) -> int:
+        """Current content generation (0 without a content service)."""
+        return self.content_service.generation if self.content_service is not None else 0
+
+    def _check_generation(self) -> None:
+        generation = self.generation
+        if generation != self._generation:
+            self._nav.clear()
+            self._tiers.clear()
+            self._sidebars.clear()
+            self._generation = generation
+
+    def nav_bar(self, current_page: str = "") -> str:
+        """Header nav links with the active section marked.
+
+        Args:
+            current_page: URL of the active section
+
+        Returns:
+            Cached HTML fragment
+        """
+        self._check_generation()
+        html = self._nav.get(current_page)
+        if html is None:
+            html = self._nav[current_page] = main_nav(self.nav_items, current_page)
+        return html
+
+    def sidebar(self, category: str = "foundations", current_slug: str = "", current_page: str = "") -> str:
+        """Tiered document sidebar for a category.
+
+        Documents are listed and grouped by tier once per generation; each
+        (slug, page) variant is rendered once and reused.
+
+        Args:
+            category: Document category to list
+            current_slug: Currently active document slug
+            current_page: Currently active page (e.g., 'projects')
+
+        Returns:
+            Cached HTML fragment
+        """
+        self._check_generation()
+        key = (category, current_slug, current_page)
+        html = self._sidebars.get(key)
+        if html is None:
+            tiers = self._tiers.get(category)
+            if tiers is None:
+                docs = self.content_service.list_documents(category=category) if self.content_service is not None else []
+                tiers = self._tiers[category] = group_documents_by_tier(docs)
+            html = self._sidebars[key] = tiered_docs_sidebar(tiers, current_slug, current_page)
+        return html
+
+
+class PageShell:
+    """page.html pre-rendered per active section, with title/content slots.
+
+    Usage:
+        shell = PageShell(env, fragments=NavFragments(nav_items, content_service))
+        html = shell.render("About - SIL", rendered_html, current_page="/about")
+    """
+
+    def __init__(
+        self,
+        env: Environment,
+        template_name: str = "page.html",
+        context: Optional[dict[str, Any]] = None,
+        fragments: Optional[NavFragments] = None,
+    ):
+        """Initialize page shell.
+
+        Args:
+            env: Template environment
+            template_name: Template with a {{ title }} and a {{ content | safe }} slot
+            context: Static context shared by every page (metrics, ...)
+            fragments: Source of the nav_html fragment; shells are rebuilt
+                when its content generation changes
+        """
+        self.env = env
+        self.template_name = template_name
+        self.context = context or {}
+        self.fragments = fragments
+        self._generation = fragments.generation if fragments is not None else 0
+        self._shells: dict[str, tuple[str, str, str]] = {}  # current_page -> (head, middle, tail)
+
+    def _build(self, current_page: str) -> tuple[str, str, str]:
+        template = self.env.get_template(self.template_name)
+        nav_html = self.fragments.nav_bar(current_page) if self.fragments is not None else ""
+        html = template.render(
+            **self.context,
+            nav_html=Markup(nav_html),
+            title=TITLE_SLOT,
+            content=Markup(CONTENT_SLOT),
+            current_page=current_page,
+        )
+
+        head, sep, rest = html.partition(TITLE_SLOT)
+        middle, sep2, tail = rest.partition(CONTENT_SLOT)
+        if not sep or not sep2 or TITLE_SLOT in tail or CONTENT_SLOT in tail:
+            raise ValueError(f"{self.template_name} must render title and content exactly once, title first")
+        return head, middle, tail
+
+    def _get(self, current_page: str) -> tuple[str, str, str]:
+        # With auto_reload (development) template edits must show up immediately
+        if self.env.auto_reload:
+            return self._build(current_page)
+
+        if self.fragments is not None and self.fragments.generation != self._generation:
+            self._shells.clear()
+            self._generation = self.fragments.generation
+
+        shell = self._shells.get(current_page)
+        if shell is None:
+            shell = self._shells[current_page] = self._build(current_page)
+        return shell
+
+    def warm(self, current_pages: Iterable[str]) -> None:
+        """Pre-render shells (and compile the template) ahead of the first request.
+
+        Args:
+            current_pages: Active-section values to pre-render
+        """
+        for current_page in current_pages:
+            self._get(current_page)
+        log.info("page_shells_warmed", template=self.template_name, count=len(self._shells))
+
+    def render(self, title: str, content: str, current_page: str) -> str:
+        """Assemble a full page from the cached shell.
+
+        Args:
+            title: Page title (escaped here, as {{ title }} would be)
+            content: Rendered HTML body (inserted as-is, as {{ content | safe }})
+            current_page: Active nav section
+
+        Returns:
+            Complete HTML document
+        """
+        head, middle, tail = self._get(current_page)
+        return f"{head}{escape(title)}{middle}{content}{tail}"
+
+    def clear(self) -> None:
+        """Drop pre-rendered shells (e.g. after template or nav changes)."""
+        self._shells.clear()
@@ -5,7 +5,11 @@ No business logic, no I/O, no state mutation.
 Just pure functions that transform data into HTML strings.
 """
 
-from sil_web.domain.models import Document, Layer, Project
+from html import escape
+from typing import Optional, Sequence
+from urllib.parse import quote_plus
+
+from sil_web.domain.models import Backlink, Document, Layer, PageSuggestion, Project, RelatedLink, SearchResults, Snippet
 
 
 def project_card(project: Project) -> str:
@@ -180,6 +184,39 @@ def nav_bar(current_page: str = "") -> str:
     """
 
 
+def main_nav(nav_items: list[dict[str, str]], current_page: str = "") -> str:
+    """Render the site header navigation links (page.html's main-nav).
+
+    Args:
+        nav_items: Navigation entries with 'label' and 'url'
+        current_page: URL of the active section
+
+    Returns:
+        HTML string of nav links, active section marked
+    """
+    links = []
+    for item in nav_items:
+        active = " active" if item["url"] == current_page else ""
+        links.append(f'<a href="{escape(item["url"])}" class="nav-link{active}">{escape(item["label"])}</a>')
+    return "\n                    ".join(links)
+
+
+def group_documents_by_tier(documents: list[Document]) -> dict[int, list[Document]]:
+    """Group documents by tier, each tier sorted by order.
+
+    Args:
+        documents: Documents in any order
+
+    Returns:
+        Dict mapping tier (1, 2, 3 always present) -> sorted documents
+    """
+    # Organize by tier: 1=Essential, 2=Architecture (usually empty), 3=Reference
+    tiers: dict[int, list[Document]] = {1: [], 2: [], 3: []}
+    for doc in sorted(documents, key=lambda d: (d.tier, d.order)):
+        tiers.setdefault(doc.tier, []).append(doc)
+    return tiers
+
+
 def founding_docs_sidebar(documents: list[Document], current_slug: str = "", current_page: str = "") -> str:
     """Render left sidebar navigation with tiered document organization.
 
@@ -191,14 +228,23 @@ def founding_docs_sidebar(documents: list[Document], current_slug: str = "", cur
     Returns:
         HTML string for sidebar navigation with 3-tier hierarchy
     """
-    # Organize by tier: 1=Essential, 2=Architecture (usually empty), 3=Reference
-    # Sort documents by tier and order
-    sorted_docs = sorted(documents, key=lambda d: (d.tier, d.order))
+    return tiered_docs_sidebar(group_documents_by_tier(documents), current_slug, current_page)
+
+
+def tiered_docs_sidebar(tiers: dict[int, list[Document]], current_slug: str = "", current_page: str = "") -> str:
+    """Render left sidebar navigation from documents already grouped by tier.
+
+    Args:
+        tiers: Output of group_documents_by_tier
+        current_slug: Currently active document slug
+        current_page: Currently active page (e.g., 'projects')
 
-    # Group by tier
-    tier1_docs = [d for d in sorted_docs if d.tier == 1]
-    tier2_docs = [d for d in sorted_docs if d.tier == 2]
-    tier3_docs = [d for d in sorted_docs if d.tier == 3]
+    Returns:
+        HTML string for sidebar navigation with 3-tier hierarchy
+    """
+    tier1_docs = tiers.get(1, [])
+    tier2_docs = tiers.get(2, [])
+    tier3_docs = tiers.get(3, [])
 
     def render_doc_links(docs: list[Document]) -> str:
         """Render list of document links."""
@@ -299,3 +345,113 @@ def layer_section(layer: Layer, projects: list[Project]) -> str:
             </div>
         </section>
     """
+
+
+def snippet_html(snippet: Snippet) -> str:
+    """Render a search snippet with its matched terms in <mark>.
+
+    Args:
+        snippet: Snippet text and highlight spans
+
+    Returns:
+        Escaped HTML string
+    """
+    parts = []
+    cursor = 0
+    for start, end in snippet.highlights:
+        parts.append(escape(snippet.text[cursor:start]))
+        parts.append(f"<mark>{escape(snippet.text[start:end])}</mark>")
+        cursor = end
+    parts.append(escape(snippet.text[cursor:]))
+    return "".join(parts)
+
+
+def search_results(query: str, results: Optional[SearchResults]) -> str:
+    """Render the search page: form, then ranked hits.
+
+    Args:
+        query: Query as typed (shown back in the form)
+        results: Results, or None when no query was given
+
+    Returns:
+        HTML string for the search page body
+    """
+    form = f"""
+        <form class="search-form" action="/search" method="get" role="search">
+            <input type="search" name="q" value="{escape(query)}" placeholder="Search the docs" aria-label="Search the docs">
+            <button type="submit">Search</button>
+        </form>
+    """
+    if results is None:
+        return f"<h1>Search</h1>{form}"
+
+    if not results.hits:
+        summary = f'<p class="search-summary">No results for <strong>{escape(query)}</strong>.</p>'
+        return f"<h1>Search</h1>{form}{summary}"
+
+    # total counts matching sections (one page can contribute several)
+    matches = "1 section matches" if results.total == 1 else f"{results.total} sections match"
+    summary = f'<p class="search-summary">{matches} <strong>{escape(query)}</strong>.</p>'
+    hits = "\n".join(
+        f"""
+            <li class="search-hit">
+                <a href="{escape(hit.url)}">{escape(hit.title)}{f" › {escape(hit.section)}" if hit.section else ""}</a>
+                <span class="meta-badge">{escape(hit.category)}</span>
+                <p>{snippet_html(hit.snippet)}</p>
+            </li>"""
+        for hit in results.hits
+    )
+    return f'<h1>Search</h1>{form}{summary}<ol class="search-results">{hits}\n        </ol>'
+
+
+def not_found_page(path: str, suggestions: list[PageSuggestion]) -> str:
+    """Render the 404 page body: what was asked for, then the nearest pages.
+
+    Args:
+        path: Requested URL path
+        suggestions: Nearest known pages, best first (may be empty)
+
+    Returns:
+        HTML string for the 404 page body
+    """
+    words = " ".join(part for part in path.replace("-", " ").replace("_", " ").split("/") if part)
+    search_link = f'<a href="/search?q={quote_plus(words)}">search the docs</a>' if words else '<a href="/search">search the docs</a>'
+    intro = f"<h1>Page not found</h1><p>Nothing lives at <code>{escape(path)}</code>.</p>"
+    if not suggestions:
+        return f"{intro}<p>Try the navigation above, or {search_link}.</p>"
+
+    items = "\n".join(
+        f'            <li><a href="{escape(s.url)}">{escape(s.title)}</a> <code>{escape(s.url)}</code></li>'
+        for s in suggestions
+    )
+    return f'{intro}<p>Did you mean:</p><ul class="did-you-mean">\n{items}\n        </ul><p>Or {search_link}.</p>'
+
+
+def related_reading(links: Sequence[RelatedLink]) -> str:
+    """Render a page's related reading as an aside after its content.
+
+    Args:
+        links: Related pages, most similar first
+
+    Returns:
+        HTML string for the aside ("" if there are none)
+    """
+    if not links:
+        return ""
+    items = "\n".join(f'            <li><a href="{escape(link.url)}">{escape(link.title)}</a></li>' for link in links)
+    return f'\n<aside class="related-reading">\n        <h2>Related reading</h2>\n        <ul>\n{items}\n        </ul>\n    </aside>'
+
+
+def backlinks(links: Sequence[Backlink]) -> str:
+    """Render the pages linking to a page as an aside after its content.
+
+    Args:
+        links: Linking pages, in sitemap order
+
+    Returns:
+        HTML string for the aside ("" if there are none)
+    """
+    if not links:
+        return ""
+    items = "\n".join(f'            <li><a href="{escape(link.url)}">{escape(link.title)}</a></li>' for link in links)
+    return f'\n<aside class="backlinks">\n        <h2>Linking here</h2>\n        <ul>\n{items}\n        </ul>\n    </aside>'
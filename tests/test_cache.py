@@ -0,0 +1,72 @@
+"""
+Tests for the generation cache.
+
+These tests verify that:
+- A value is rebuilt only on a content generation or docs tree change
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from sil_web.services.cache import GenerationCache, tree_signature
+from sil_web.services.content import ContentService
+
+
+class TestGenerationCache:
+    """Tests for rebuild triggers."""
+
+    @pytest.fixture
+    def docs(self, tmp_path):
+        """Small docs tree."""
+        (tmp_path / "systems").mkdir()
+        (tmp_path / "systems" / "reveal.md").write_text("# Reveal\n")
+        return tmp_path
+
+    def make_cache(self, docs: Path, content_service=None):
+        builds = []
+
+        def build() -> int:
+            builds.append(1)
+            return len(builds)
+
+        cache = GenerationCache(build, lambda: tree_signature([docs]), content_service, check_interval=0)
+        return cache, builds
+
+    def test_reuses_until_tree_changes(self, docs):
+        """Should rebuild only when a file is added or edited."""
+        cache, builds = self.make_cache(docs)
+        cache.get()
+        cache.get()
+        assert len(builds) == 1
+
+        (docs / "systems" / "new.md").write_text("# New\n")
+        cache.get()
+        assert len(builds) == 2
+
+        path = docs / "systems" / "reveal.md"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))  # older copy, same size
+        cache.get()
+        assert len(builds) == 3
+
+    def test_rebuilds_on_generation_change(self, docs):
+        """Should rebuild when the content service is invalidated."""
+        content_service = ContentService(docs)
+        cache, builds = self.make_cache(docs, content_service)
+        cache.get()
+
+        content_service.invalidate()
+        cache.get()
+        assert len(builds) == 2
+
+    def test_check_interval_skips_tree_walk(self, docs):
+        """Should not re-check the tree within the check interval."""
+        cache, builds = self.make_cache(docs)
+        cache.check_interval = 3600
+        cache.get()
+
+        (docs / "systems" / "new.md").write_text("# New\n")
+        cache.get()
+        assert len(builds) == 1
@@ -0,0 +1,140 @@
+"""
+Tests for the single-pass document pipeline.
+
+These tests verify that:
+- Frontmatter, H1 title, body, TOC, sections and word count come from one parse
+- Headings inside code fences are ignored
+- Parsed documents are cached and revalidated when the file changes
+- Documents are discarded by resolved path, safely alongside concurrent loads
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sil_web.services.documents import DocumentCache, parse_document
+
+SAMPLE = """---
+title: Sample
+status: draft
+---
+
+# Sample Title
+
+Intro paragraph.
+
+## First Section
+
+```python
+# not a heading
+```
+
+### Detail
+
+## First Section
+"""
+
+
+class TestParseDocument:
+    """Tests for parse_document()."""
+
+    def test_extracts_metadata_title_and_body(self):
+        """Should split frontmatter, take the first H1 as title, and strip it from the body."""
+        doc = parse_document(SAMPLE)
+
+        assert doc.metadata == {"title": "Sample", "status": "draft"}
+        assert doc.title == "Sample Title"
+        assert "# Sample Title" not in doc.body
+        assert "Intro paragraph." in doc.body
+        assert doc.is_draft
+
+    def test_toc_matches_renderer_ids(self):
+        """Should assign h2-h4 ids the toc extension would, skipping fenced code."""
+        doc = parse_document(SAMPLE)
+
+        assert [(e.level, e.id, e.title) for e in doc.toc] == [
+            (2, "first-section", "First Section"),
+            (3, "detail", "Detail"),
+            (2, "first-section_1", "First Section"),
+        ]
+
+    def test_sections_split_at_toc_headings(self):
+        """Should cut the body at each h2-h4 heading, keyed by its toc id."""
+        doc = parse_document(SAMPLE)
+
+        assert [(s.anchor, s.title, s.level) for s in doc.sections] == [
+            (None, None, 1),
+            ("first-section", "First Section", 2),
+            ("detail", "Detail", 3),
+            ("first-section_1", "First Section", 2),
+        ]
+        assert "Intro paragraph." in doc.sections[0].markdown
+        assert "# not a heading" in doc.sections[1].markdown  # fenced, stays in its section
+
+    def test_no_frontmatter(self):
+        """Should parse plain markdown with empty metadata."""
+        doc = parse_document("Just text, no heading.")
+
+        assert doc.metadata == {}
+        assert doc.title is None
+        assert doc.word_count == 4
+        assert not doc.is_draft
+
+    def test_invalid_frontmatter_is_stripped(self):
+        """Should drop an unparseable YAML header rather than render it."""
+        doc = parse_document("---\ntitle: [unclosed\n---\n\n# Title\n\nBody\n")
+
+        assert doc.metadata == {}
+        assert doc.title == "Title"
+        assert "unclosed" not in doc.body
+
+
+class TestDocumentCache:
+    """Tests for stat-validated DocumentCache."""
+
+    def test_missing_file(self, tmp_path):
+        """Should return None for a file that doesn't exist."""
+        assert DocumentCache().load(tmp_path / "missing.md") is None
+
+    def test_reuses_unchanged_and_reparses_changed(self, tmp_path):
+        """Should return the cached parse until the file's mtime/size change."""
+        path = tmp_path / "doc.md"
+        path.write_text("# One\n")
+        cache = DocumentCache()
+
+        first = cache.load(path)
+        assert cache.load(path) is first
+
+        path.write_text("# Two, longer\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = cache.load(path)
+        assert second is not first
+        assert second is not None and second.title == "Two, longer"
+
+    def test_discard_by_any_spelling(self, tmp_path, monkeypatch):
+        """Should forget a document loaded by relative path when discarded by absolute path."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "doc.md").write_text("# One\n")
+        (tmp_path / "other.md").write_text("# Other\n")
+        cache = DocumentCache()
+        first = cache.load(Path("doc.md"))
+        other = cache.load(Path("other.md"))
+
+        assert cache.discard([tmp_path / "doc.md"]) == [first]
+        assert cache.load(Path("doc.md")) is not first
+        assert cache.load(Path("other.md")) is other
+
+    def test_discard_while_loading(self, tmp_path):
+        """Should let discard run while other threads insert documents."""
+        for i in range(200):
+            (tmp_path / f"doc{i}.md").write_text(f"# Doc {i}\n")
+        cache = DocumentCache()
+        paths = sorted(tmp_path.glob("*.md"))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            loads = [pool.submit(cache.load, path) for path in paths]
+            for _ in range(50):
+                cache.discard(paths[:10])
+            assert all(load.result() is not None for load in loads)
@@ -0,0 +1,76 @@
+"""
+Tests for the blocking file I/O pool.
+
+These tests verify that:
+- Blocking calls run off the event loop and return their result
+- Queue depth and active workers are tracked
+- /health reports the app's pool
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from sil_web.app import app
+from sil_web.services.fileio import FileIOPool
+
+
+@pytest.fixture
+def pool():
+    """Two-worker pool, shut down after the test."""
+    pool = FileIOPool(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestFileIOPool:
+    """Tests for FileIOPool."""
+
+    async def test_runs_off_loop_thread(self, pool):
+        """Should run the call on a pool thread and return its result."""
+        loop_thread = threading.get_ident()
+        result = await pool.run(lambda x: (x * 2, threading.get_ident()), 21)
+
+        assert result[0] == 42
+        assert result[1] != loop_thread
+        assert pool.stats()["completed"] == 1
+
+    async def test_exceptions_propagate(self, pool):
+        """Should raise the call's exception in the awaiting coroutine."""
+        with pytest.raises(FileNotFoundError):
+            await pool.run(lambda: (_ for _ in ()).throw(FileNotFoundError("missing.md")))
+        assert pool.stats()["active"] == 0
+
+    async def test_reports_queue_depth(self, pool):
+        """Should count calls waiting for a worker beyond max_workers."""
+        release = threading.Event()
+        tasks = [asyncio.create_task(pool.run(release.wait, 5)) for _ in range(5)]
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if pool.stats()["active"] == 2:
+                break
+
+        stats = pool.stats()
+        assert stats["active"] == 2
+        assert stats["queued"] == 3
+        assert pool.queue_depth == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        stats = pool.stats()
+        assert (stats["active"], stats["queued"], stats["completed"]) == (0, 0, 5)
+        assert stats["peak_queued"] >= 3
+
+
+class TestHealthReportsPool:
+    """Tests for the /health pool report."""
+
+    def test_health_includes_io_pool(self):
+        """Should include the app pool's load in the health response."""
+        # No lifespan context: leaving it would shut down the shared app's pool
+        data = TestClient(app).get("/health").json()
+
+        assert data["status"] == "healthy"
+        assert set(data["io_pool"]) == {"workers", "active", "queued", "peak_queued", "completed"}
@@ -5,13 +5,54 @@ These tests verify that:
 - Frontmatter is correctly parsed (private, beth_topics, tags)
 - Privacy filtering works at service layer
 - Missing frontmatter uses safe defaults
+- The shared parser splits and loads only the header block
 """
 
 
 import pytest
+import yaml
 
 from sil_web.domain.models import ProjectStatus
 from sil_web.services.content import ContentService, ProjectService
+from sil_web.services.frontmatter import has_frontmatter, parse_frontmatter, read_frontmatter
+
+
+class TestFrontmatterParser:
+    """Tests for the shared header-only frontmatter parser."""
+
+    def test_parse_splits_header_and_content(self):
+        """Should load the header and return stripped content."""
+        meta, content = parse_frontmatter("---\ntitle: Doc\ntier: 1\n---\n\n# Doc\n\nBody\n")
+
+        assert meta == {"title": "Doc", "tier": 1}
+        assert content == "# Doc\n\nBody"
+
+    def test_body_is_never_parsed_as_yaml(self):
+        """Should ignore later --- lines (horizontal rules) in the body."""
+        meta, content = parse_frontmatter("---\nstatus: draft\n---\nText\n\n---\n\n: not yaml [\n")
+
+        assert meta == {"status": "draft"}
+        assert content.endswith(": not yaml [")
+
+    def test_no_or_unclosed_frontmatter(self):
+        """Should return empty metadata and the whole text."""
+        assert parse_frontmatter("# Title\n") == ({}, "# Title")
+        assert not has_frontmatter("---\ntitle: never closed\n")
+        assert has_frontmatter("---\ntitle: x\n---\n")
+
+    def test_invalid_yaml_raises(self):
+        """Should surface YAML errors for callers to handle."""
+        with pytest.raises(yaml.YAMLError):
+            parse_frontmatter("---\ntitle: [unclosed\n---\nBody\n")
+
+    def test_read_frontmatter_from_file(self, tmp_path):
+        """Should read just the header block from disk."""
+        path = tmp_path / "doc.md"
+        path.write_text("\n---\nstatus: Draft\n---\n# Doc\n")
+        assert read_frontmatter(path) == {"status": "Draft"}
+
+        path.write_text("# No frontmatter\n")
+        assert read_frontmatter(path) == {}
 
 
 class TestContentServicePrivacy:
@@ -0,0 +1,136 @@
+"""
+Tests for glossary auto-linking.
+
+These tests verify that:
+- The automaton finds leftmost-longest whole-word matches in one pass
+- Terms come from the glossary's h3 entries, qualifiers dropped
+- Only the first occurrence of each term is linked, never inside links, code, headings or comments
+- The renderer links (and caches) every page except the glossary itself
+"""
+
+from pathlib import Path
+
+from sil_web.services.documents import parse_document
+from sil_web.services.glossary import GlossaryLinker, TermAutomaton, glossary_terms
+from sil_web.services.markdown import MarkdownRenderer
+
+GLOSSARY = """# Glossary
+
+## A
+
+### **Agent**
+
+Something that acts.
+
+### **Agent Ether**
+
+Where agents meet.
+
+### **Backend (Compilation)**
+
+Code generation.
+"""
+
+
+def make_linker() -> GlossaryLinker:
+    document = parse_document(GLOSSARY, path=Path("docs/foundations/SIL_GLOSSARY.md"))
+    return GlossaryLinker.from_document(document, "/foundations/sil-glossary")
+
+
+class TestTermAutomaton:
+    """Tests for multi-pattern matching."""
+
+    def test_longest_match_wins(self):
+        """Should prefer the longer of two terms starting at the same place."""
+        automaton = TermAutomaton(["agent", "agent ether"])
+
+        assert automaton.find("The Agent Ether layer, and an agent.") == [(4, 15, 1), (30, 35, 0)]
+
+    def test_whole_words_only(self):
+        """Should not match inside longer words."""
+        automaton = TermAutomaton(["net", "ether"])
+
+        assert automaton.find("Ethernet networks") == []
+        assert automaton.find("the net") == [(4, 7, 0)]
+
+    def test_overlapping_suffixes(self):
+        """Should find terms reachable only through failure links."""
+        automaton = TermAutomaton(["she", "he", "hers"])
+
+        assert automaton.find("ushers he") == [(7, 9, 1)]
+        assert automaton.find("hers she") == [(0, 4, 2), (5, 8, 0)]
+
+
+class TestGlossaryLinker:
+    """Tests for linking rendered HTML."""
+
+    def test_terms_from_glossary(self):
+        """Should take h3 entries, dropping emphasis and parenthetical qualifiers."""
+        document = parse_document(GLOSSARY)
+
+        assert glossary_terms(document) == [
+            ("Agent", "agent"),
+            ("Agent Ether", "agent-ether"),
+            ("Backend", "backend-compilation"),
+        ]
+
+    def test_first_occurrence_linked(self):
+        """Should link each term once, keeping its original case."""
+        html = make_linker().link("<p>An agent uses the backend. Another Agent too.</p>")
+
+        assert html.count('class="glossary-term"') == 2
+        assert '<a href="/foundations/sil-glossary#agent" class="glossary-term" title="Glossary: Agent">agent</a>' in html
+        assert "Another Agent too" in html
+
+    def test_skips_links_code_and_headings(self):
+        """Should leave text inside links, code and headings alone."""
+        html = make_linker().link(
+            '<h2>Agent</h2><p><a href="/x">agent</a> <code>agent</code></p><pre><code>agent</code></pre><p>the agent</p>'
+        )
+
+        assert html.count('class="glossary-term"') == 1
+        assert html.endswith('<p>the <a href="/foundations/sil-glossary#agent" class="glossary-term" title="Glossary: Agent">agent</a></p>')
+
+    def test_skips_comments(self):
+        """Should leave HTML comments intact, terms and all."""
+        comment = "<!-- the agent and <b>backend</b> notes -->"
+        html = make_linker().link(f"<p>{comment} then the agent</p>")
+
+        assert comment in html
+        assert html.count('class="glossary-term"') == 1
+        assert html.endswith('then the <a href="/foundations/sil-glossary#agent" class="glossary-term" title="Glossary: Agent">agent</a></p>')
+
+
+class TestRendererStage:
+    """Tests for the renderer's glossary stage."""
+
+    def test_documents_linked_and_cached(self):
+        """Should link rendered documents and cache the linked HTML."""
+        renderer = MarkdownRenderer(None, glossary=make_linker())
+        document = parse_document("# Page\n\nThe Agent Ether hums.", path=Path("docs/page.md"))
+
+        html = renderer.render_document(document)
+
+        assert 'href="/foundations/sil-glossary#agent-ether"' in html
+        assert renderer.render_document(document) is html
+
+    def test_glossary_not_linked_to_itself(self):
+        """Should render the glossary document without links to itself."""
+        linker = make_linker()
+        renderer = MarkdownRenderer(None, glossary=linker)
+
+        html = renderer.render_document(parse_document(GLOSSARY, path=linker.source))
+
+        assert "glossary-term" not in html
+
+    def test_cache_keeps_linked_and_unlinked_apart(self):
+        """Should not serve the glossary's unlinked render for the same body elsewhere."""
+        linker = make_linker()
+        renderer = MarkdownRenderer(None, glossary=linker)
+        body = "# Page\n\nThe Agent Ether hums."
+
+        unlinked = renderer.render_document(parse_document(body, path=linker.source))
+        linked = renderer.render_document(parse_document(body, path=Path("docs/page.md")))
+
+        assert "glossary-term" not in unlinked
+        assert "glossary-term" in linked
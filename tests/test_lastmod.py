@@ -0,0 +1,70 @@
+"""
+Tests for the git-derived last-modified index.
+
+These tests verify that:
+- The index file is loaded once and looked up by docs-relative path
+- A missing or invalid index falls back to file mtimes
+- The sitemap takes <lastmod> from the index
+"""
+
+import json
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sil_web.routes.sitemap import create_sitemap_router
+from sil_web.services.lastmod import LastmodIndex
+
+
+class TestLastmodIndex:
+    """Tests for LastmodIndex loading and lookup."""
+
+    def test_lookup_from_index(self, tmp_path):
+        """Should return commit times by path relative to the docs root."""
+        docs = tmp_path / "docs"
+        (docs / "systems").mkdir(parents=True)
+        (docs / "systems" / "reveal.md").write_text("# Reveal\n")
+        index_path = docs / ".lastmod-index.json"
+        index_path.write_text(json.dumps({"version": 1, "files": {"systems/reveal.md": 1700000000}}))
+
+        index = LastmodIndex.load(index_path, docs)
+
+        assert index.from_git
+        assert index.lastmod(docs / "systems" / "reveal.md") == 1700000000.0
+        assert index.lastmod(docs / "systems" / "unknown.md") is None
+        assert index.lastmod(tmp_path / "elsewhere.md") is None
+
+    def test_missing_index_falls_back_to_mtime(self, tmp_path):
+        """Should use file mtimes when no index was built."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Doc\n")
+
+        index = LastmodIndex.load(tmp_path / "missing.json", tmp_path)
+
+        assert not index.from_git
+        assert index.lastmod(doc) == doc.stat().st_mtime
+        assert index.lastmod(tmp_path / "gone.md") is None
+
+    def test_invalid_index_falls_back_to_mtime(self, tmp_path):
+        """Should ignore a corrupt index rather than fail startup."""
+        index_path = tmp_path / "index.json"
+        index_path.write_text("{not json")
+
+        assert not LastmodIndex.load(index_path, tmp_path).from_git
+
+
+class TestSitemapLastmod:
+    """Tests for sitemap <lastmod> from the index."""
+
+    def test_sitemap_uses_index(self):
+        """Should emit index times, and no <lastmod> for docs the index lacks."""
+        index = LastmodIndex(Path("docs"), {"pages/about.md": 0})
+        app = FastAPI()
+        app.include_router(create_sitemap_router(check_interval=0, lastmod_index=index))
+
+        response = TestClient(app).get("/sitemap-pages.xml")
+
+        assert "<loc>https://semanticinfrastructurelab.org/about</loc><lastmod>1970-01-01</lastmod>" in response.text
+        assert "<loc>https://semanticinfrastructurelab.org/contact</loc></url>" in response.text
+        assert response.headers["last-modified"] == "Thu, 01 Jan 1970 00:00:00 GMT"
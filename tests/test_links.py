@@ -0,0 +1,186 @@
+"""
+Tests for the internal link graph.
+
+These tests verify that:
+- Internal hrefs are normalized; external, asset and glossary links are not pages' links
+- Backlinks and orphans follow from the outbound links, aliases resolved
+- Only changed pages are re-rendered when the graph is rebuilt
+- Links are validated against the route table, as the page routes resolve them
+- Document pages and /links.json serve the graph, built on first use (not at startup)
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from sil_web.app import app, create_app
+from sil_web.routes.links import RouteTable
+from sil_web.routes.pages import legacy_redirect
+from sil_web.services.documents import parse_document
+from sil_web.services.links import LinkService, extract_links, internal_target
+from sil_web.services.markdown import MarkdownRenderer
+from sil_web.services.search import SearchPage
+
+
+def make_page(url: str, body: str) -> SearchPage:
+    document = parse_document(f"# {url}\n\n{body}\n", path=Path(f"docs{url}.md"))
+    return SearchPage(url=url, title=url.strip("/").title(), category="articles", document=document)
+
+
+@pytest.fixture
+def pages():
+    """A hub linking out, a page linking back through an alias, and an orphan."""
+    return {
+        "/hub": make_page("/hub", "See [a](/a#intro) and [b](/b/) and [out](https://example.com)."),
+        "/a": make_page("/a", "Back to [the hub](/old-hub)."),
+        "/b": make_page("/b", "Nothing here links anywhere."),
+    }
+
+
+def make_service(pages, renders=None, routes=None):
+    renderer = MarkdownRenderer(None)
+
+    def render(page):
+        if renders is not None:
+            renders.append(page.url)
+        return renderer.render_document(page.document)
+
+    aliases = {"/old-hub": Path("docs/hub.md")}
+    return LinkService(
+        lambda: list(pages.values()),
+        lambda: len(renders or ()),
+        render,
+        check_interval=0,
+        aliases=lambda: aliases,
+        routes=(lambda: routes) if routes is not None else None,
+    )
+
+
+class TestExtraction:
+    """Tests for reading links out of rendered HTML."""
+
+    @pytest.mark.parametrize(
+        ("href", "expected"),
+        [
+            ("/systems/reveal/", "/systems/reveal"),
+            ("/systems/reveal?x=1#top", "/systems/reveal"),
+            ("tia", "/systems/tia"),
+            ("../articles", "/articles"),
+            ("#section", None),
+            ("https://example.com/x", None),
+            ("mailto:hi@example.com", None),
+            ("/static/css/style.css", None),
+        ],
+    )
+    def test_internal_target(self, href, expected):
+        """Should resolve internal hrefs against the page and drop everything else."""
+        assert internal_target(href, "/systems/reveal") == expected
+
+    def test_glossary_links_skipped(self):
+        """Should ignore glossary auto-links and repeats."""
+        html = '<a href="/a">a</a> <a href="/foundations/sil-glossary#x" class="glossary-term">x</a> <a href="/a#y">again</a>'
+
+        assert extract_links(html, "/") == ("/a",)
+
+
+class TestLinkService:
+    """Tests for the cached graph."""
+
+    def test_backlinks_and_orphans(self, pages):
+        """Should invert outbound links, resolving aliases to the page's URL."""
+        graph = make_service(pages).graph
+
+        assert graph.links("/hub") == ("/a", "/b")
+        assert [link.url for link in graph.backlinks("/hub")] == ["/a"]
+        assert graph.backlinks(Path("docs/a.md"))[0].title == "Hub"
+        assert graph.orphans == ()
+
+        pages["/c"] = make_page("/c", "Unlinked.")
+        assert make_service(pages).graph.orphans == ("/c",)
+
+    def test_only_changed_pages_rerendered(self, pages):
+        """Should re-render just the edited page on rebuild."""
+        renders: list[str] = []
+        service = make_service(pages, renders)
+        service.graph
+
+        pages["/b"] = make_page("/b", "Now [hub](/hub).")
+        renders.append("(edit)")  # bumps the signature
+
+        assert [link.url for link in service.backlinks("/hub")] == ["/a", "/b"]
+        assert renders == ["/hub", "/a", "/b", "(edit)", "/b"]
+
+
+class TestValidation:
+    """Tests for checking links against the route table."""
+
+    def test_unresolved_links_recorded(self, pages):
+        """Should record the links each page makes to paths the site doesn't serve."""
+        graph = make_service(pages, routes={"/hub", "/a"}).graph
+
+        assert graph.broken == {"/hub": ("/b",), "/a": ("/old-hub",)}
+        assert make_service(pages).graph.broken == {}
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/systems/reveal",
+            "/systems/reveal.md",
+            "/founders-letter",
+            "/foundations/founders-letter",
+            "/foundations/SIL_GLOSSARY",
+            "/tools/reveal",
+            "/canonical/yolo",
+            "/search",
+        ],
+    )
+    def test_served_paths(self, path):
+        """Should accept pages, aliases, .md twins, resolver variants and legacy redirects."""
+        assert path in RouteTable(extra=["/search"])
+
+    @pytest.mark.parametrize("path", ["/systems/nope", "/tools/nope", "/research/nope", "/nope", "/systems/reveal/deeper"])
+    def test_unserved_paths(self, path):
+        """Should reject paths no route serves."""
+        assert path not in RouteTable()
+
+    def test_legacy_redirects(self):
+        """Should map old URLs as their redirect routes do."""
+        assert legacy_redirect("tools", "reveal") == "/systems/reveal"
+        assert legacy_redirect("canonical", "manifesto") == "/manifesto"
+        assert legacy_redirect("innovations") == "/systems"
+
+
+class TestLinkRoutes:
+    """Tests for backlinks on pages and as JSON."""
+
+    def test_document_page_shows_backlinks(self):
+        """Should render the backlinks aside after a linked-to document."""
+        response = TestClient(app).get("/systems/reveal")
+
+        assert response.status_code == 200
+        assert '<aside class="backlinks">' in response.text
+
+    def test_links_json(self):
+        """Should serve one page's links, or the whole graph with its orphans."""
+        client = TestClient(app)
+
+        one = client.get("/links.json", params={"url": "/systems/reveal"}).json()
+        everything = client.get("/links.json").json()
+
+        assert one["url"] == "/systems/reveal"
+        assert one["backlinks"] and set(one) == {"url", "title", "links", "backlinks", "broken"}
+        assert everything["pages"]["/systems/reveal"]["backlinks"] == one["backlinks"]
+        assert isinstance(everything["orphans"], list)
+        assert everything["broken"].get("/systems/reveal", []) == one["broken"]
+        assert client.get("/links.json", params={"url": "/nope"}).status_code == 404
+
+    def test_graph_built_on_first_use(self):
+        """Should leave the graph unbuilt at startup, and build it for its first request."""
+        fresh = create_app()
+        with TestClient(fresh) as client:
+            assert fresh.state.link_service._cache._value is None
+
+            client.get("/links.json", params={"url": "/systems/reveal"})
+
+            assert fresh.state.link_service._cache._value is not None
@@ -0,0 +1,113 @@
+"""
+Tests for the markdown rendering pipeline.
+
+These tests verify that:
+- Rendered HTML is cached per content hash and entry point
+- Concurrent renders (the file I/O pool) match serial ones
+- Server-side highlighting is opt-in and leaves mermaid blocks alone
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from sil_web.services.documents import parse_document
+from sil_web.services.markdown import MarkdownRenderer
+
+CODE_DOC = """# Title
+
+```python
+def hello():
+    return "<hi>"
+```
+
+```mermaid
+graph TD; A-->B
+```
+
+```
+plain block
+```
+"""
+
+
+class TestRenderCache:
+    """Tests for the render cache."""
+
+    def test_render_is_cached_per_content(self):
+        """Should return the cached HTML for identical content."""
+        renderer = MarkdownRenderer(None)
+        first = renderer.render("# Title\n\nHello")
+        assert renderer.render("# Title\n\nHello") is first
+
+    def test_changed_content_renders_fresh(self):
+        """Should render again when content changes."""
+        renderer = MarkdownRenderer(None)
+        renderer.render("Hello")
+        assert "Goodbye" in renderer.render("Goodbye")
+
+    def test_clear_cache(self):
+        """Should drop cached renders."""
+        renderer = MarkdownRenderer(None)
+        first = renderer.render("Hello")
+        renderer.clear_cache()
+        assert renderer.render("Hello") is not first
+
+
+    def test_raw_and_parsed_renders_cached_apart(self):
+        """Should not serve a parsed body's render for the same text given as raw content."""
+        renderer = MarkdownRenderer(None)
+        text = "# Title\n\nHello"
+        document = replace(parse_document(text), body=text)  # a body that keeps its heading
+
+        assert "<h1" not in renderer.render(text)
+        assert "<h1" in renderer.render_document(document)
+
+
+class TestConcurrentRendering:
+    """Tests for rendering from several threads at once."""
+
+    def test_concurrent_renders_match_serial(self):
+        """Should give every thread the same HTML a serial render does, under cache churn."""
+        docs = [
+            f"# Doc {i}\n\n## Part {i}\n\n| a | b |\n|---|---|\n| {i} | {i * 2} |\n\n- item {i}\n- more\n\n```\ncode {i}\n```\n"
+            for i in range(40)
+        ]
+        expected = [MarkdownRenderer(None).render(doc) for doc in docs]
+        renderer = MarkdownRenderer(None)
+        renderer.CACHE_SIZE = 8  # keep evicting while other threads read
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(renderer.render, docs * 10))
+
+        assert results == expected * 10
+
+
+class TestServerHighlight:
+    """Tests for the opt-in Pygments highlight stage."""
+
+    def test_highlight_disabled_by_default(self):
+        """Should leave code blocks for highlight.js unless enabled."""
+        renderer = MarkdownRenderer(None)
+        html = renderer.render(CODE_DOC)
+        assert renderer.highlight_enabled is False
+        assert '<pre><code class="language-python">' in html
+
+    def test_highlights_known_languages(self):
+        """Should emit Pygments token spans for labelled blocks."""
+        pytest.importorskip("pygments")
+        renderer = MarkdownRenderer(None, highlight=True)
+        html = renderer.render(CODE_DOC)
+        assert renderer.highlight_enabled is True
+        assert '<pre class="highlight"><code class="language-python">' in html
+        assert '<span class="k">def</span>' in html
+        assert "&lt;hi&gt;" in html
+
+    def test_mermaid_and_unlabelled_blocks_untouched(self):
+        """Should pass mermaid and language-less blocks through unchanged."""
+        pytest.importorskip("pygments")
+        renderer = MarkdownRenderer(None, highlight=True)
+        html = renderer.render(CODE_DOC)
+        assert '<pre><code class="language-mermaid">' in html
+        assert "<pre><code>plain block" in html
@@ -0,0 +1,126 @@
+"""
+Tests for related reading.
+
+These tests verify that:
+- Pages sharing distinctive terms, tags or topics are each other's neighbours
+- Terms every page (or only one page) has don't relate pages
+- The NumPy and pure-Python similarity passes agree
+- The graph is looked up by URL or source file and rebuilt on change
+- Document pages and /related.json serve the graph
+"""
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from sil_web.app import app
+from sil_web.services import related
+from sil_web.services.documents import parse_document
+from sil_web.services.related import RelatedService, nearest_neighbours, page_terms, tfidf_vectors
+from sil_web.services.search import SearchPage
+
+
+def make_page(url: str, body: str, tags: str = "") -> SearchPage:
+    frontmatter = f"---\ntags: [{tags}]\n---\n" if tags else ""
+    document = parse_document(f"{frontmatter}# {url}\n\n{body}\n", path=Path(f"docs{url}.md"))
+    return SearchPage(url=url, title=url.strip("/").title(), category="articles", document=document)
+
+
+@pytest.fixture
+def pages():
+    """Two pairs of pages on two topics, plus filler sharing only common words."""
+    return {
+        "/quokka": make_page("/quokka", "The quokka eats leaves. Quokka habitat and marsupial life."),
+        "/wallaby": make_page("/wallaby", "The wallaby is a marsupial; quokka cousins share the habitat."),
+        "/compiler": make_page("/compiler", "The compiler lowers the IR to machine code.", tags="compilers"),
+        "/linker": make_page("/linker", "The linker joins machine code objects.", tags="compilers"),
+        "/filler": make_page("/filler", "The the, the."),
+    }
+
+
+class TestSimilarity:
+    """Tests for TF-IDF vectors and nearest neighbours."""
+
+    def test_vectors_unit_length_and_filtered(self):
+        """Should drop terms in one document or in most, and normalize the rest."""
+        vectors = tfidf_vectors([Counter(a=2, b=1, x=1), Counter(a=1, b=3, y=1), Counter(c=1, z=1), Counter(c=2)])
+
+        assert all(abs(sum(w * w for w in v.values()) - 1) < 1e-9 for v in vectors)
+        assert [len(v) for v in vectors] == [2, 2, 1, 1]  # x, y, z appear once
+
+    def test_neighbours_by_topic(self, pages):
+        """Should pair pages sharing distinctive words or tags, never a page with itself."""
+        urls = list(pages)
+        vectors = tfidf_vectors([page_terms(page) for page in pages.values()])
+        neighbours = nearest_neighbours(vectors, k=2)
+
+        assert urls[neighbours[0][0][0]] == "/wallaby"
+        assert urls[neighbours[2][0][0]] == "/linker"
+        assert all(other != doc_id for doc_id, links in enumerate(neighbours) for other, _ in links)
+        assert neighbours[4] == []  # filler shares only common words
+
+    def test_tags_are_features(self, pages):
+        """Should turn tags into their own features."""
+        assert page_terms(pages["/compiler"])["#compilers"] == related.TOPIC_WEIGHT
+
+    @pytest.mark.parametrize("block", [related.SIMILARITY_BLOCK, 2])
+    def test_numpy_matches_python(self, pages, monkeypatch, block):
+        """Should give the same neighbours with and without NumPy, in one block or several."""
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(related, "SIMILARITY_BLOCK", block)
+        vectors = tfidf_vectors([page_terms(page) for page in pages.values()])
+
+        numpy_result = related._neighbours_numpy(vectors, 3)
+        python_result = related._neighbours_python(vectors, 3)
+
+        assert [[i for i, _ in links] for links in numpy_result] == [[i for i, _ in links] for links in python_result]
+        for a, b in zip(numpy_result, python_result):
+            assert all(abs(x - y) < 1e-9 for (_, x), (_, y) in zip(a, b))
+
+
+class TestRelatedService:
+    """Tests for the cached graph."""
+
+    def test_lookup_by_url_or_path(self, pages):
+        """Should resolve a page by URL or by its source file."""
+        service = RelatedService(lambda: list(pages.values()), lambda: 0)
+
+        assert service.related("/quokka")[0].url == "/wallaby"
+        assert service.related(Path("docs/quokka.md")) == service.related("/quokka")
+        assert service.related("/unknown") == ()
+
+    def test_rebuilt_on_change(self, pages):
+        """Should pick up an edited page on the next check."""
+        version = [0]
+        service = RelatedService(lambda: list(pages.values()), lambda: version[0], check_interval=0)
+        assert service.related("/filler") == ()
+
+        pages["/filler"] = make_page("/filler", "A linker and a compiler walk into machine code.", tags="compilers")
+        version[0] += 1
+
+        assert {link.url for link in service.related("/filler")} >= {"/compiler", "/linker"}
+
+
+class TestRelatedRoutes:
+    """Tests for related reading on pages and as JSON."""
+
+    def test_document_page_shows_related(self):
+        """Should render the related-reading aside after a document."""
+        response = TestClient(app).get("/systems/reveal")
+
+        assert response.status_code == 200
+        assert '<aside class="related-reading">' in response.text
+
+    def test_related_json(self):
+        """Should serve one page's neighbours, or the whole graph."""
+        client = TestClient(app)
+
+        one = client.get("/related.json", params={"url": "/systems/reveal"}).json()
+        everything = client.get("/related.json").json()
+
+        assert one["url"] == "/systems/reveal"
+        assert one["related"] and set(one["related"][0]) == {"url", "title", "score"}
+        assert everything["pages"]["/systems/reveal"] == one["related"]
+        assert client.get("/related.json", params={"url": "/nope"}).status_code == 404
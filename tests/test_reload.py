@@ -0,0 +1,178 @@
+"""
+Tests for applying docs sync change manifests.
+
+These tests verify that:
+- Change manifests are read, and missing or malformed ones ignored
+- Applying one drops only the changed docs' parsed documents and renders
+- Slug discovery is redone only for categories that gained or lost a file
+- A glossary change rebuilds the linker; a missed sync flushes everything
+- Overlapping reloads apply a manifest once
+- The reload endpoint serves loopback clients only
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sil_web.routes.reload import create_reload_router
+from sil_web.services.content import ContentService
+from sil_web.services.documents import read_document
+from sil_web.services.glossary import GlossaryLinker
+from sil_web.services.markdown import MarkdownRenderer
+from sil_web.services.reload import ContentReloader, read_change_manifest
+
+FRONTMATTER = "---\ntier: 1\norder: 1\n---\n"
+
+
+def write_manifest(path, generation, previous, **changes):
+    path.write_text(json.dumps({"generation": generation, "previous": previous, **changes}))
+
+
+@pytest.fixture
+def docs(tmp_path):
+    """A docs tree with two systems docs and an existing change manifest."""
+    (tmp_path / "systems").mkdir()
+    (tmp_path / "systems" / "alpha.md").write_text(FRONTMATTER + "# Alpha\n\nFirst.")
+    (tmp_path / "systems" / "beta.md").write_text(FRONTMATTER + "# Beta\n\nSecond.")
+    write_manifest(tmp_path / ".sync-changes.json", "g1", None, added=["systems/alpha.md", "systems/beta.md"])
+    return tmp_path
+
+
+@pytest.fixture
+def reloader(docs):
+    """Reloader over the docs tree, both docs loaded and rendered."""
+    content_service = ContentService(docs)
+    renderer = MarkdownRenderer(content_service)
+    for name in ("alpha", "beta"):
+        content_service.load_document("systems", name)
+        renderer.render_document(read_document(docs / "systems" / f"{name}.md"))
+    return ContentReloader(content_service, renderer, docs / ".sync-changes.json")
+
+
+class TestChangeManifest:
+    """Tests for reading sync-docs.py's manifest."""
+
+    def test_read(self, docs):
+        """Should read paths, generation and previous generation."""
+        changes = read_change_manifest(docs / ".sync-changes.json")
+
+        assert changes is not None
+        assert (changes.generation, changes.previous) == ("g1", None)
+        assert changes.paths == ("systems/alpha.md", "systems/beta.md")
+
+    def test_missing_or_malformed(self, tmp_path):
+        """Should ignore a missing or malformed manifest."""
+        (tmp_path / "bad.json").write_text("{not json")
+
+        assert read_change_manifest(tmp_path / "missing.json") is None
+        assert read_change_manifest(tmp_path / "bad.json") is None
+
+
+class TestContentReloader:
+    """Tests for targeted invalidation."""
+
+    def test_starts_at_docs_generation(self, reloader):
+        """Should treat the manifest already on disk as applied."""
+        assert reloader.generation == "g1"
+        assert reloader.reload() == {"status": "unchanged", "generation": "g1"}
+
+    def test_applies_changes_to_changed_docs_only(self, docs, reloader):
+        """Should drop just the modified doc's render and start a new content generation."""
+        generation = reloader.content_service.generation
+        (docs / "systems" / "alpha.md").write_text(FRONTMATTER + "# Alpha\n\nEdited.")
+        write_manifest(docs / ".sync-changes.json", "g2", "g1", modified=["systems/alpha.md"])
+
+        result = reloader.reload()
+
+        assert result["status"] == "applied"
+        assert (result["paths"], result["renders_evicted"]) == (1, 1)
+        assert reloader.generation == "g2"
+        assert reloader.content_service.generation == generation + 1
+        assert len(reloader.markdown_renderer._cache) == 1
+        assert "Edited" in reloader.content_service.load_document("systems", "alpha").content
+
+    def test_added_doc_discovered(self, docs, reloader):
+        """Should redo slug discovery for a category that gained a file."""
+        (docs / "systems" / "gamma.md").write_text(FRONTMATTER + "# Gamma\n\nNew.")
+        assert reloader.content_service.load_document("systems", "gamma") is None
+
+        write_manifest(docs / ".sync-changes.json", "g2", "g1", added=["systems/gamma.md"])
+        reloader.reload()
+
+        assert reloader.content_service.load_document("systems", "gamma") is not None
+        assert len(reloader.markdown_renderer._cache) == 2
+
+    def test_glossary_change_rebuilds_linker(self, docs, reloader):
+        """Should rebuild the glossary linker and drop every render when the glossary changed."""
+        glossary = docs / "systems" / "beta.md"
+        reloader.markdown_renderer.glossary = GlossaryLinker([], "/glossary", glossary)
+        rebuilt = GlossaryLinker([("Alpha", "alpha")], "/glossary", glossary)
+        reloader.glossary = lambda: rebuilt
+        write_manifest(docs / ".sync-changes.json", "g2", "g1", modified=["systems/beta.md"])
+
+        reloader.reload()
+
+        assert reloader.markdown_renderer.glossary is rebuilt
+        assert len(reloader.markdown_renderer._cache) == 0
+
+    def test_missed_generation_flushes(self, docs, reloader):
+        """Should flush every cache when a sync in between was never applied."""
+        write_manifest(docs / ".sync-changes.json", "g3", "g2", modified=["systems/alpha.md"])
+
+        assert reloader.reload()["status"] == "flushed"
+        assert reloader.generation == "g3"
+        assert len(reloader.markdown_renderer._cache) == 0
+
+    def test_concurrent_reloads_apply_once(self, docs, reloader):
+        """Should make an overlapping reload wait, then report the manifest already applied."""
+        warmed = []
+        started = threading.Event()
+        apply_changes = reloader.content_service.apply_changes
+
+        def slow_apply_changes(changes, roots):
+            started.set()
+            time.sleep(0.05)
+            return apply_changes(changes, roots)
+
+        reloader.content_service.apply_changes = slow_apply_changes
+        reloader.warm = (lambda: warmed.append(1),)
+        write_manifest(docs / ".sync-changes.json", "g2", "g1", modified=["systems/alpha.md"])
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(reloader.reload)
+            started.wait(timeout=5)
+            second = pool.submit(reloader.reload)
+            results = [first.result(), second.result()]
+
+        assert [result["status"] for result in results] == ["applied", "unchanged"]
+        assert results[1]["generation"] == "g2"
+        assert len(warmed) == 1
+
+
+class TestReloadRoute:
+    """Tests for POST /admin/reload."""
+
+    def make_client(self, reloader, host):
+        app = FastAPI()
+        app.include_router(create_reload_router(reloader))
+        return TestClient(app, client=(host, 50000))
+
+    def test_loopback_only(self, reloader):
+        """Should refuse remote and proxied clients."""
+        assert self.make_client(reloader, "203.0.113.9").post("/admin/reload").status_code == 403
+        proxied = self.make_client(reloader, "127.0.0.1").post("/admin/reload", headers={"X-Forwarded-For": "203.0.113.9"})
+        assert proxied.status_code == 403
+
+    def test_reload(self, docs, reloader):
+        """Should apply the manifest for a local client."""
+        write_manifest(docs / ".sync-changes.json", "g2", "g1", modified=["systems/beta.md"])
+
+        response = self.make_client(reloader, "127.0.0.1").post("/admin/reload")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "applied"
@@ -0,0 +1,380 @@
+"""
+Tests for full-text search.
+
+These tests verify that:
+- Documents are ranked by BM25, titles weighted above body text
+- Quoted phrases must occur verbatim
+- Snippets surround and highlight the matched terms
+- Pages are indexed per section, deep-linked by heading anchor
+- A changed page is re-indexed on its own, into a delta segment
+- A saved snapshot maps back to the same index, verified by page digest
+- /search.json and /search serve results over the published docs only
+- /search/suggest completes titles, glossary terms and headings
+"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sil_web.app import app
+from sil_web.domain.models import Snippet
+from sil_web.routes.search import (
+    collect_completions,
+    collect_search_pages,
+    create_completion_index,
+    create_search_router,
+    create_search_service,
+)
+from sil_web.services.documents import parse_document
+from sil_web.services.search import (
+    MappedSegment,
+    SearchDocument,
+    SearchIndex,
+    SearchPage,
+    SearchService,
+    markdown_to_text,
+    page_sections,
+    parse_query,
+)
+from sil_web.ui.components import search_results, snippet_html
+
+
+@pytest.fixture
+def index():
+    """Small index with overlapping vocabulary."""
+    return SearchIndex.from_documents([
+        SearchDocument("/systems/reveal", "Reveal", "Reveal shows code structure with progressive disclosure for agents.", "systems"),
+        SearchDocument("/articles/memory", "Semantic Memory", "Agents need memory. Disclosure of progress is a different thing.", "articles"),
+        SearchDocument("/about", "About", "The lab builds semantic infrastructure. " * 20, "pages"),
+    ])
+
+
+class TestSearchIndex:
+    """Tests for ranking, phrases and snippets."""
+
+    def test_ranks_by_bm25(self, index):
+        """Should rank the document where the terms are densest first."""
+        results = index.search("progressive disclosure")
+
+        assert results.total == 2
+        assert [hit.url for hit in results.hits] == ["/systems/reveal", "/articles/memory"]
+        assert results.hits[0].score > results.hits[1].score
+
+    def test_title_weight(self, index):
+        """Should rank a title match above a single body mention."""
+        assert index.search("memory").hits[0].url == "/articles/memory"
+
+    def test_phrase_must_match_verbatim(self, index):
+        """Should only return documents containing the quoted phrase in order."""
+        results = index.search('"progressive disclosure"')
+
+        assert [hit.url for hit in results.hits] == ["/systems/reveal"]
+        assert index.search('"disclosure progressive"').total == 0
+
+    def test_unknown_terms(self, index):
+        """Should ignore unknown free terms but fail unknown phrase terms."""
+        assert index.search("agents zyzzyva").total == 2
+        assert index.search('"agents zyzzyva"').total == 0
+        assert index.search("").total == 0
+
+    def test_limit(self, index):
+        """Should return at most limit hits but count every match."""
+        results = index.search("semantic", limit=1)
+
+        assert results.total == 2
+        assert len(results.hits) == 1
+
+    def test_snippet_highlights_matches(self, index):
+        """Should cut the snippet around the matches and mark each one."""
+        snippet = index.search("infrastructure").hits[0].snippet
+
+        assert snippet.text.endswith("…")
+        assert snippet.highlights
+        assert all(snippet.text[start:end] == "infrastructure" for start, end in snippet.highlights)
+
+    def test_parse_query(self):
+        """Should split quoted phrases from free terms."""
+        terms, phrases = parse_query('agents "Progressive Disclosure" memory')
+
+        assert phrases == [["progressive", "disclosure"]]
+        assert terms == ["progressive", "disclosure", "agents", "memory"]
+
+    def test_markdown_to_text(self):
+        """Should strip markup but keep link and image text."""
+        text = markdown_to_text("## Heading\n\n- see [the docs](/x) and **bold** `code`\n\n![alt](a.png)")
+
+        assert text == "Heading see the docs and bold code alt"
+
+    def test_snippet_html_escapes(self):
+        """Should escape snippet text and wrap highlights in <mark>."""
+        html = snippet_html(Snippet("a <b> match", ((6, 11),)))
+
+        assert html == "a &lt;b&gt; <mark>match</mark>"
+
+
+class TestSectionIndex:
+    """Tests for section-level indexing and incremental updates."""
+
+    PAGE = "# Manual\n\nIntro text.\n\n## Boot Status\n\nThe quokka boots.\n\n### Deeper\n\nQuokka detail.\n"
+
+    def make_page(self, text: str = PAGE, url: str = "/foundations/manual") -> SearchPage:
+        return SearchPage(url=url, title="Manual", category="foundations", document=parse_document(text))
+
+    def test_sections_deep_link(self):
+        """Should split a page at its headings, linking each by its anchor."""
+        sections = page_sections(self.make_page())
+
+        assert [(s.url, s.section) for s in sections] == [
+            ("/foundations/manual", ""),
+            ("/foundations/manual#boot-status", "Boot Status"),
+            ("/foundations/manual#deeper", "Deeper"),
+        ]
+        assert sections[1].text == "The quokka boots."
+
+    def test_hits_per_page_are_capped(self):
+        """Should show at most two sections of one page."""
+        text = "# Manual\n\n" + "".join(f"## Part {i}\n\nquokka\n\n" for i in range(5))
+        index = SearchIndex.from_documents(page_sections(self.make_page(text)))
+
+        results = index.search("quokka")
+        assert results.total == 5
+        assert len(results.hits) == 2
+
+    def test_summary_counts_sections(self):
+        """Should report two matching sections of one page as sections, not pages."""
+        index = SearchIndex.from_documents(page_sections(self.make_page()))
+        results = index.search("quokka")
+
+        html = search_results("quokka", results)
+
+        assert {hit.url.partition("#")[0] for hit in results.hits} == {"/foundations/manual"}
+        assert "2 sections match" in html
+        assert "pages match" not in html
+
+    def test_changed_page_goes_to_delta(self):
+        """Should re-analyze only the changed page and mask its old sections."""
+        pages = {url: self.make_page(url=url) for url in ("/a", "/b", "/c", "/d")}
+        version = [0]
+        service = SearchService(lambda: list(pages.values()), lambda: version[0], check_interval=0)
+        assert service.search("quokka").total == 8
+
+        pages["/d"] = self.make_page("# Manual\n\n## Other\n\nWombat only.\n", url="/d")
+        version[0] += 1
+        index = service.index
+
+        assert [len(segment) for segment in index.segments] == [12, 2]
+        assert index.deleted[0] == frozenset({9, 10, 11})
+        assert service.search("quokka").total == 6
+        assert service.search("wombat").hits[0].url == "/d#other"
+
+    def test_delta_merges_when_large(self):
+        """Should fold the delta into a new main segment past the merge ratio."""
+        pages = {"/a": self.make_page(url="/a")}
+        version = [0]
+        service = SearchService(lambda: list(pages.values()), lambda: version[0], check_interval=0)
+        service.index
+
+        pages["/a"] = self.make_page(self.PAGE + "\n## Extra\n\nWombat.\n", url="/a")
+        version[0] += 1
+
+        assert len(service.index.segments) == 1
+        assert service.search("wombat").hits[0].url == "/a#extra"
+
+
+class TestSnapshot:
+    """Tests for the mmap-able index snapshot."""
+
+    TEXT = "# Manual\n\nIntro text.\n\n## Boot Status\n\nThe quokka boots \"fast\" here.\n\n## Ünïcode\n\nCafé quokka.\n"
+
+    @pytest.fixture
+    def pages(self):
+        """Four pages, editable between builds."""
+        return {
+            url: SearchPage(url=url, title="Manual", category="foundations", document=parse_document(self.TEXT))
+            for url in ("/a", "/b", "/c", "/d")
+        }
+
+    def service(self, pages, version, check_interval=0.0):
+        return SearchService(lambda: list(pages.values()), lambda: version[0], check_interval=check_interval)
+
+    def test_round_trip(self, pages, tmp_path):
+        """Should answer every query exactly as the index it was saved from."""
+        built = self.service(pages, [0])
+        built.write_snapshot(tmp_path / "index.bin")
+        mapped = self.service(pages, [0], check_interval=3600)
+
+        assert mapped.load_snapshot(tmp_path / "index.bin")
+        assert isinstance(mapped.index.segments[0], MappedSegment)
+        for query in ("quokka", '"quokka boots"', "café", "manual intro", "missing"):
+            assert mapped.search(query) == built.search(query)
+        assert mapped.index.segments[0].term_count == built.index.segments[0].term_count
+
+    def test_mapped_segment_rewrites_itself(self, pages, tmp_path):
+        """Should write a mapped segment back out like any other segment."""
+        self.service(pages, [0]).write_snapshot(tmp_path / "index.bin")
+        loaded = MappedSegment.open(tmp_path / "index.bin")
+        assert loaded is not None
+        segment, page_ranges = loaded
+
+        segment.write_snapshot(tmp_path / "copy.bin", page_ranges)
+
+        assert (tmp_path / "copy.bin").read_bytes() == (tmp_path / "index.bin").read_bytes()
+
+    def test_verified_by_page_digest(self, pages, tmp_path):
+        """Should keep serving the mapped segment and re-index only changed pages."""
+        version = [0]
+        self.service(pages, version).write_snapshot(tmp_path / "index.bin")
+        service = self.service(pages, version)
+        service.load_snapshot(tmp_path / "index.bin")
+
+        assert [len(segment) for segment in service.index.segments] == [12, 0]  # checked, nothing changed
+
+        pages["/d"] = SearchPage("/d", "Manual", "foundations", parse_document("# Manual\n\n## Other\n\nWombat only.\n"))
+        version[0] += 1
+        index = service.index
+
+        assert isinstance(index.segments[0], MappedSegment)
+        assert index.deleted[0] == frozenset({9, 10, 11})
+        assert service.search("wombat").hits[0].url == "/d#other"
+        assert service.search("quokka").total == 6
+
+    def test_merge_reanalyzes_mapped_pages(self, pages, tmp_path):
+        """Should rebuild a real main segment once the delta outgrows the merge ratio."""
+        version = [0]
+        self.service(pages, version).write_snapshot(tmp_path / "index.bin")
+        service = self.service(pages, version)
+        service.load_snapshot(tmp_path / "index.bin")
+
+        for url in ("/a", "/b"):
+            pages[url] = SearchPage(url, "Manual", "foundations", parse_document(self.TEXT + "\n## Extra\n\nWombat.\n"))
+        version[0] += 1
+        index = service.index
+
+        assert len(index.segments) == 1
+        assert not isinstance(index.segments[0], MappedSegment)
+        assert service.search("quokka").total == 8
+        assert service.search("wombat").total == 2
+
+    def test_unusable_files_are_ignored(self, pages, tmp_path):
+        """Should fall back to building for missing, foreign, damaged or other-format files."""
+        service = self.service(pages, [0])
+        good = tmp_path / "index.bin"
+        self.service(pages, [0]).write_snapshot(good)
+        data = good.read_bytes()
+
+        foreign = tmp_path / "foreign.bin"
+        foreign.write_bytes(b"not an index")
+        truncated = tmp_path / "truncated.bin"
+        truncated.write_bytes(data[: len(data) // 2])
+        other_format = tmp_path / "other.bin"
+        other_format.write_bytes(data.replace(b'"format":1', b'"format":9', 1))
+        empty = tmp_path / "empty.bin"
+        empty.write_bytes(b"")
+
+        for path in (tmp_path / "missing.bin", foreign, truncated, other_format, empty):
+            assert not service.load_snapshot(path)
+        assert service.search("quokka").total == 8
+
+
+class TestSearchCorpus:
+    """Tests for the indexed document set."""
+
+    def test_collects_published_docs_once(self):
+        """Should index sitemap pages, each file once, drafts excluded."""
+        urls = [page.url for page in collect_search_pages()]
+
+        assert "/systems/reveal" in urls
+        assert "/founders-letter" in urls
+        assert "/foundations/founders-letter" not in urls  # same file as /founders-letter
+        assert len(urls) == len(set(urls))
+
+    def test_completions_include_glossary_terms(self):
+        """Should offer page titles, glossary terms and headings, markup stripped."""
+        completions = collect_completions()
+        terms = {c.label: c.url for c in completions if c.kind == "term"}
+
+        assert terms["Agent"] == "/foundations/sil-glossary#agent"
+        assert "A" not in terms  # letter headings
+        assert {c.kind for c in completions} == {"page", "term", "heading"}
+        assert not any("*" in c.label for c in completions)
+
+    def test_query_latency(self):
+        """Should answer queries over the whole corpus in under 5 ms."""
+        service = create_search_service(check_interval=3600)
+        service.index  # build once
+
+        started = time.perf_counter()
+        for query in ("semantic", '"progressive disclosure" agents', "the of and to in"):
+            service.search(query)
+        assert (time.perf_counter() - started) / 3 < 0.005
+
+
+class TestSearchRoutes:
+    """Tests for /search.json and /search."""
+
+    @pytest.fixture
+    def client(self):
+        """App with only the search API, over the repo's docs/ tree."""
+        api = FastAPI()
+        api.include_router(create_search_router(create_search_service(check_interval=0)))
+        return TestClient(api)
+
+    def test_json_results(self, client):
+        """Should return ranked results with snippets and highlight spans."""
+        response = client.get("/search.json", params={"q": "reveal", "limit": 3})
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["query"] == "reveal"
+        assert len(data["results"]) == 3
+        assert data["total"] >= 3
+        first = data["results"][0]
+        assert set(first) == {"url", "title", "section", "category", "score", "snippet", "highlights"}
+        assert first["url"].startswith("/")
+        for hit in data["results"]:
+            for start, end in hit["highlights"]:
+                assert hit["snippet"][start:end].lower() == "reveal"
+
+    def test_json_limit_bounds(self, client):
+        """Should reject out-of-range limits."""
+        assert client.get("/search.json", params={"q": "reveal", "limit": 0}).status_code == 422
+        assert client.get("/search.json", params={"q": "reveal", "limit": 500}).status_code == 422
+
+    def test_suggest(self):
+        """Should complete a prefix with cacheable results."""
+        api = FastAPI()
+        api.include_router(
+            create_search_router(create_search_service(check_interval=0), completions=create_completion_index(check_interval=0))
+        )
+        client = TestClient(api)
+
+        response = client.get("/search/suggest", params={"q": "agent e"})
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"].startswith("public, max-age=")
+        assert response.json()["suggestions"][0] == {
+            "label": "Agent Ether",
+            "url": "/foundations/sil-glossary#agent-ether",
+            "kind": "term",
+        }
+        assert client.get("/search/suggest", params={"q": "agent", "limit": 99}).status_code == 422
+
+    def test_suggest_needs_index(self, client):
+        """Should not serve /search/suggest without a completion index."""
+        assert client.get("/search/suggest", params={"q": "agent"}).status_code == 404
+
+    def test_search_page(self):
+        """Should render results inside the site shell, and a bare form without a query."""
+        client = TestClient(app)
+
+        results = client.get("/search", params={"q": "progressive disclosure"})
+        empty = client.get("/search")
+
+        assert results.status_code == 200
+        assert 'class="search-hit"' in results.text
+        assert "<mark>" in results.text
+        assert empty.status_code == 200
+        assert 'class="search-form"' in empty.text
+        assert 'class="search-hit"' not in empty.text
@@ -0,0 +1,123 @@
+"""
+Tests for the cached sitemap.
+
+These tests verify that:
+- sitemap.xml is an index of per-section child sitemaps with <lastmod>
+- Sections are split into shards within the per-file limits
+- Conditional GETs get 304, gzip is served when accepted
+"""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sil_web.routes.sitemap import create_sitemap_router
+from sil_web.services.sitemap import EncodedBody, SitemapUrl, render_urlset, shard_urlsets
+
+
+@pytest.fixture
+def client():
+    """App with only the sitemap route, over the repo's docs/ tree."""
+    app = FastAPI()
+    app.include_router(create_sitemap_router(check_interval=0))
+    return TestClient(app)
+
+
+class TestSitemapRoute:
+    """Tests for /sitemap.xml responses."""
+
+    def test_index_lists_child_sitemaps(self, client):
+        """Should serve a sitemapindex pointing at each non-empty section."""
+        response = client.get("/sitemap.xml", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/xml"
+        assert "<sitemapindex" in response.text
+        assert "<loc>https://semanticinfrastructurelab.org/sitemap-pages.xml</loc><lastmod>" in response.text
+        assert "<loc>https://semanticinfrastructurelab.org/sitemap-systems.xml</loc>" in response.text
+        assert response.headers["etag"].startswith('"')
+        assert "last-modified" in response.headers
+        assert "content-encoding" not in response.headers
+
+    def test_child_sitemap_lists_pages_with_lastmod(self, client):
+        """Should serve each section's urlset with <lastmod>."""
+        pages = client.get("/sitemap-pages.xml")
+        systems = client.get("/sitemap-systems.xml")
+
+        assert pages.status_code == 200
+        assert "<loc>https://semanticinfrastructurelab.org/about</loc><lastmod>" in pages.text
+        assert "https://semanticinfrastructurelab.org/systems/" in systems.text
+
+    def test_unknown_child_sitemap(self, client):
+        """Should 404 for unknown sections and out-of-range shards."""
+        assert client.get("/sitemap-nope.xml").status_code == 404
+        assert client.get("/sitemap-systems-99.xml").status_code == 404
+        assert client.get("/sitemap-systems-1.xml").status_code == 404  # shard 1 is /sitemap-systems.xml
+
+    def test_shards_large_sections(self):
+        """Should split sections past max_urls and list every shard in the index."""
+        app = FastAPI()
+        app.include_router(create_sitemap_router(check_interval=0, max_urls=2))
+        client = TestClient(app)
+
+        index = client.get("/sitemap.xml").text
+        assert "/sitemap-pages-2.xml</loc>" in index
+        shard = client.get("/sitemap-pages-2.xml")
+        assert shard.status_code == 200
+        assert shard.text.count("<url>") == 2
+
+    def test_conditional_get(self, client):
+        """Should answer 304 to a matching If-None-Match or If-Modified-Since."""
+        first = client.get("/sitemap.xml", headers={"Accept-Encoding": "identity"})
+
+        by_etag = client.get("/sitemap.xml", headers={"If-None-Match": first.headers["etag"]})
+        by_date = client.get("/sitemap.xml", headers={"If-Modified-Since": first.headers["last-modified"]})
+        stale = client.get("/sitemap.xml", headers={"If-None-Match": '"stale"'})
+
+        assert by_etag.status_code == 304
+        assert by_date.status_code == 304
+        assert stale.status_code == 200
+
+    def test_gzip(self, client):
+        """Should serve the pre-compressed body when gzip is accepted."""
+        plain = client.get("/sitemap.xml", headers={"Accept-Encoding": "identity"})
+        zipped = client.get("/sitemap.xml", headers={"Accept-Encoding": "gzip"})
+
+        assert zipped.headers["content-encoding"] == "gzip"
+        assert zipped.headers["vary"] == "Accept-Encoding"
+        assert zipped.headers["etag"] != plain.headers["etag"]
+        assert zipped.text == plain.text  # httpx decodes transparently
+
+
+class TestSitemapRendering:
+    """Tests for urlset rendering and encoding."""
+
+    def test_render_urlset(self):
+        """Should escape locations and format lastmod as a W3C date."""
+        xml = render_urlset("https://example.org", [SitemapUrl("/a?x=1&y=2", 0.0), SitemapUrl("/b")])
+
+        assert "<loc>https://example.org/a?x=1&amp;y=2</loc><lastmod>1970-01-01</lastmod>" in xml
+        assert "<loc>https://example.org/b</loc></url>" in xml
+
+    def test_shard_limits(self):
+        """Should respect both the URL count and the byte limit per shard."""
+        urls = [SitemapUrl(f"/doc-{i}", float(i)) for i in range(5)]
+
+        by_count = shard_urlsets("https://example.org", urls, max_urls=2)
+        by_bytes = shard_urlsets("https://example.org", urls, max_bytes=250)
+
+        assert [s.body.count(b"<url>") for s in by_count] == [2, 2, 1]
+        assert by_count[0].last_modified == 1.0
+        assert all(len(s.body) <= 250 for s in by_bytes) and len(by_bytes) > 1
+        assert shard_urlsets("https://example.org", []) == []
+
+    def test_encoded_body_is_deterministic(self):
+        """Should produce identical bytes and ETag for identical text."""
+        a = EncodedBody.from_text("<urlset/>", 0.0)
+        b = EncodedBody.from_text("<urlset/>", 0.0)
+
+        assert a == b
+        assert gzip.decompress(a.gzip_body) == a.body
+        assert a.last_modified_http == "Thu, 01 Jan 1970 00:00:00 GMT"
@@ -0,0 +1,175 @@
+"""
+Tests for "did you mean" suggestions on 404s and prefix completions.
+
+These tests verify that:
+- Mistyped and case/underscore variants of a URL find the real page
+- The requested path itself and unrelated pages are never suggested
+- Suggestions cover the site's public pages only
+- 404s carry suggestions as JSON, or as an HTML page for browsers
+- Completions match a label's start or any word start, best kinds first
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from sil_web.app import app
+from sil_web.domain.models import Completion
+from sil_web.routes.notfound import collect_known_pages
+from sil_web.services.suggest import KnownPage, PrefixIndex, TrigramIndex, trigrams
+
+
+@pytest.fixture
+def index():
+    """Small index over a few pages."""
+    return TrigramIndex([
+        KnownPage("/systems/reveal", "Reveal"),
+        KnownPage("/systems/morphogen", "Morphogen"),
+        KnownPage("/articles/reveal-diff", "The Diff That Shows What Changed"),
+        KnownPage("/founders-letter", "Founder's Letter"),
+        KnownPage("/essays", "Essays"),
+    ])
+
+
+class TestTrigramIndex:
+    """Tests for nearest-page lookup."""
+
+    def test_trigrams_are_padded_per_word(self):
+        """Should pad each word and ignore case and punctuation."""
+        assert trigrams("Ab_C") == {"  a", " ab", "ab ", "  c", " c "}
+        assert trigrams("--") == set()
+
+    def test_typo_finds_page(self, index):
+        """Should rank the misspelled page's real URL first."""
+        suggestions = index.suggest("/systems/revael")
+
+        assert suggestions[0].url == "/systems/reveal"
+        assert suggestions[0].title == "Reveal"
+
+    def test_case_and_extension_variants(self, index):
+        """Should see through upper case, underscores and .md/.html suffixes."""
+        assert index.suggest("/foundations/FOUNDERS_LETTER.md")[0].url == "/founders-letter"
+        assert index.suggest("/essay.html")[0].url == "/essays"
+
+    def test_same_section_preferred(self, index):
+        """Should score a page higher when the request is in its section."""
+
+        def score(path: str) -> float:
+            return next(s.score for s in index.suggest(path) if s.url == "/articles/reveal-diff")
+
+        assert score("/articles/reveal") > score("/essays/reveal")
+
+    def test_never_suggests_request_or_noise(self, index):
+        """Should skip the requested URL itself and return nothing for gibberish."""
+        assert "/systems/reveal" not in [s.url for s in index.suggest("/systems/reveal")]
+        assert index.suggest("/xyzzy") == []
+        assert index.suggest("/") == []
+
+    def test_limit(self, index):
+        """Should return at most limit suggestions, best first."""
+        suggestions = index.suggest("/systems/re", limit=1)
+
+        assert len(suggestions) <= 1
+
+
+class TestPrefixIndex:
+    """Tests for search-as-you-type completion."""
+
+    @pytest.fixture
+    def completions(self):
+        """Small completion index, one repeat included."""
+        return PrefixIndex([
+            Completion("Progressive Disclosure for Agents", "/essays/pd", "page"),
+            Completion("Agent", "/foundations/sil-glossary#agent", "term"),
+            Completion("Agent Ether", "/foundations/sil-glossary#agent-ether", "term"),
+            Completion("Agents at Work", "/articles/x#agents-at-work", "heading"),
+            Completion("Agent", "/foundations/sil-glossary#agent", "term"),  # repeat
+        ])
+
+    def test_prefix_ranking(self, completions):
+        """Should rank label starts first, then terms above pages above headings, then shorter."""
+        labels = [c.label for c in completions.complete("agent")]
+
+        assert labels == ["Agent", "Agent Ether", "Agents at Work", "Progressive Disclosure for Agents"]
+
+    def test_word_starts_match(self, completions):
+        """Should match a word inside a label, case and spacing insensitively."""
+        assert [c.url for c in completions.complete("  DISCLOSURE  f")] == ["/essays/pd"]
+        assert completions.complete("closure") == []
+
+    def test_limit_and_empty(self, completions):
+        """Should cap results and return nothing for a blank prefix."""
+        assert len(completions.complete("a", limit=2)) == 2
+        assert completions.complete(" ") == []
+        assert len(completions) == 4
+
+
+class TestKnownPages:
+    """Tests for the suggestable URL set."""
+
+    def test_covers_docs_and_static_pages(self):
+        """Should list published docs and doc-less static pages, each once."""
+        urls = [page.url for page in collect_known_pages()]
+
+        assert "/systems/reveal" in urls
+        assert "/projects" in urls
+        assert len(urls) == len(set(urls))
+
+    def test_covers_resolver_pages_outside_sitemap(self, tmp_path, monkeypatch):
+        """Should list public /projects and /meta docs, titled by their H1."""
+        for name, text in {
+            "projects/SOME_PROJECT.md": "# Some Project\n\nBody.\n",
+            "meta/FAQ.md": "# Questions\n\nBody.\n",
+            "meta/HIDDEN.md": "---\nprivate: true\n---\n# Hidden\n\nBody.\n",
+        }.items():
+            path = tmp_path / "docs" / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+        monkeypatch.chdir(tmp_path)
+
+        pages = {page.url: page.title for page in collect_known_pages()}
+
+        assert pages["/projects/some-project"] == "Some Project"
+        assert pages["/meta/faq"] == "Questions"
+        assert "/meta/hidden" not in pages
+
+
+class TestNotFoundResponses:
+    """Tests for the app's 404 handler."""
+
+    def test_json_suggestions(self):
+        """Should keep detail and add the nearest pages to JSON 404s."""
+        response = TestClient(app).get("/systems/revael")
+        data = response.json()
+
+        assert response.status_code == 404
+        assert data["detail"]
+        assert data["suggestions"][0]["url"] == "/systems/reveal"
+        assert set(data["suggestions"][0]) == {"url", "title", "score"}
+
+    def test_html_page_for_browsers(self):
+        """Should render the 404 inside the site shell with links to the suggestions."""
+        response = TestClient(app).get("/sytems", headers={"Accept": "text/html"})
+
+        assert response.status_code == 404
+        assert response.headers["content-type"].startswith("text/html")
+        assert "Did you mean" in response.text
+        assert 'href="/systems"' in response.text
+
+    def test_html_404s_share_one_shell(self, monkeypatch):
+        """Should not cache a page shell per distinct missing URL."""
+        monkeypatch.setattr(app.state.page_shell.env, "auto_reload", False)  # cache shells, as in production
+        client = TestClient(app)
+        client.get("/nope-0", headers={"Accept": "text/html"})
+        shells = len(app.state.page_shell._shells)
+
+        for i in range(1, 20):
+            assert client.get(f"/nope-{i}", headers={"Accept": "text/html"}).status_code == 404
+
+        assert len(app.state.page_shell._shells) == shells
+
+    def test_other_errors_unchanged(self):
+        """Should leave non-404 HTTP errors to the default handler."""
+        response = TestClient(app).post("/search.json")
+
+        assert response.status_code == 405
+        assert response.json() == {"detail": "Method Not Allowed"}
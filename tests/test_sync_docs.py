@@ -0,0 +1,85 @@
+"""
+Tests for scripts/sync-docs.py.
+
+These tests verify that:
+- Published files are copied into the website docs
+- Pruning removes website copies the manifest no longer lists
+- A listed file missing from the SIL source keeps its website copy
+"""
+
+import argparse
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "sync-docs.py"
+
+MANIFEST = """\
+files:
+  - path: docs/systems/
+    visibility: public
+  - path: docs/about.md
+    visibility: public
+"""
+
+
+@pytest.fixture(scope="module")
+def sync_docs():
+    """The sync-docs.py script, loaded as a module."""
+    spec = importlib.util.spec_from_file_location("sync_docs", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def repos(tmp_path):
+    """A SIL checkout with a manifest, and a website docs tree with prior copies."""
+    sil_docs = tmp_path / "SIL" / "docs"
+    (sil_docs / "systems").mkdir(parents=True)
+    (sil_docs / "CONTENT_MANIFEST.yaml").write_text(MANIFEST)
+    (sil_docs / "systems" / "alpha.md").write_text("# Alpha\n")
+
+    website_docs = tmp_path / "website" / "docs"
+    (website_docs / "systems").mkdir(parents=True)
+    (website_docs / "systems" / "renamed.md").write_text("# Old name\n")
+    (website_docs / "about.md").write_text("# About\n")
+    return sil_docs, website_docs
+
+
+def make_sync(sync_docs, sil_docs, website_docs):
+    args = argparse.Namespace(dry_run=False, validate=False, clean=False, changes=None, jobs=2)
+    sync = sync_docs.DocSync.__new__(sync_docs.DocSync)
+    sync.args = args
+    sync.stats = sync_docs.SyncStats()
+    sync.sil_repo = sil_docs.parent
+    sync.website_root = website_docs.parent
+    sync.website_docs = website_docs
+    sync.manifest_path = sil_docs / "CONTENT_MANIFEST.yaml"
+    sync.manifest = sync_docs.ContentManifest(sync.manifest_path)
+    return sync
+
+
+class TestPrune:
+    """Tests for the sync's orphan pruning."""
+
+    def test_prunes_unlisted_copies(self, sync_docs, repos):
+        """Should copy listed files and remove copies the manifest no longer covers."""
+        sil_docs, website_docs = repos
+
+        make_sync(sync_docs, sil_docs, website_docs).run()
+
+        assert (website_docs / "systems" / "alpha.md").read_text() == "# Alpha\n"
+        assert not (website_docs / "systems" / "renamed.md").exists()
+
+    def test_keeps_listed_file_missing_from_source(self, sync_docs, repos):
+        """Should keep the website copy of a listed file absent from the SIL source."""
+        sil_docs, website_docs = repos
+
+        sync = make_sync(sync_docs, sil_docs, website_docs)
+        sync.run()
+
+        assert sync.index.missing_files == ["about.md"]
+        assert (website_docs / "about.md").read_text() == "# About\n"
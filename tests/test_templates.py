@@ -0,0 +1,129 @@
+"""
+Tests for the production template environment and page shells.
+
+These tests verify that:
+- Shell assembly produces exactly what a full template render would
+- Titles are escaped, content is inserted as-is
+- Shells are cached per section unless auto_reload is on
+"""
+
+from pathlib import Path
+
+import pytest
+from markupsafe import Markup
+
+from sil_web.domain.models import Document
+from sil_web.services.content import ContentService
+from sil_web.services.templates import NavFragments, PageShell, create_template_environment
+
+NAV_ITEMS = [
+    {"label": "Home", "url": "/"},
+    {"label": "About", "url": "/about"},
+]
+
+
+@pytest.fixture
+def env(tmp_path):
+    """Production environment over the real templates directory."""
+    return create_template_environment(Path("templates"), bytecode_cache_dir=tmp_path / "bytecode")
+
+
+class TestPageShell:
+    """Tests for PageShell assembly."""
+
+    def test_matches_full_render(self, env):
+        """Should be byte-identical to rendering page.html directly."""
+        fragments = NavFragments(NAV_ITEMS)
+        shell = PageShell(env, fragments=fragments)
+        expected = env.get_template("page.html").render(
+            nav_html=Markup(fragments.nav_bar("/about")),
+            title="About - SIL",
+            content=Markup("<p>Hello</p>"),
+            current_page="/about",
+        )
+        assert shell.render("About - SIL", "<p>Hello</p>", "/about") == expected
+
+    def test_title_escaped_content_raw(self, env):
+        """Should escape the title but insert content unescaped."""
+        shell = PageShell(env, fragments=NavFragments(NAV_ITEMS))
+        html = shell.render("<Tools & Things>", "<p>Body</p>", "/")
+        assert "<title>&lt;Tools &amp; Things&gt;</title>" in html
+        assert "<p>Body</p>" in html
+
+    def test_active_nav_per_section(self, env):
+        """Should mark only the current section active."""
+        shell = PageShell(env, fragments=NavFragments(NAV_ITEMS))
+        html = shell.render("t", "", "/about")
+        assert 'href="/about" class="nav-link active"' in html
+        assert 'href="/" class="nav-link"' in html
+
+    def test_shells_cached_per_section(self, env):
+        """Should render each section's shell once."""
+        shell = PageShell(env, fragments=NavFragments(NAV_ITEMS))
+        shell.warm(["/", "/about"])
+        assert set(shell._shells) == {"/", "/about"}
+
+    def test_no_caching_with_auto_reload(self, tmp_path):
+        """Should rebuild shells on every render in development."""
+        env = create_template_environment(Path("templates"), auto_reload=True, bytecode_cache_dir=tmp_path)
+        shell = PageShell(env, fragments=NavFragments(NAV_ITEMS))
+        shell.render("t", "", "/")
+        assert shell._shells == {}
+
+
+class TestNavFragments:
+    """Tests for cached navigation fragments."""
+
+    @pytest.fixture
+    def content_service(self, tmp_path):
+        """ContentService over a foundations dir with one doc per tier."""
+        foundations = tmp_path / "foundations"
+        foundations.mkdir()
+        for name, tier, order in (("b.md", 1, 2), ("a.md", 1, 1), ("ref.md", 3, 1)):
+            (foundations / name).write_text(f"---\ntitle: {name}\ntier: {tier}\norder: {order}\n---\n\nBody\n")
+        return ContentService(tmp_path)
+
+    def test_nav_bar_cached_per_section(self):
+        """Should return the same fragment object for the same section."""
+        fragments = NavFragments(NAV_ITEMS)
+        assert fragments.nav_bar("/about") is fragments.nav_bar("/about")
+        assert "active" not in fragments.nav_bar("/missing")
+
+    def test_sidebar_grouped_by_tier(self, content_service):
+        """Should list tier 1 docs in order under Essential Reading."""
+        html = NavFragments(NAV_ITEMS, content_service).sidebar("foundations", current_slug="a")
+        assert html.index("a.md") < html.index("b.md") < html.index("Reference")
+        assert '<a href="/docs/a" class="active">' in html
+
+    def test_rebuilt_on_new_generation(self, content_service):
+        """Should rebuild fragments after the content service is invalidated."""
+        fragments = NavFragments(NAV_ITEMS, content_service)
+        first = fragments.sidebar("foundations")
+        assert fragments.sidebar("foundations") is first
+        content_service.invalidate()
+        assert fragments.sidebar("foundations") is not first
+
+    def test_group_documents_by_tier(self):
+        """Should always include tiers 1-3, each sorted by order."""
+        from sil_web.ui.components import group_documents_by_tier
+
+        docs = [
+            Document(title="B", slug="b", content="x", category="c", tier=3, order=2),
+            Document(title="A", slug="a", content="x", category="c", tier=3, order=1),
+        ]
+        tiers = group_documents_by_tier(docs)
+        assert tiers[1] == [] and tiers[2] == []
+        assert [d.slug for d in tiers[3]] == ["a", "b"]
+
+
+class TestTemplateEnvironment:
+    """Tests for the production environment settings."""
+
+    def test_auto_reload_off_by_default(self, env):
+        """Should not stat templates on every render in production."""
+        assert env.auto_reload is False
+
+    def test_bytecode_cache_written(self, env, tmp_path):
+        """Should persist compiled bytecode once the template is loaded."""
+        env.get_template("page.html")
+        assert list((tmp_path / "bytecode").iterdir())